@@ -6,7 +6,9 @@ from .file_io import FileIO
 from .business_exception import BusinessException
 from .label_formatter import LabelFormatter
 from .mandatory_param_error import MandatoryParamError
+from .memo_cache import MemoCache
 from .record_unavailable_error import RecordUnavailableRecord
 from .redis_client import RedisClient
 from .string_io import StringIO
+from .array_io import ArrayIO
 from .data_type_error import DataTypeError
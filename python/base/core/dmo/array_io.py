@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+class ArrayIO(object):
+    """ methods for Numeric Array I/O """
+
+    @staticmethod
+    def round(values,
+              ndigits: int):
+        """
+        Purpose:
+            Round every value of an array with the builtin 'round'
+        Rationale:
+            the builtin round is correctly rounded on the binary value (e.g., round(0.45, 1) == 0.5)
+            whereas np.round rounds the scaled value half to even (np.round(0.45, 1) == 0.4)
+            so a vectorized computation rounds exactly as its per-row equivalent
+        :param values:
+            a numpy array (of any shape)
+        :param ndigits:
+            the number of decimal places
+        :return:
+            a float array of the same shape
+        """
+        import numpy as np
+        return np.frompyfunc(round, 2, 1)(values, ndigits).astype(float)
@@ -0,0 +1,164 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import hashlib
+from collections import OrderedDict
+
+from .base_object import BaseObject
+
+DEFAULT_TTL = 7 * 24 * 60 * 60  # a week (in seconds)
+
+
+class MemoCache(BaseObject):
+    """ Bounded LRU Cache with Hit/Miss Statistics
+
+        optionally backed by Redis so that the cache can be shared across worker processes;
+        the local LRU is always consulted first
+
+        Redis entries expire (see 'ttl') and are keyed within a namespace;
+        a namespace that identifies the data the values were computed from
+        (e.g., the ontology build version) keeps stale entries from being served """
+
+    def __init__(self,
+                 name: str,
+                 max_size: int = 50000,
+                 redis_db: int = None,
+                 namespace: str = None,
+                 ttl: int = DEFAULT_TTL,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   memoize repeated text normalization and tagging
+        :param name:
+            the name of the cache; used as a key prefix in Redis
+        :param max_size:
+            the maximum number of entries held in the local LRU
+        :param redis_db:
+            an optional Redis DB (e.g., RedisClient.NLU_CACHE_DB)
+            None        local LRU only
+        :param namespace:
+            (Optional) a version that is part of every Redis key
+        :param ttl:
+            the expiry of each Redis entry (in seconds)
+        """
+        BaseObject.__init__(self, __name__)
+        if max_size < 1:
+            raise ValueError(f"Invalid Cache Size: {max_size}")
+
+        self._ttl = ttl
+        self._name = name
+        self._namespace = namespace
+        self._is_debug = is_debug
+        self._max_size = max_size
+        self._cache = OrderedDict()
+
+        self._redis = None
+        if redis_db is not None:
+            from .redis_client import RedisClient
+            self._redis = RedisClient(redis_db)
+
+        self._hits = 0
+        self._misses = 0
+        self._redis_hits = 0
+        self._evictions = 0
+
+    def _redis_key(self,
+                   key: tuple) -> str:
+        md5 = hashlib.md5(repr(key).encode()).hexdigest()
+        if self._namespace:
+            return f"{self._name}_{self._namespace}_{md5}"
+        return f"{self._name}_{md5}"
+
+    def _redis_get(self,
+                   key: tuple):
+        import jsonpickle
+        try:
+            value = self._redis.get(self._redis_key(key))
+            if value is not None:
+                return jsonpickle.decode(value)
+        except Exception as e:
+            self.logger.warning(f"Redis Unavailable (name={self._name}): {e}")
+            self._redis = None
+        return None
+
+    def _redis_set(self,
+                   key: tuple,
+                   value) -> None:
+        import jsonpickle
+        try:
+            self._redis.set(self._redis_key(key), jsonpickle.encode(value), ttl=self._ttl)
+        except Exception as e:
+            self.logger.warning(f"Redis Unavailable (name={self._name}): {e}")
+            self._redis = None
+
+    def _put_local(self,
+                   key: tuple,
+                   value) -> None:
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    def get(self,
+            key: tuple):
+        """
+        :param key:
+            a hashable key (e.g., (ontology-name, input-text))
+        :return:
+            the cached value or None
+        """
+        if key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        if self._redis:
+            value = self._redis_get(key)
+            if value is not None:
+                self._redis_hits += 1
+                self._put_local(key, value)
+                return value
+
+        self._misses += 1
+        return None
+
+    def put(self,
+            key: tuple,
+            value) -> None:
+        self._put_local(key, value)
+        if self._redis:
+            self._redis_set(key, value)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """
+        :return:
+            Sample Output:
+                {   'name': 'normalize-incoming-text',
+                    'size': 4213,
+                    'max_size': 50000,
+                    'hits': 18235,
+                    'redis_hits': 0,
+                    'misses': 4213,
+                    'evictions': 0,
+                    'hit_ratio': 0.81 }
+        """
+        total = self._hits + self._redis_hits + self._misses
+        hit_ratio = 0.0
+        if total:
+            hit_ratio = round((self._hits + self._redis_hits) / total, 2)
+
+        return {
+            "name": self._name,
+            "size": len(self._cache),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "redis_hits": self._redis_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_ratio": hit_ratio}
@@ -15,6 +15,8 @@ class RedisClient(object):
 
     WIKI_SEARCH_DB = 5
 
+    NLU_CACHE_DB = 6
+
     def __init__(self,
                  db: int = 0,
                  decode_responses: bool = True):
@@ -61,8 +63,13 @@ class RedisClient(object):
 
     def set(self,
             a_key: str,
-            value: str) -> None:
-        self.redis.set(a_key, value)
+            value: str,
+            ttl: int = None) -> None:
+        """
+        :param ttl:
+            (Optional) expire the key after this many seconds
+        """
+        self.redis.set(a_key, value, ex=ttl)
 
     def get(self,
             key) -> str:
@@ -1 +1,2 @@
 from .badge_analysis_api import call_badge_analysis_api
+from .badge_analysis_api import partition_badge_analysis_sources
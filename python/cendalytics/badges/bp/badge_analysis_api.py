@@ -14,11 +14,15 @@ class BadgeAnalysisAPI(BaseObject):
                  manifest_name: str,
                  activity_name: str,
                  first: int=-1,
-                 last: int=-1):
+                 last: int=-1,
+                 id_range: tuple=None):
         """
         Created:
             10-Jan-2020
             xavier.verges@es.ibm.com
+        Updated:
+            18-Oct-2026
+            *   added 'id-range' and get_partitions()
         """
         from cendalytics.badges.svc import BadgeAnalysisManifestData
         BaseObject.__init__(self, __name__)
@@ -26,7 +30,8 @@ class BadgeAnalysisAPI(BaseObject):
                                                   activity_name,
                                                   first,
                                                   last,
-                                                  is_debug=IS_DEBUG)
+                                                  is_debug=IS_DEBUG,
+                                                  id_range=id_range)
 
     def analyze_per_badge(self):
         self.analyzer.process()
@@ -40,21 +45,48 @@ class BadgeAnalysisAPI(BaseObject):
     def get_sources(self):
         return self.analyzer.source_collections()
 
+    def get_partitions(self, chunk_size):
+        return self.analyzer.source_partitions(chunk_size)
 
-def call_badge_analysis_api(manifest_name, activity_name, action, first, last):
-    first = int(first) if first else -1
-    last = int(last) if last else -1
+
+def call_badge_analysis_api(manifest_name, activity_name, action, first, last, by_id_range=False):
+    """
+    :param first:
+        the first record offset (or the inclusive lower '_id' bound if by_id_range)
+    :param last:
+        the last record offset (or the exclusive upper '_id' bound if by_id_range)
+    """
+    id_range = None
+    if by_id_range:
+        id_range = (first, last)
+        first = last = -1
+    else:
+        first = int(first) if first else -1
+        last = int(last) if last else -1
     print(f"API Parameters "
           f"(manifest-name={manifest_name}, "
           f"activity-name={activity_name}, "
           f"action={action}, "
-          f"first={first}, last={last})")
+          f"first={first}, last={last}, "
+          f"id-range={id_range})")
 
     if manifest_name.startswith("badge-analysis"):
         api = BadgeAnalysisAPI(manifest_name,
                                activity_name,
                                first,
-                               last)
+                               last,
+                               id_range)
         return getattr(api, action)()
     else:
         raise ValueError(f"Unrecognized Manifest: {manifest_name}")
+
+
+def partition_badge_analysis_sources(manifest_name, activity_name, chunk_size):
+    """
+    :return:
+        a list of (collection-name, [(lower, upper), ...]) '_id' ranges
+    """
+    if not manifest_name.startswith("badge-analysis"):
+        raise ValueError(f"Unrecognized Manifest: {manifest_name}")
+    api = BadgeAnalysisAPI(manifest_name, activity_name)
+    return api.get_partitions(int(chunk_size))
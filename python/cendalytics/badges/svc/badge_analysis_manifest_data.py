@@ -59,6 +59,9 @@ class BadgeAnalysisManifestData(BaseObject):
             *   Using a query to count the number of owners of each badge could
                 be asking too much from mongodb when running lots of processes
                 in parallel. We now walk the supply collection one instead.
+        Updated:
+            18-Oct-2026
+            *   badges can be analyzed by '_id' range (see CendantCollection.partition)
     """
 
     def __init__(self,
@@ -66,7 +69,8 @@ class BadgeAnalysisManifestData(BaseObject):
                  activity: str,
                  first: int = -1,
                  last: int = -1,
-                 is_debug: bool = False):
+                 is_debug: bool = False,
+                 id_range: tuple = None):
 
         BaseObject.__init__(self, __name__)
         from dataingest.core.dmo import ManifestActivityFinder
@@ -82,6 +86,7 @@ class BadgeAnalysisManifestData(BaseObject):
                                                 activity).process()
         self._first = first
         self._last = last
+        self._id_range = id_range
 
     def _source(self) -> CendantCollection:
         if self._is_debug:
@@ -112,7 +117,9 @@ class BadgeAnalysisManifestData(BaseObject):
 
     def _input_records(self) -> list:
         collection = self._source()
-        if self._first < 0:
+        if self._id_range:
+            records = collection.by_id_range(*self._id_range)
+        elif self._first < 0:
             records = collection.all()
         else:
             limit = self._last - self._first + 1
@@ -171,6 +178,15 @@ class BadgeAnalysisManifestData(BaseObject):
         collection = self._source()
         return [(collection.collection_name, collection.count())]
 
+    def source_partitions(self,
+                          chunk_size: int) -> list:
+        """
+        :return:
+            a list of (collection-name, [(lower, upper), ...]) '_id' ranges
+        """
+        collection = self._source()
+        return [(collection.collection_name, collection.partition(chunk_size=chunk_size))]
+
     def flush_target(self) -> None:
         collection = self._target()
         collection.delete(keep_indexes=False)
@@ -184,7 +200,8 @@ class BadgeAnalysisManifestData(BaseObject):
     def _get_number_of_owners(self) -> Counter:
         counter: typing.Counter[str] = Counter()
         collection = self._owners()
-        for chunk in collection.by_chunks(chunk_size=2000):
+        for chunk in collection.by_chunks(chunk_size=2000,
+                                          projection={'fields': 1}):
             # print('.', end='', flush=True)
             for record in chunk:
                 for field in record['fields']:
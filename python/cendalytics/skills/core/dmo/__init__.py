@@ -1,2 +1,3 @@
 from .certification_aggregate_report import CertificationAggregateReport
 from .certification_individual_report import CertificationIndividualReport
+from .tag_inverted_index import TagInvertedIndex
@@ -0,0 +1,133 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import time
+from typing import Iterable
+
+import numpy as np
+
+from base import BaseObject
+
+
+class TagInvertedIndex(BaseObject):
+    """
+    Purpose:
+    A compact Inverted Index from supervised Tags to the Records (of a tag collection) that contain them
+
+    Implementation:
+        -   each record is stored once as an ordinal (its '_id' and division)
+        -   each tag (lower-cased) maps to a sorted array of record ordinals
+        -   the memory footprint is proportional to the number of distinct (record, tag) pairs
+            rather than the size of the records themselves
+
+    Prereq:
+    tag collections are dated snapshots (e.g., 'supply_tag_20191025') so the index does not go stale
+    """
+
+    PROJECTION = {"key_field": 1,
+                  "div_field": 1,
+                  "fields.tags.supervised": 1}
+
+    def __init__(self,
+                 records: Iterable,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   replace the full-collection scan in 'perform-tag-search'
+        :param records:
+            any iterable of tag records
+            only the fields in PROJECTION are required
+        :param is_debug:
+            if True     increase log output at DEBUG level
+        """
+        BaseObject.__init__(self, __name__)
+        self._is_debug = is_debug
+
+        self._ids = []
+        self._divisions = []
+        self._d_postings = {}
+
+        self._build(records)
+
+    def _build(self,
+               records: Iterable) -> None:
+        start = time.time()
+
+        d_divisions = {}
+        divisions = []
+        d_postings = {}
+
+        for record in records:
+            ordinal = len(self._ids)
+            self._ids.append(record["_id"])
+
+            division = record.get("div_field")
+            if division not in d_divisions:
+                d_divisions[division] = len(self._divisions)
+                self._divisions.append(division)
+            divisions.append(d_divisions[division])
+
+            for field in record["fields"]:
+                if "tags" not in field or "supervised" not in field["tags"]:
+                    continue
+                if not field["tags"]["supervised"]:
+                    continue
+
+                for tag in field["tags"]["supervised"]:
+                    key = tag[0].lower().strip()
+                    if key not in d_postings:
+                        d_postings[key] = []
+                    postings = d_postings[key]
+                    if not postings or postings[-1] != ordinal:
+                        postings.append(ordinal)
+
+        self._division_codes = np.array(divisions, dtype=np.int32)
+        self._d_postings = {tag: np.array(postings, dtype=np.int32)
+                            for tag, postings in d_postings.items()}
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Built Tag Inverted Index",
+                f"\tTotal Records: {len(self._ids)}",
+                f"\tTotal Tags: {len(self._d_postings)}",
+                f"\tTotal Postings: {sum([len(x) for x in self._d_postings.values()])}",
+                f"\tTotal Time: {round(time.time() - start, 2)}s"]))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def search(self,
+               tags: list,
+               divisions: str or list or None = None) -> list:
+        """
+        Purpose:
+            Find the records that contain at least one of the given tags
+        :param tags:
+            the tags to search for (case-insensitive)
+        :param divisions:
+            a division (str) or a list of divisions to restrict the search to
+            if None (or empty)  search all divisions
+            divisions are matched lower-cased (as the 'div_field' query in 'perform-tag-search')
+            and records without a division never match
+        :return:
+            a list of record '_id' values (in index order)
+        """
+        postings = [self._d_postings[tag.lower()] for tag in tags
+                    if tag.lower() in self._d_postings]
+        if not postings:
+            return []
+
+        ordinals = np.unique(np.concatenate(postings))
+
+        if isinstance(divisions, str):
+            divisions = [divisions]
+        divisions = set([str(x).lower() for x in divisions or [] if x is not None])
+
+        if divisions:
+            codes = [i for i, division in enumerate(self._divisions)
+                     if division is not None and str(division) in divisions]
+            ordinals = ordinals[np.isin(self._division_codes[ordinals], codes)]
+
+        return [self._ids[i] for i in ordinals]
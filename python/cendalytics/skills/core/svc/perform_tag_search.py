@@ -2,6 +2,8 @@
 # -*- coding: UTF-8 -*-
 
 
+from collections import OrderedDict
+
 import pandas as pd
 from pandas import DataFrame
 
@@ -32,9 +34,15 @@ class PerformTagSearch(BaseObject):
 
     Prereq:
     an index on `fields.tags.supervised` should exist for performance reasons
+
+    Implementation:
+    a compact tag inverted index is built once per collection (per process)
+    and only the records that contain a search tag are retrieved
     """
 
-    __cache = {}
+    MAX_CACHED_INDEXES = 4
+
+    __indexes = OrderedDict()
 
     def __init__(self,
                  tags: list,
@@ -72,6 +80,9 @@ class PerformTagSearch(BaseObject):
             craig.trim@ibm.com
             *   Pass in Server Alias as a parameter
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1855
+        Updated:
+            18-Oct-2026
+            *   search a tag inverted index instead of caching entire divisions
         :param tags:
             the tags to search for
         :param collection_name:
@@ -95,6 +106,8 @@ class PerformTagSearch(BaseObject):
 
         self._tags = tags
         self._is_debug = is_debug
+        self._server_alias = server_alias
+        self._collection_name = collection_name
         self._div_field = div_field
         self._key_field = key_field
 
@@ -177,28 +190,43 @@ class PerformTagSearch(BaseObject):
             return value[7:].strip()
         return value
 
+    def _index(self):
+        """
+        Purpose:
+            Retrieve (or build) the tag inverted index for the collection
+            at most MAX_CACHED_INDEXES indexes are held (least recently used are evicted)
+        """
+        from cendalytics.skills.core.dmo import TagInvertedIndex
+
+        key = f"{self._server_alias.lower()}:{self._collection_name}"
+        if key in self.__indexes:
+            self.__indexes.move_to_end(key)
+            return self.__indexes[key]
+
+        records = self._collection.stream(projection=TagInvertedIndex.PROJECTION)
+        self.__indexes[key] = TagInvertedIndex(records=records,
+                                               is_debug=self._is_debug)
+        while len(self.__indexes) > self.MAX_CACHED_INDEXES:
+            self.__indexes.popitem(last=False)
+
+        return self.__indexes[key]
+
     def _records(self) -> list:
-        key = ''.join(self._div_field)
-        if key in self.__cache:
-            if self._is_debug:
-                self.logger.debug(f"Cached Record Retrieval ("
-                                  f"key={key}, "
-                                  f"keys={sorted(self.__cache.keys())})")
-            return self.__cache[key]
-
-        def query() -> list:
-            if self._key_field:
-                return [self._collection.by_key_field(self._key_field)]
-            if self._div_field:
-                return self._collection.by_field("div_field", self._div_field)
-            return self._collection.all()
-
-        results = query()
-        if type(results) == dict:  # GIT-1349-15988093
-            results = [results]
-
-        self.__cache[key] = results
-        return self.__cache[key]
+        if self._key_field:
+            results = self._collection.by_key_field(self._key_field)
+            if type(results) == dict:  # GIT-1349-15988093
+                results = [results]
+            return results
+
+        ids = self._index().search(tags=self._tags,
+                                   divisions=self._div_field)
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                f"Searched Tag Index (total={len(ids)})",
+                f"\tTags: {self._tags}",
+                f"\tDivision: {self._div_field}"]))
+
+        return self._collection.by_ids(ids)
 
     def process(self) -> DataFrame or None:
 
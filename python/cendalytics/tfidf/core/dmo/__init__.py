@@ -1,6 +1,7 @@
 from .collection_record_retrieval import CollectionRecordRetrieval
 from .doc_index_by_term import DocIndexByTerm
 from .inversion_library_loader import InversionLibraryLoader
+from .sparse_vectorspace import SparseVectorSpace
 from .term_count_by_document import TermCountByDocument
 from .term_count_in_corpus import TermCountInCorpus
 from .term_index_by_document import TermIndexByDocument
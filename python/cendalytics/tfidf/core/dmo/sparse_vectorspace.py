@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import logging
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from scipy.sparse import csr_matrix
+
+from base import ArrayIO
+from base import BaseObject
+
+
+class SparseVectorSpace(BaseObject):
+    """
+    Purpose:
+        A Vector Space backed by a sparse (documents x terms) count matrix
+
+    Implementation:
+        -   the matrix is built directly from 'tag' records (no intermediate dictionaries)
+        -   TF, IDF and TF-IDF are computed on the matrix in vectorized form
+            and are equivalent to 'tfidf-computer'
+        -   the vector space is persisted as a compressed numpy archive (*.npz)
+            with the count matrix (CSR), the term vocabulary and the document index
+    """
+
+    def __init__(self,
+                 documents: list,
+                 terms: list,
+                 counts: csr_matrix,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   replace the per document/term loop in 'tfidf-computer'
+        :param documents:
+            the document index (the key field of each row)
+        :param terms:
+            the term vocabulary (the term of each column)
+        :param counts:
+            a (documents x terms) matrix of term frequencies
+        """
+        BaseObject.__init__(self, __name__)
+        if counts.shape != (len(documents), len(terms)):
+            raise ValueError(f"Invalid Count Matrix: {counts.shape}")
+
+        self._is_debug = is_debug
+        self._terms = list(terms)
+        self._documents = list(documents)
+        self._counts = csr_matrix(counts)
+
+    @staticmethod
+    def from_records(source_records,
+                     tag_confidence_threshold: int = 65,
+                     is_debug: bool = False) -> 'SparseVectorSpace':
+        """
+        Purpose:
+            Build the count matrix from 'tag' records
+            the same terms are counted as in 'term-index-by-document'
+        :param source_records:
+            any iterable of 'tag' records
+        :param tag_confidence_threshold:
+            only supervised tags above this confidence are counted
+        """
+        d_documents = {}
+        d_terms = {}
+        rows = []
+        cols = []
+
+        seen = set()
+        logger = logging.getLogger(__name__)
+        for record in source_records:
+            key_field = record['key_field']
+            if key_field in seen:
+                logger.warning(f"Duplicate Record (key-field={key_field})")
+            seen.add(key_field)
+
+            for field in record["fields"]:
+                if "tags" not in field:
+                    continue
+                if "supervised" not in field["tags"] or field["tags"]["supervised"] is None:
+                    continue
+
+                for tag in field["tags"]["supervised"]:
+                    if tag[1] <= tag_confidence_threshold:
+                        continue
+
+                    # documents without terms are never added to the index
+                    if key_field not in d_documents:
+                        d_documents[key_field] = len(d_documents)
+                    if tag[0] not in d_terms:
+                        d_terms[tag[0]] = len(d_terms)
+
+                    rows.append(d_documents[key_field])
+                    cols.append(d_terms[tag[0]])
+
+        # duplicate (document, term) entries are summed on conversion
+        counts = csr_matrix((np.ones(len(rows), dtype=np.int64),
+                             (np.array(rows, dtype=np.int64),
+                              np.array(cols, dtype=np.int64))),
+                            shape=(len(d_documents), len(d_terms)))
+
+        if is_debug:
+            logger.debug('\n'.join([
+                "Built Sparse Vector Space",
+                f"\tTotal Documents: {counts.shape[0]}",
+                f"\tTotal Terms: {counts.shape[1]}",
+                f"\tTotal Entries: {counts.nnz}"]))
+
+        return SparseVectorSpace(documents=list(d_documents),
+                                 terms=list(d_terms),
+                                 counts=counts,
+                                 is_debug=is_debug)
+
+    @staticmethod
+    def load(file_path: str,
+             is_debug: bool = False) -> 'SparseVectorSpace':
+        with np.load(file_path, allow_pickle=False) as archive:
+            counts = csr_matrix((archive["data"],
+                                 archive["indices"],
+                                 archive["indptr"]),
+                                shape=tuple(archive["shape"]))
+            return SparseVectorSpace(documents=archive["documents"].tolist(),
+                                     terms=archive["terms"].tolist(),
+                                     counts=counts,
+                                     is_debug=is_debug)
+
+    def save(self,
+             file_path: str) -> str:
+        """
+        :param file_path:
+            the path of the archive (the '.npz' extension is added if missing)
+        :return:
+            the file path
+        """
+        if not file_path.endswith(".npz"):
+            file_path = f"{file_path}.npz"
+
+        np.savez_compressed(file_path,
+                            data=self._counts.data,
+                            indices=self._counts.indices,
+                            indptr=self._counts.indptr,
+                            shape=np.array(self._counts.shape),
+                            documents=np.array(self._documents, dtype=str),
+                            terms=np.array(self._terms, dtype=str))
+        return file_path
+
+    def documents(self) -> list:
+        return self._documents
+
+    def terms(self) -> list:
+        return self._terms
+
+    def counts(self) -> csr_matrix:
+        return self._counts
+
+    def terms_in_doc(self) -> np.ndarray:
+        """
+        :return:
+            the total number of terms in each document
+        """
+        return np.asarray(self._counts.sum(axis=1)).ravel()
+
+    def term_frequency_in_corpus(self) -> np.ndarray:
+        """
+        :return:
+            the total number of occurrences of each term
+        """
+        return np.asarray(self._counts.sum(axis=0)).ravel()
+
+    def docs_with_term(self) -> np.ndarray:
+        """
+        :return:
+            the number of documents containing each term
+        """
+        return np.bincount(self._counts.indices, minlength=len(self._terms))
+
+    def tf(self) -> csr_matrix:
+        """
+        Definition:
+            TF(t) = (Number of times term t appears in a document) / (Total number of terms in the document)
+        """
+        rows = np.repeat(np.arange(len(self._documents)), np.diff(self._counts.indptr))
+        return csr_matrix((self._counts.data / self.terms_in_doc()[rows],
+                           self._counts.indices,
+                           self._counts.indptr),
+                          shape=self._counts.shape)
+
+    def idf(self) -> np.ndarray:
+        """
+        Definition:
+            IDF(t) = log_e(Total number of documents / Number of documents with term t in it)
+        """
+        return np.log(len(self._documents) / self.docs_with_term())
+
+    def tfidf(self) -> csr_matrix:
+        """
+        Purpose:
+            Compute TF-IDF as TF / IDF (the definition used by 'tfidf-computer')
+            terms that occur in every document (an IDF of 0) are dropped
+        """
+        idf = self.idf()
+        tf = self.tf()
+
+        tfidf = tf.copy()
+        with np.errstate(divide='ignore'):
+            tfidf.data = tf.data / idf[tf.indices]
+        tfidf.data[idf[tf.indices] == 0] = 0
+        tfidf.eliminate_zeros()
+
+        if self._is_debug:
+            total = int((idf == 0).sum())
+            if total:
+                self.logger.warning(f"IDF is 0 "
+                                    f"(total-documents={len(self._documents)}, "
+                                    f"total-terms={total})")
+
+        return tfidf
+
+    def to_dataframe(self,
+                     rounding_threshold: int = 5) -> DataFrame:
+        """
+        :return:
+            a DataFrame with the same columns as 'tfidf-computer'
+        """
+        tfidf = self.tfidf()
+        tf = self.tf()
+        idf = self.idf()
+
+        keep = idf[tf.indices] != 0
+        rows = np.repeat(np.arange(len(self._documents)), np.diff(tf.indptr))[keep]
+        cols = tf.indices[keep]
+
+        documents = np.array(self._documents, dtype=object)
+        terms = np.array(self._terms, dtype=object)
+
+        return pd.DataFrame({
+            "Doc": documents[rows],
+            "Term": terms[cols],
+            "TF": ArrayIO.round(tf.data[keep], rounding_threshold),
+            "IDF": ArrayIO.round(idf[cols], rounding_threshold),
+            "TFIDF": ArrayIO.round(tfidf.data, rounding_threshold),
+            "TotalDocs": len(self._documents),
+            "TermsInDoc": self.terms_in_doc()[rows],
+            "TermFrequencyInDoc": self._counts.data[keep],
+            "TermFrequencyInCorpus": self.term_frequency_in_corpus()[cols],
+            "DocsWithTerm": self.docs_with_term()[cols]})
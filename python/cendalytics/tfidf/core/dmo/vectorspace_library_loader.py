@@ -43,6 +43,10 @@ class VectorSpaceLibraryLoader(BaseObject):
             *   renamed from 'skills-vectorspace-loader' and
                 refactored out of nlusvc project
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1261
+        Updated:
+            18-Oct-2026
+            *   load sparse vector space archives (*.npz)
+                tab-separated libraries (*.csv) are still supported
         :param library_name:
         :param is_debug:
         """
@@ -55,14 +59,19 @@ class VectorSpaceLibraryLoader(BaseObject):
         return os.path.join(os.environ["GTS_BASE"],
                             fname)
 
-    def _process(self) -> None:
-        start = time.time()
-
-        _input_path = FileIO.absolute_path(self._library_path())
+    def _read_archive(self,
+                      input_path: str) -> DataFrame:
+        from cendalytics.tfidf.core.dmo import SparseVectorSpace
 
+        df = SparseVectorSpace.load(input_path,
+                                    is_debug=self.is_debug).to_dataframe()
+        df.insert(0, "Number", range(len(df)))
+        return df
 
+    def _read_csv(self,
+                  input_path: str) -> DataFrame:
         df = pd.read_csv(
-            _input_path,
+            input_path,
             delim_whitespace=False,
             sep='\t',
             error_bad_lines=False,
@@ -76,11 +85,22 @@ class VectorSpaceLibraryLoader(BaseObject):
             usecols=self.__columns.keys())
 
         df.fillna(value='', inplace=True)
+        return df
+
+    def _process(self) -> None:
+        start = time.time()
+
+        _input_path = FileIO.absolute_path(self._library_path())
+
+        if _input_path.endswith(".npz"):
+            df = self._read_archive(_input_path)
+        else:
+            df = self._read_csv(_input_path)
 
         end = time.time()
         if self.is_debug:
             self.logger.debug("\n".join([
-                "Read CSV File",
+                "Read Vector Space Library",
                 "\tPath: {}".format(_input_path),
                 "\tTotal Time: {}".format(end - start)]))
 
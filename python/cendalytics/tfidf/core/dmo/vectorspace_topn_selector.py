@@ -2,6 +2,7 @@
 # -*- coding: UTF-8 -*-
 
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from tabulate import tabulate
@@ -34,6 +35,10 @@ class VectorSpaceTopNSelector(BaseObject):
             7-Nov-2019
             craig.trim@ibm.com
             *   refactored out of 'read-collection-vectorspace'
+        Updated:
+            18-Oct-2026
+            *   index the rows of each key field (by row range) instead of filtering the full DataFrame
+                and add a grouped top-n across all key fields
         :param df:
         :param is_debug:
         """
@@ -41,6 +46,27 @@ class VectorSpaceTopNSelector(BaseObject):
 
         self._df = df
         self._is_debug = is_debug
+        self._df_sorted = None
+        self._d_index = None
+
+    def _index(self) -> dict:
+        """
+        Purpose:
+            Group the rows of the DataFrame by key field (in order of occurrence)
+            and index each key field to its row range in the grouped DataFrame
+        :return:
+            a dictionary keyed by key field with a (start, end) tuple
+        """
+        if self._d_index is None:
+            codes, key_fields = pd.factorize(self._df['Doc'])
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(key_fields) + 1))
+
+            self._df_sorted = self._df.iloc[order]
+            self._d_index = {key_field: (bounds[i], bounds[i + 1])
+                             for i, key_field in enumerate(key_fields)}
+
+        return self._d_index
 
     def _filter_df(self,
                    serial_number: str) -> DataFrame:
@@ -54,7 +80,12 @@ class VectorSpaceTopNSelector(BaseObject):
         """
 
         # Step: Filter DataFrame by CNUM (e.g., 'Doc')
-        df2 = self._df[self._df['Doc'] == serial_number]
+        d_index = self._index()
+        if serial_number in d_index:
+            start, end = d_index[serial_number]
+            df2 = self._df_sorted.iloc[start:end]
+        else:
+            df2 = self._df.iloc[0:0]
 
         if df2.empty:  # No Results Found
             self.logger.warning("\n".join([
@@ -74,7 +105,7 @@ class VectorSpaceTopNSelector(BaseObject):
     def _top_n_skills(df2: DataFrame,
                       top_n: int = 3):
 
-        df2 = df2.sort_values(by=['TFIDF'], ascending=False)
+        df2 = df2.sort_values(by=['TFIDF'], ascending=False, kind='stable')
         tags = df2['Term'].unique()
 
         if top_n < len(tags):
@@ -126,6 +157,43 @@ class VectorSpaceTopNSelector(BaseObject):
 
         return pd.DataFrame(results)
 
+    def top_n_by_key_field(self,
+                           top_n: int = 3) -> DataFrame:
+        """
+        Purpose:
+            Select the most discriminating terms (top-n) for every key field in a single pass
+            the DataFrame is sorted once by key field and TFIDF and the head of each group is taken
+        :param top_n:
+            the number of terms per key field
+        :return:
+            a pandas DataFrame of results
+            key fields are in order of occurrence and terms in order of rank
+            Sample Output:
+                +----+------------+--------+------------+
+                |    | KeyField   |   Rank | Term       |
+                |----+------------+--------+------------|
+                |  0 | 0697A5744  |      1 | windows nt |
+                |  1 | 0697A5744  |      2 | rfs        |
+                |  2 | 0697A5744  |      3 | microsoft  |
+                |  3 | 05817Q744  |      1 | kubernetes |
+                ...
+                +----+------------+--------+------------+
+        """
+        df = self._df[['Doc', 'Term', 'TFIDF']].copy()
+        df['Order'] = pd.factorize(df['Doc'])[0]
+        df = df.sort_values(by=['Order', 'TFIDF'],
+                            ascending=[True, False],
+                            kind='stable')
+        df = df.drop_duplicates(subset=['Order', 'Term'])
+
+        df = df.groupby('Order', sort=False).head(top_n)
+        df['Rank'] = df.groupby('Order', sort=False).cumcount() + 1
+
+        return pd.DataFrame({
+            "KeyField": df['Doc'].values,
+            "Rank": df['Rank'].values,
+            "Term": df['Term'].values})
+
     def process(self,
                 key_field: str,
                 expand: bool = False,
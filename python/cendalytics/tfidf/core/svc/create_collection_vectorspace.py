@@ -3,13 +3,9 @@
 
 
 import os
-import pprint
 import time
 
-from pandas import DataFrame
-
 from base import BaseObject
-from base import FileIO
 from datamongo import BaseMongoClient
 
 
@@ -47,6 +43,10 @@ class CreateCollectionVectorSpace(BaseObject):
             6-Nov-2019
             craig.trim@ibm.com
             *   https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1261#issuecomment-15797417
+        Updated:
+            18-Oct-2026
+            *   build a sparse vector space and persist it as a compressed archive (*.npz)
+                the intermediate dictionaries are no longer written to disk
         """
         BaseObject.__init__(self, __name__)
         self._limit = limit
@@ -55,13 +55,9 @@ class CreateCollectionVectorSpace(BaseObject):
         self._mongo_client = mongo_client
         self._collection_name = collection_name
 
-    def _tfidf(self) -> DataFrame:
+    def _vectorspace(self):
         from cendalytics.tfidf.core.dmo import CollectionRecordRetrieval
-        from cendalytics.tfidf.core.dmo import TfIdfComputer
-        from cendalytics.tfidf.core.dmo import TermCountInCorpus
-        from cendalytics.tfidf.core.dmo import TermCountByDocument
-        from cendalytics.tfidf.core.dmo import DocIndexByTerm
-        from cendalytics.tfidf.core.dmo import TermIndexByDocument
+        from cendalytics.tfidf.core.dmo import SparseVectorSpace
 
         source_records = CollectionRecordRetrieval(limit=self._limit,
                                                    division=self._division,
@@ -71,31 +67,8 @@ class CreateCollectionVectorSpace(BaseObject):
         if not source_records or not len(source_records):
             raise ValueError("No Records Found")
 
-        d_terms_by_document = TermIndexByDocument(is_debug=self._is_debug,
-                                                  source_records=source_records).process()
-        FileIO.text_to_file(os.path.join(os.environ['GTS_BASE'],
-                                         f"resources/confidential_input/vectorspace/d_terms_by_document.csv"),
-                            pprint.pformat(d_terms_by_document))
-
-        d_documents_by_term = DocIndexByTerm(d_terms_by_document).process()
-        FileIO.text_to_file(os.path.join(os.environ['GTS_BASE'],
-                                         f"resources/confidential_input/vectorspace/d_documents_by_term.csv"),
-                            pprint.pformat(d_documents_by_term))
-
-        term_count_in_corpus = TermCountInCorpus(d_terms_by_document).process()
-        FileIO.text_to_file(os.path.join(os.environ['GTS_BASE'],
-                                         f"resources/confidential_input/vectorspace/term_count_in_corpus.csv"),
-                            pprint.pformat(term_count_in_corpus))
-
-        term_count_by_document = TermCountByDocument(d_terms_by_document).process()
-        FileIO.text_to_file(os.path.join(os.environ['GTS_BASE'],
-                                         f"resources/confidential_input/vectorspace/term_count_by_document.csv"),
-                            pprint.pformat(term_count_by_document))
-
-        return TfIdfComputer(d_terms_by_document=d_terms_by_document,
-                             d_documents_by_term=d_documents_by_term,
-                             term_count_by_document=term_count_by_document,
-                             term_count_in_corpus=term_count_in_corpus).process()
+        return SparseVectorSpace.from_records(is_debug=self._is_debug,
+                                              source_records=source_records)
 
     def _file_path(self):
         def _fname():
@@ -104,7 +77,7 @@ class CreateCollectionVectorSpace(BaseObject):
             return f"{self._collection_name}_TFIDF".upper()
 
         return os.path.join(os.environ['GTS_BASE'],
-                            f"resources/confidential_input/vectorspace/{_fname()}.csv")
+                            f"resources/confidential_input/vectorspace/{_fname()}.npz")
 
     def process(self) -> str:
         """
@@ -115,9 +88,9 @@ class CreateCollectionVectorSpace(BaseObject):
         fpath = self._file_path()
 
         def inner_process() -> int:
-            df = self._tfidf().sort_values(by=['Doc'], ascending=False)
-            df.to_csv(fpath, encoding='utf-8', sep='\t')
-            return len(df)
+            vectorspace = self._vectorspace()
+            vectorspace.save(fpath)
+            return vectorspace.counts().nnz
 
         try:
 
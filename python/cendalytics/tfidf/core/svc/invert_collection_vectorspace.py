@@ -38,8 +38,6 @@ class InvertCollectionVectorSpace(BaseObject):
         +------+------------+-------------------------------------------+
     """
 
-    __reader = None
-
     def __init__(self,
                  library_name: str,
                  is_debug: bool = False):
@@ -48,6 +46,9 @@ class InvertCollectionVectorSpace(BaseObject):
             4-Nov-2019
             craig.trim@ibm.com
             *   https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1261#issuecomment-15732844
+        Updated:
+            18-Oct-2026
+            *   select the top-n terms for every key field in a single grouped pass
         """
         BaseObject.__init__(self, __name__)
 
@@ -55,37 +56,24 @@ class InvertCollectionVectorSpace(BaseObject):
         self._library_name = library_name
 
     def _file_path(self):
-        fname = f"{self._library_name.split('.csv')[0].strip()}_INVERTED"
+        fname = f"{os.path.splitext(self._library_name)[0].strip()}_INVERTED"
         return os.path.join(os.environ['GTS_BASE'],
                             f"resources/confidential_input/vectorspace/{fname}.csv")
 
-    def _key_fields(self):
+    def _to_dataframe(self,
+                      top_n: int) -> DataFrame:
         from cendalytics.tfidf.core.dmo import VectorSpaceLibraryLoader
+        from cendalytics.tfidf.core.dmo import VectorSpaceTopNSelector
 
         df = VectorSpaceLibraryLoader(is_debug=self._is_debug,
                                       library_name=self._library_name).df()
-        return df['Doc'].unique()
 
-    def _to_dataframe(self,
-                      top_n: int,
-                      key_fields: list) -> DataFrame:
-        results = []
-        for key_field in key_fields:
-            df_top = self.__reader.process(key_field=key_field,
-                                           top_n=top_n)
-
-            for tag in df_top['Term'].unique():
-                results.append({
-                    "KeyField": key_field,
-                    "Term": tag.lower()})
-
-        return pd.DataFrame(results)
-
-    def __init_reader(self):
-        if not self.__reader:
-            from cendalytics.tfidf.core.svc import ReadCollectionVectorSpace
-            self.__reader = ReadCollectionVectorSpace(is_debug=False,  # maintain as False
-                                                      library_name=self._library_name)
+        df_top = VectorSpaceTopNSelector(df=df,
+                                         is_debug=False).top_n_by_key_field(top_n=top_n)
+
+        return pd.DataFrame({
+            "KeyField": df_top['KeyField'].values,
+            "Term": df_top['Term'].str.lower().values})
 
     def process(self,
                 top_n: int = 3) -> str:
@@ -97,12 +85,8 @@ class InvertCollectionVectorSpace(BaseObject):
 
         start = time.time()
 
-        self.__init_reader()
         fpath = self._file_path()
-        key_fields = self._key_fields()
-
-        df = self._to_dataframe(top_n=top_n,
-                                key_fields=key_fields)
+        df = self._to_dataframe(top_n=top_n)
 
         df.to_csv(fpath,
                   encoding='utf-8',
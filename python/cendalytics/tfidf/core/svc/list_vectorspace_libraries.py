@@ -46,7 +46,8 @@ class ListVectorSpaceLibraries(BaseObject):
         Purpose:
             Match a Library to a Library type
         Library Types and Naming Standards:
-            'vectorspace'       SUPPLY_TAG_20191025_TFIDF.csv
+            'vectorspace'       SUPPLY_TAG_20191025_TFIDF.npz
+                                SUPPLY_TAG_20191025_TFIDF.csv   (prior to the sparse vector space)
             'inverted'          SUPPLY_TAG_20191025_TFIDF_INVERTED.csv
         :param a_library:
             a given library
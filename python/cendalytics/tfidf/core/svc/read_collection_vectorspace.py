@@ -27,6 +27,7 @@ class ReadCollectionVectorSpace(BaseObject):
     """
 
     __df = None
+    __selector = None
 
     def __init__(self,
                  library_name: str,
@@ -42,6 +43,9 @@ class ReadCollectionVectorSpace(BaseObject):
             *   renamed from 'search-skills-vectorspace' and
                 refactored out of the nlusvc project
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1261
+        Updated:
+            18-Oct-2026
+            *   reuse a single (indexed) selector across reads
         :param library_name:
         :param is_debug:
         """
@@ -55,6 +59,13 @@ class ReadCollectionVectorSpace(BaseObject):
         self.__df = VectorSpaceLibraryLoader(is_debug=self._is_debug,
                                              library_name=self._library_name).df()
 
+    def _selector(self) -> VectorSpaceTopNSelector:
+        """ the selector indexes the vector space by key field on first use """
+        if self.__selector is None:
+            self.__selector = VectorSpaceTopNSelector(df=self.df(),
+                                                      is_debug=self._is_debug)
+        return self.__selector
+
     def df(self) -> DataFrame:
         if self.__df is None:
             self._load_dataframe()
@@ -86,8 +97,6 @@ class ReadCollectionVectorSpace(BaseObject):
                 |  2 |      3 | microsoft  |
                 +----+--------+------------+
         """
-        selector = VectorSpaceTopNSelector(df=self.df(),
-                                           is_debug=self._is_debug)
-        return selector.process(top_n=top_n,
-                                expand=expand,
-                                key_field=key_field)
+        return self._selector().process(top_n=top_n,
+                                        expand=expand,
+                                        key_field=key_field)
@@ -70,6 +70,9 @@ class ImplicationFinder(BaseObject):
             6-Feb-2020
             craig.trim@ibm.com
             *   https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1829
+        Updated:
+            18-Oct-2026
+            *   use index-backed edit distance matching (within a distance of 1)
         """
         BaseObject.__init__(self, __name__)
         self._is_debug = is_debug
@@ -113,9 +116,10 @@ class ImplicationFinder(BaseObject):
 
     def _edit_distance(self,
                        a_keyword: str) -> DataFrame:
-        return self._nltk_api.edit_distance_multiple(
-            input_text=a_keyword,
-            candidate_matches=self._candidate_matches)
+        return self._nltk_api.edit_distance_nearest(
+            input_texts=[a_keyword],
+            candidate_matches=self._candidate_matches,
+            max_distance=1)
 
     def process(self) -> dict:
         key_words = self._key_words()
@@ -1,4 +1,5 @@
 from .academic_dimension_calculator import AcademicDimensionCalculator
+from .batch_zscore_calculator import BatchZScoreCalculator
 from .dimension_calculator import DimensionCalculator
 from .dimension_comparator import DimensionComparator
 from .dimension_persistence import DimensionPersistence
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import numpy as np
+
+from base import ArrayIO
+from base import BaseObject
+
+
+class BatchZScoreCalculator(BaseObject):
+    """ Compute Z-Scores on Dimensions for a Chunk of Records
+
+        the vectorized equivalent of 'zscore-calculator'
+        each row of the weight matrix is one record, each column one schema """
+
+    def __init__(self,
+                 weights: np.ndarray,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   compute z-scores for a chunk of records in a single pass
+        :param weights:
+            a (records x schemas) matrix of schema weights
+        """
+        BaseObject.__init__(self, __name__)
+        if weights.ndim != 2 or weights.shape[1] < 2:
+            raise ValueError(f"Invalid Weight Matrix: {weights.shape}")
+
+        self._is_debug = is_debug
+        self._weights = weights
+
+    def process(self) -> tuple:
+        """
+        :return:
+            a tuple of (records x schemas) matrices
+                zScore          rounded to 2 decimal places
+                zScoreNorm      the zScore less the lowest zScore of the record
+                                rounded to 1 decimal place
+        """
+        weights = self._weights
+
+        mean = weights.mean(axis=1)
+        stdev = weights.std(axis=1, ddof=1)
+
+        # a record with identical weights has a sample deviation of 0
+        # the mean is taken from the weights themselves to avoid any rounding residue
+        constant = weights.max(axis=1) == weights.min(axis=1)
+        mean[constant] = weights[constant, 0]
+        stdev[constant] = 0.005
+
+        zscores = ArrayIO.round((weights - mean[:, None]) / stdev[:, None], 2)
+        zscores_norm = ArrayIO.round(zscores - zscores.min(axis=1)[:, None], 1)
+
+        if self._is_debug:
+            self.logger.debug(f"Computed zScores "
+                              f"(records={weights.shape[0]}, "
+                              f"schemas={weights.shape[1]})")
+
+        return zscores, zscores_norm
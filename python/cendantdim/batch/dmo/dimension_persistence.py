@@ -26,6 +26,9 @@ class DimensionPersistence(BaseObject):
             xavier.verges@es.ibm.com
             *   added method exists()
             *   added key_field value as `_id`
+        Updated:
+            18-Oct-2026
+            *   added method existing() for bulk existence checks
         """
         BaseObject.__init__(self, __name__)
 
@@ -42,6 +45,13 @@ class DimensionPersistence(BaseObject):
         """
         return self._cendant_xdm.collection.collection.find_one(filter={'_id': key_field_value}) is not None
 
+    def existing(self,
+                 key_field_values: list) -> set:
+        """
+        Resolve which records already exist with a single bulk query
+        """
+        return self._cendant_xdm.collection.existing_ids(key_field_values)
+
     def insert_many(self,
                     d_source_records: dict,
                     d_results: dict) -> None:
@@ -4,10 +4,12 @@
 
 import statistics
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from tabulate import tabulate
 
+from base import ArrayIO
 from base import BaseObject
 
 
@@ -22,6 +24,9 @@ class ZScoreCalculator(BaseObject):
             7-Aug-2019
             craig.trim@ibm.com
             *   refactored out of 'process-single-record'
+        Updated:
+            18-Oct-2026
+            *   round with 'array-io' as 'batch-zscore-calculator' does
         :param df_schema_weights:
             Schema 	                Weight
             cloud 	                1.0
@@ -66,10 +71,9 @@ class ZScoreCalculator(BaseObject):
         _stdev = stdev()
         _mean = statistics.mean(weights)
 
-        zscores = []
-        for weight in weights:
-            zscore = (weight - _mean) / _stdev
-            zscores.append(round(zscore, 2))
+        zscores = ArrayIO.round(np.array([(weight - _mean) / _stdev
+                                          for weight in weights]), 2)
+        zscores_norm = ArrayIO.round(zscores - zscores.min(), 1)
 
         results = []
         for i, row in self.df_schema_weights.iterrows():
@@ -77,7 +81,7 @@ class ZScoreCalculator(BaseObject):
                 "Schema": row["Schema"],
                 "Weight": row["Weight"],
                 "zScore": zscores[i],
-                "zScoreNorm": round(zscores[i] - min(zscores), 1)})
+                "zScoreNorm": zscores_norm[i]})
 
         df_zscore = pd.DataFrame(results)
         if self._is_debug:
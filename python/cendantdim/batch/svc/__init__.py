@@ -1,3 +1,4 @@
+from .compute_batch_dimensions import ComputeBatchDimensions
 from .extract_extended_relationships import ExtractExtendedRelationships
 from .generate_dimensions import GenerateDimensions
 from .generate_metrics import GenerateMetrics
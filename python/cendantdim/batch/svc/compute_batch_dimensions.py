@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from base import BaseObject
+from datadict import OntologyRegistry
+
+
+class ComputeBatchDimensions(BaseObject):
+    """ Compute Dimensionality for a Chunk of Records in a single pass
+
+        the results are equivalent to 'process-single-record.compute' for each record:
+        -   evidence is extracted once for the chunk
+        -   inference is computed once per distinct tag set in the chunk
+        -   rule weights are computed once per distinct (collection, field, tags, text) in the chunk
+            (both memos are cleared per chunk, so a long job does not accumulate them)
+        -   evidence is summarized and weighted by 'generate-dataframe-weights'
+        -   every weighted (record, schema) contribution is accumulated into a sparse
+            (records x schemas) matrix and z-scored in one vectorized step """
+
+    def __init__(self,
+                 xdm_schema: str,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   replace per-record dimensionality computation in 'process-multiple-records'
+        :param xdm_schema:
+            the name of the schema to perform the type lookup
+            Notes:
+            -   typically either 'supply' or 'learning'
+            -   the full list is on path 'resources/config/dimensionality'
+        :param is_debug:
+        """
+        BaseObject.__init__(self, __name__)
+        from nlusvc.core.svc import GenerateDataFrameRels
+        from nlusvc.core.svc import GenerateDataframeWeights
+
+        self._is_debug = is_debug
+        self._xdm_schema = xdm_schema
+
+        # the same configuration as 'inference-computer' and 'weight-computer'
+        self._rels_generator = GenerateDataFrameRels(xdm_schema=xdm_schema,
+                                                     add_tag_syns=False,
+                                                     add_tag_rels=True,
+                                                     add_rel_syns=False,
+                                                     inference_level=1,
+                                                     add_wiki_references=False,
+                                                     is_debug=is_debug)
+        self._weights_generator = GenerateDataframeWeights(xdm_schema=xdm_schema,
+                                                           add_provenance_weight=True,
+                                                           add_field_text_weight=True,
+                                                           add_implicit_weights=True,
+                                                           add_badge_distribution_weight=True,
+                                                           is_debug=is_debug)
+
+        self._schemas = OntologyRegistry(is_debug=is_debug).dimensions(xdm_schema).top_level_entities()
+        self._d_schema_index = {schema: i for i, schema in enumerate(self._schemas)}
+
+        self._d_inference = {}  # memoized per chunk (see 'process')
+        self._d_rule_weights = {}
+
+    def _evidence(self,
+                  source_records: list) -> dict:
+        """
+        :return:
+            evidence structures grouped by key-field (in record order)
+        """
+        from nlusvc import EvidenceExtractor
+
+        d_evidence = {}
+        for result in EvidenceExtractor(some_records=source_records,
+                                        xdm_schema=self._xdm_schema,
+                                        is_debug=self._is_debug).results():
+            key_field = result["KeyField"]
+            if key_field not in d_evidence:
+                d_evidence[key_field] = []
+            d_evidence[key_field].append(result)
+
+        return d_evidence
+
+    def _inference(self,
+                   tags: list) -> dict or None:
+        """
+        :param tags:
+            a sorted list of distinct tags (the tag set of a record)
+        :return:
+            the schema counts by tag (see 'generate-dataframe-weights.inference')
+            None    if no inference was computed for the tag set
+        """
+        key = tuple(tags)
+        if key not in self._d_inference:
+            df_inference = self._rels_generator.process(some_tags=tags)
+            if df_inference.empty:
+                self._d_inference[key] = None
+            else:
+                self._d_inference[key] = self._weights_generator.inference(df_inference)
+
+        return self._d_inference[key]
+
+    def _rule_weight(self,
+                     collection: str,
+                     field_name: str,
+                     tags: list,
+                     original_text: str) -> float:
+        key = (collection, field_name, tuple(tags), original_text)
+        if key not in self._d_rule_weights:
+            self._d_rule_weights[key] = self._weights_generator.rule_weight(collection=collection,
+                                                                            field_name=field_name,
+                                                                            tags=tags,
+                                                                            original_text=original_text)
+        return self._d_rule_weights[key]
+
+    def _contributions(self,
+                       ordinal: int,
+                       evidence: list,
+                       d_inference: dict,
+                       coords: tuple) -> None:
+        """
+        Purpose:
+            Append the weighted (record, schema) contributions of a single record
+            in the same order that 'generate-dataframe-weights' sums them
+        :param coords:
+            (rows, cols, weights)
+        """
+        rows, cols, weights = coords
+
+        for result in self._weights_generator.transform(evidence=evidence,
+                                                        d_inference=d_inference):
+            rule_weight = self._rule_weight(collection=result["Collection"],
+                                            field_name=result["FieldName"],
+                                            tags=result["Tags"],
+                                            original_text=result["OriginalText"])
+
+            for schema, weight in self._weights_generator.schema_weights(result, rule_weight):
+                if schema in self._d_schema_index:
+                    rows.append(ordinal)
+                    cols.append(self._d_schema_index[schema])
+                    weights.append(weight)
+
+    def process(self,
+                source_records: list) -> dict:
+        """
+        :param source_records:
+            a list of tag records (e.g., a chunk from the tag collection)
+        :return:
+            a dictionary of zScore DataFrames keyed by key-field
+            records without evidence or inference are not included
+                {   key_field-1: { <dataframe> },
+                    key_field-2: { <dataframe> },
+                    ...
+                    key_field-n: { <dataframe> }}
+        """
+        from cendantdim.batch.dmo import BatchZScoreCalculator
+        from cendantdim.batch.dmo import TimeDimensionCalculator
+        from cendantdim.batch.dmo import AcademicDimensionCalculator
+
+        start = time.time()
+
+        self._d_inference = {}
+        self._d_rule_weights = {}
+
+        d_source_records = {x["key_field"]: x for x in source_records}
+        d_evidence = self._evidence(source_records)
+
+        key_fields = []
+        coords = ([], [], [])
+        for key_field, evidence in d_evidence.items():
+            tags = sorted(set([x["Tag"] for x in evidence if x["Tag"]]))
+            if not tags:
+                continue
+
+            d_inference = self._inference(tags)
+            if d_inference is None:
+                continue
+
+            self._contributions(ordinal=len(key_fields),
+                                evidence=evidence,
+                                d_inference=d_inference,
+                                coords=coords)
+            key_fields.append(key_field)
+
+        if not key_fields:
+            return {}
+        time_1 = time.time()
+
+        rows, cols, values = coords
+
+        # unbuffered accumulation (in order) matches the per-record summation
+        weights = np.zeros((len(key_fields), len(self._schemas)))
+        np.add.at(weights, (np.array(rows, dtype=int), np.array(cols, dtype=int)),
+                  np.array(values, dtype=float))
+
+        zscores, zscores_norm = BatchZScoreCalculator(weights=weights,
+                                                      is_debug=self._is_debug).process()
+        time_2 = time.time()
+
+        d_results = {}
+        for i, key_field in enumerate(key_fields):
+            source_record = d_source_records[key_field]
+
+            df_zscores = pd.DataFrame({
+                "Schema": self._schemas,
+                "Weight": weights[i],
+                "zScore": zscores[i],
+                "zScoreNorm": zscores_norm[i]})
+
+            df_academic = AcademicDimensionCalculator(source_record=source_record,
+                                                      is_debug=self._is_debug).process().final()
+            df_experience = TimeDimensionCalculator(source_record=source_record,
+                                                    is_debug=self._is_debug).process().final()
+
+            d_results[key_field] = pd.concat([df_zscores, df_academic, df_experience],
+                                             ignore_index=True)
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Batch Dimensions Computed",
+                f"\tTotal Records: {len(source_records)}",
+                f"\tTotal Results: {len(d_results)}",
+                f"\tDistinct Tag Sets: {len(self._d_inference)}",
+                f"\tDistinct Rule Weights: {len(self._d_rule_weights)}",
+                f"\tWeights: {round(time_1 - start, 2)}s",
+                f"\tzScores: {round(time_2 - time_1, 2)}s",
+                f"\tTotal: {round(time.time() - start, 2)}s"]))
+
+        return d_results
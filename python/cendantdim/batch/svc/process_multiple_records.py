@@ -19,6 +19,7 @@ class ProcessMultipleRecords(BaseObject):
                  collection_name_tag: str,
                  collection_name_xdm: str,
                  mongo_client: BaseMongoClient = None,
+                 batch_scoring: bool = True,
                  is_debug: bool = False):
         """
         Created:
@@ -52,6 +53,11 @@ class ProcessMultipleRecords(BaseObject):
             *   remove the use of the memory hungry RecordPager and
                 use instead xdm_writer.exists()
             *   some general cleanup of unused code
+        Updated:
+            18-Oct-2026
+            *   compute each chunk of source records in a single pass
+                with 'compute-batch-dimensions'
+            *   resolve the existing xdm records with one bulk query
         :param d_manifest:
             unused - collection names and schema are specified via parameter
         :param xdm_schema:
@@ -62,10 +68,14 @@ class ProcessMultipleRecords(BaseObject):
         :param collection_name_tag:
         :param collection_name_xdm:
         :param mongo_client:
+        :param batch_scoring:
+            True        compute the dimensions of each chunk in a single pass
+            False       compute the dimensions record by record
         :param is_debug:
         """
         BaseObject.__init__(self, __name__)
         from cendantdim.batch.svc import ProcessSingleRecord
+        from cendantdim.batch.svc import ComputeBatchDimensions
 
         if not mongo_client:
             mongo_client = BaseMongoClient()
@@ -82,6 +92,11 @@ class ProcessMultipleRecords(BaseObject):
                                                      collection_name_xdm=collection_name_xdm,
                                                      is_debug=is_debug)
 
+        self._batch_processor = None
+        if batch_scoring:
+            self._batch_processor = ComputeBatchDimensions(xdm_schema=xdm_schema,
+                                                           is_debug=is_debug)
+
         self.logger.debug("\n".join([
             "Instantiated ProcessMultipleRecords",
             f"\tSchema: {xdm_schema}",
@@ -95,6 +110,34 @@ class ProcessMultipleRecords(BaseObject):
                                        some_base_client=self._mongo_client)
         collection.delete(keep_indexes=False)
 
+    def _process_source_records_in_batch(self,
+                                         xdm_writer,
+                                         source_records: list,
+                                         persist_threshold: int) -> None:
+        start = time.time()
+
+        existing = xdm_writer.existing([x["key_field"] for x in source_records])
+        if len(existing):
+            self.logger.debug(f'{len(existing)} xdm records already there. Skipping')
+
+        source_records = [x for x in source_records if x["key_field"] not in existing]
+        if not len(source_records):
+            return
+
+        d_results = self._batch_processor.process(source_records)
+        d_source_records = {x["key_field"]: x for x in source_records}
+
+        key_fields = list(d_results.keys())
+        for i in range(0, len(key_fields), persist_threshold):
+            batch = key_fields[i:i + persist_threshold]
+            xdm_writer.insert_many({x: d_source_records[x] for x in batch},
+                                   {x: d_results[x] for x in batch})
+
+        self.logger.debug(f"Processed Source Records: "
+                          f"(total={len(source_records)}, "
+                          f"persisted={len(d_results)}, "
+                          f"time={round(time.time() - start, 2)})")
+
     def _process_source_records(self,
                                 source_records: list,
                                 persist_threshold: int = 10) -> None:
@@ -103,6 +146,14 @@ class ProcessMultipleRecords(BaseObject):
         xdm_writer = DimensionPersistence(cendant_xdm=self._record_processor.cendant_xdm(),
                                           is_debug=self._is_debug)
 
+        if self._batch_processor:
+            self._process_source_records_in_batch(xdm_writer=xdm_writer,
+                                                  source_records=source_records,
+                                                  persist_threshold=persist_threshold)
+            return
+
+        existing = xdm_writer.existing([x["key_field"] for x in source_records])
+
         d_results_buffer = {}
         d_source_records = {}
 
@@ -113,7 +164,7 @@ class ProcessMultipleRecords(BaseObject):
 
             key_field = source_record["key_field"]
 
-            if xdm_writer.exists(key_field):
+            if key_field in existing:
                 self.logger.debug(f'xdm record {key_field} already there. Skipping')
                 continue
 
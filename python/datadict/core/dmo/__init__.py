@@ -1,2 +1,4 @@
 from .dictionary_loader import DictionaryLoader
 from .entity_kb_reader import EntityKbReader
+from .ontology_snapshot import OntologySnapshot
+from .relationship_store import RelationshipStore
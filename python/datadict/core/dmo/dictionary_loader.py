@@ -14,6 +14,7 @@ class DictionaryLoader(BaseObject):
 
     def __init__(self,
                  ontology_name: str,
+                 use_snapshot: bool = True,
                  is_debug: bool = False):
         """
         Created:
@@ -25,12 +26,62 @@ class DictionaryLoader(BaseObject):
             craig.trim@ibm.com
             *   add ontology names in list
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1853https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1853
+        Updated:
+            18-Oct-2026
+            *   load dictionaries from the compiled 'ontology-snapshot' when present
+            *   add 'version' to identify the build of the ontology
+        :param use_snapshot:
+            True        use the binary snapshot (if one exists and is current)
+            False       always import the generated dictionary modules
         """
         BaseObject.__init__(self, __name__)
 
         self._is_debug = is_debug
+        self._use_snapshot = use_snapshot
         self._ontology_name = ontology_name.lower().strip()
 
+    def _directory(self) -> str or None:
+        """
+        :return:
+            the directory of the generated modules (e.g., 'os/base')
+            or None if the ontology name is not recognized
+        """
+        if self._ontology_name in self._base_names:
+            return 'base'
+        if self._ontology_name in self._biotech_names:
+            return 'biotech'
+
+    def _snapshot(self,
+                  name: str):
+        """
+        :param name:
+            the snapshot section name
+        :return:
+            the dictionary from the snapshot
+            or None if no snapshot is available
+        """
+        if not self._use_snapshot or not self._directory():
+            return None
+
+        from datadict.core.dmo import OntologySnapshot
+
+        snapshot = OntologySnapshot.instance(self._directory(), is_debug=self._is_debug)
+        if snapshot:
+            return snapshot.section(name)
+
+    def version(self) -> str:
+        """
+        :return:
+            the build version of the ontology
+            (a digest that changes whenever the ontology is regenerated)
+        """
+        from datadict.core.dmo import OntologySnapshot
+
+        if not self._directory():
+            self._error()
+
+        return OntologySnapshot(self._directory(), is_debug=self._is_debug).digest()
+
     def _error(self):
         self.logger.error(f"Ontology Name Not Recognized: "
                           f"{self._ontology_name}")
@@ -41,6 +92,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def fwd(cls):
+                d_snapshot = self._snapshot('synonyms')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_synonyms_dict
                     return the_synonyms_dict
@@ -51,6 +105,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def rev(cls):
+                d_snapshot = self._snapshot('reverse_synonyms')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_reverse_synonym_dict
                     return the_reverse_synonym_dict
@@ -61,6 +118,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def seeAlso(cls):
+                d_snapshot = self._snapshot('see_also')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_seealso_dict
                     return the_seealso_dict
@@ -76,6 +136,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def similarity(cls):
+                d_snapshot = self._snapshot('rel_similarity')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_similarity_dict
                     return the_rel_similarity_dict
@@ -86,6 +149,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def requires(cls):
+                d_snapshot = self._snapshot('rel_requires')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_requires_dict
                     return the_rel_requires_dict
@@ -96,6 +162,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def parts(cls):
+                d_snapshot = self._snapshot('rel_parts')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_parts_dict
                     return the_rel_parts_dict
@@ -106,6 +175,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def defines(cls):
+                d_snapshot = self._snapshot('rel_defines')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_defines_dict
                     return the_rel_defines_dict
@@ -116,6 +188,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def versions(cls):
+                d_snapshot = self._snapshot('rel_versions')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_versions_dict
                     return the_rel_versions_dict
@@ -126,6 +201,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def runsOn(cls):
+                d_snapshot = self._snapshot('rel_runson')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_runson_dict
                     return the_rel_runson_dict
@@ -136,6 +214,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def produces(cls):
+                d_snapshot = self._snapshot('rel_produces')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_produces_dict
                     return the_rel_produces_dict
@@ -146,6 +227,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def owns(cls):
+                d_snapshot = self._snapshot('rel_owns')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_owns_dict
                     return the_rel_owns_dict
@@ -156,6 +240,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def implies(cls):
+                d_snapshot = self._snapshot('rel_implies')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_implies_dict
                     return the_rel_implies_dict
@@ -166,6 +253,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def infinitive(cls):
+                d_snapshot = self._snapshot('rel_infinitive')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_rel_infinitive_dict
                     return the_rel_infinitive_dict
@@ -181,6 +271,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def labels(cls):
+                d_snapshot = self._snapshot('labels')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_labels_dict
                     return the_labels_dict
@@ -191,6 +284,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def parents(cls):
+                d_snapshot = self._snapshot('parents')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_parents_dict
                     return the_parents_dict
@@ -201,6 +297,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def patterns(cls):
+                d_snapshot = self._snapshot('patterns')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_patterns_dict
                     return the_patterns_dict
@@ -211,6 +310,9 @@ class DictionaryLoader(BaseObject):
 
             @classmethod
             def ngrams(cls):
+                d_snapshot = self._snapshot('ngrams')
+                if d_snapshot is not None:
+                    return d_snapshot
                 if self._ontology_name in self._base_names:
                     from datadict.core.os.base import the_entity_ngrams
                     return the_entity_ngrams
@@ -220,3 +322,11 @@ class DictionaryLoader(BaseObject):
                 self._error()
 
         return Facade()
+
+    def references(self):
+        d_snapshot = self._snapshot('references')
+        if d_snapshot is not None:
+            return d_snapshot
+
+        from datadict.core.os.references import the_references_dict
+        return the_references_dict
@@ -0,0 +1,432 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import hashlib
+import importlib.util
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections.abc import Mapping
+
+from base import BaseObject
+
+MAGIC = b'ONTSNAP\x01'
+
+OS_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'os'))
+
+# snapshot section name -> (generated module file, dictionary name)
+# the module file is relative to the ontology directory (e.g., 'os/base')
+SOURCES = {
+    'labels': ('labels.py', 'the_labels_dict'),
+    'ngrams': ('ngrams.py', 'the_entity_ngrams'),
+    'parents': ('parents.py', 'the_parents_dict'),
+    'patterns': ('patterns.py', 'the_patterns_dict'),
+    'synonyms': ('synonym.py', 'the_synonyms_dict'),
+    'reverse_synonyms': ('reverse_synonym.py', 'the_reverse_synonym_dict'),
+    'see_also': ('seealso.py', 'the_seealso_dict'),
+    'rel_defines': ('rel_defines_kb.py', 'the_rel_defines_dict'),
+    'rel_implies': ('rel_implies_kb.py', 'the_rel_implies_dict'),
+    'rel_infinitive': ('rel_infinitive_kb.py', 'the_rel_infinitive_dict'),
+    'rel_owns': ('rel_owns_kb.py', 'the_rel_owns_dict'),
+    'rel_parts': ('rel_parts_kb.py', 'the_rel_parts_dict'),
+    'rel_produces': ('rel_produces_kb.py', 'the_rel_produces_dict'),
+    'rel_requires': ('rel_requires_kb.py', 'the_rel_requires_dict'),
+    'rel_runson': ('rel_runson_kb.py', 'the_rel_runson_dict'),
+    'rel_similarity': ('rel_similarity_kb.py', 'the_rel_similarity_dict'),
+    'rel_versions': ('rel_versions_kb.py', 'the_rel_versions_dict'),
+    'references': (os.path.join('..', 'references.py'), 'the_references_dict')}
+
+
+class SnapshotDict(Mapping):
+    """ Read-Only Dictionary View over a Snapshot Section
+
+        keys are resolved through a lazily built string -> position index
+        and values are decoded on first access """
+
+    def __init__(self,
+                 snapshot: 'OntologySnapshot',
+                 section: dict):
+        self._snapshot = snapshot
+        self._kind = section["kind"]
+        self._arrays = {name: snapshot.array(name, spec)
+                        for name, spec in section["arrays"].items()}
+        self._index = None
+        self._values = {}
+
+    def _key_index(self) -> dict:
+        if self._index is None:
+            string = self._snapshot.string
+            self._index = {string(x): i for i, x in enumerate(self._arrays["keys"])}
+        return self._index
+
+    def _value(self,
+               i: int):
+        string = self._snapshot.string
+
+        if self._kind == 'scalar':
+            return string(self._arrays["values"][i])
+
+        start = self._arrays["indptr"][i]
+        end = self._arrays["indptr"][i + 1]
+
+        if self._kind == 'multi':
+            return [string(x) for x in self._arrays["values"][start:end]]
+
+        # 'weighted' (e.g., references)
+        values = self._arrays["values"]
+        f = self._arrays["f"]
+        z = self._arrays["z"]
+        return {string(values[j]): {'f': f[j], 'z': z[j]}
+                for j in range(start, end)}
+
+    def __getitem__(self, key):
+        i = self._key_index()[key]
+        if i not in self._values:
+            self._values[i] = self._value(i)
+        return self._values[i]
+
+    def __contains__(self, key):
+        return key in self._key_index()
+
+    def __iter__(self):
+        string = self._snapshot.string
+        for x in self._arrays["keys"]:
+            yield string(x)
+
+    def __len__(self):
+        return len(self._arrays["keys"])
+
+
+class OntologySnapshot(BaseObject):
+    """ Compiled Binary Snapshot of the Generated Ontology Dictionaries
+
+        Layout:
+            magic               8 bytes
+            header length       uint32
+            header              JSON (sections, array offsets, source file stats)
+            arrays              8-byte aligned native arrays
+                                (string offsets, string blob, keys, indptr, values, ...)
+
+        Strings are interned in a single table and every dictionary is stored as
+        integer IDs into that table; dictionaries of lists use an array-backed
+        (CSR) adjacency.  The file is memory-mapped read-only so forked workers
+        share the same pages
+
+        The snapshot is written to
+            $ONTOLOGY_SNAPSHOT_PATH/<ontology>/snapshot.bin     (if defined)
+            datadict/core/os/<ontology>/snapshot.bin            (otherwise; ignored by git) """
+
+    _d_snapshots = {}
+    _d_digests = {}
+
+    def __init__(self,
+                 ontology_name: str,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   avoid importing the large generated dictionary modules on startup
+        :param ontology_name:
+            the ontology directory name (e.g., 'base' or 'biotech')
+        """
+        BaseObject.__init__(self, __name__)
+        self._is_debug = is_debug
+        self._ontology_name = ontology_name
+
+        self._mmap = None
+        self._header = None
+        self._strings = None
+        self._string_offsets = None
+        self._string_blob = None
+        self._sections = {}
+
+    def path(self) -> str:
+        return os.path.join(os.environ.get('ONTOLOGY_SNAPSHOT_PATH', OS_PATH),
+                            self._ontology_name, 'snapshot.bin')
+
+    def _source_path(self,
+                     name: str) -> str:
+        return os.path.normpath(os.path.join(OS_PATH, self._ontology_name, SOURCES[name][0]))
+
+    def _source_stats(self) -> dict:
+        d_stats = {}
+        for name in SOURCES:
+            stat = os.stat(self._source_path(name))
+            d_stats[name] = [stat.st_size, int(stat.st_mtime)]
+        return d_stats
+
+    def digest(self) -> str:
+        """
+        Purpose:
+            Identify the build of the ontology (e.g., to namespace cached results)
+        :return:
+            a digest of the content of the generated modules
+            (of the snapshot if it is deployed without them)
+            the digest is recomputed once a file changes size or modification time
+        """
+        paths = [self._source_path(name) for name in SOURCES]
+        paths = [x for x in paths if os.path.exists(x)]
+        if not paths and os.path.exists(self.path()):
+            paths = [self.path()]
+
+        key = []
+        for path in paths:
+            stat = os.stat(path)
+            key.append((path, stat.st_size, stat.st_mtime_ns))
+
+        if self._ontology_name not in self._d_digests or self._d_digests[self._ontology_name][0] != key:
+            sha1 = hashlib.sha1()
+            for path in paths:
+                sha1.update(os.path.basename(path).encode('utf-8'))
+                with open(path, 'rb') as handle:
+                    sha1.update(handle.read())
+            self._d_digests[self._ontology_name] = (key, sha1.hexdigest())
+
+        return self._d_digests[self._ontology_name][1]
+
+    @classmethod
+    def instance(cls,
+                 ontology_name: str,
+                 is_debug: bool = False) -> 'OntologySnapshot' or None:
+        """
+        :return:
+            a (cached) loaded snapshot
+            or None if the snapshot does not exist or is older than the generated modules
+            the cached snapshot is reloaded once the snapshot file is replaced
+        """
+        snapshot = cls(ontology_name=ontology_name,
+                       is_debug=is_debug)
+        try:
+            stat = os.stat(snapshot.path())
+            key = (snapshot.path(), stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            key = (snapshot.path(), None, None)
+
+        if ontology_name not in cls._d_snapshots or cls._d_snapshots[ontology_name][0] != key:
+            if not snapshot._load():
+                snapshot = None
+            cls._d_snapshots[ontology_name] = (key, snapshot)
+
+        return cls._d_snapshots[ontology_name][1]
+
+    def _load(self) -> bool:
+        if not os.path.exists(self.path()):
+            return False
+
+        start = time.time()
+        with open(self.path(), 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.logger.warning(f"Invalid Ontology Snapshot: {self.path()}")
+            return False
+
+        offset = len(MAGIC)
+        header_length = memoryview(self._mmap)[offset:offset + 4].cast('I')[0]
+        offset += 4
+        self._header = json.loads(bytes(self._mmap[offset:offset + header_length]).decode('utf-8'))
+
+        if self._header["byteorder"] != sys.byteorder:
+            self.logger.warning(f"Ontology Snapshot Byte Order Mismatch: {self.path()}")
+            return False
+
+        try:
+            if self._header["sources"] != self._source_stats():
+                self.logger.warning('\n'.join([
+                    "Stale Ontology Snapshot (regenerate with 'generate-ontology-snapshot')",
+                    f"\tPath: {self.path()}"]))
+                return False
+        except FileNotFoundError:
+            pass  # the snapshot may be deployed without the generated modules
+
+        self._string_offsets = self.array("offsets", self._header["strings"]["offsets"])
+        blob_offset, blob_length, _ = self._header["strings"]["blob"]
+        self._string_blob = memoryview(self._mmap)[blob_offset:blob_offset + blob_length]
+        self._strings = [None] * (len(self._string_offsets) - 1)
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Loaded Ontology Snapshot",
+                f"\tPath: {self.path()}",
+                f"\tTotal Strings: {len(self._strings)}",
+                f"\tTime: {round(time.time() - start, 4)}s"]))
+
+        return True
+
+    def array(self,
+              name: str,
+              spec: list) -> memoryview:
+        offset, count, typecode = spec
+        size = array(typecode).itemsize
+        return memoryview(self._mmap)[offset:offset + count * size].cast(typecode)
+
+    def string(self,
+               i: int) -> str:
+        if self._strings[i] is None:
+            value = bytes(self._string_blob[self._string_offsets[i]:self._string_offsets[i + 1]])
+            self._strings[i] = sys.intern(value.decode('utf-8'))
+        return self._strings[i]
+
+    def section(self,
+                name: str) -> list or SnapshotDict:
+        """
+        :param name:
+            a snapshot section name (see SOURCES)
+        :return:
+            a list (for 'labels') or a read-only dictionary view
+        """
+        if name not in self._sections:
+            section = self._header["sections"][name]
+            if section["kind"] == 'list':
+                values = self.array("values", section["arrays"]["values"])
+                self._sections[name] = [self.string(x) for x in values]
+            else:
+                self._sections[name] = SnapshotDict(self, section)
+        return self._sections[name]
+
+    def _read_source(self,
+                     name: str):
+        """ read the generated module from disk (bypassing any previously imported version) """
+        file_name, dict_name = SOURCES[name]
+        spec = importlib.util.spec_from_file_location(f"_snapshot_{name}",
+                                                      self._source_path(name))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, dict_name)
+
+    def build(self) -> str:
+        """
+        Purpose:
+            Compile the generated dictionary modules into a binary snapshot
+        :return:
+            the path of the snapshot
+        """
+        start = time.time()
+
+        d_strings = {}
+        l_strings = []
+
+        def _id(value: str) -> int:
+            if value not in d_strings:
+                d_strings[value] = len(l_strings)
+                l_strings.append(value)
+            return d_strings[value]
+
+        d_arrays = {}  # (section, array name) -> array
+
+        def _section(name: str,
+                     source) -> str:
+            if isinstance(source, list):
+                d_arrays[(name, "values")] = array('I', [_id(x) for x in source])
+                return 'list'
+
+            keys = array('I')
+            values = array('I')
+            indptr = array('I', [0])
+            f = array('i')
+            z = array('d')
+
+            kind = None
+            for key, value in source.items():
+                keys.append(_id(key))
+                if isinstance(value, str):
+                    kind = 'scalar'
+                    values.append(_id(value))
+                elif isinstance(value, dict):
+                    kind = 'weighted'
+                    for inner_key, inner_value in value.items():
+                        values.append(_id(inner_key))
+                        f.append(inner_value['f'])
+                        z.append(inner_value['z'])
+                    indptr.append(len(values))
+                else:
+                    kind = kind or 'multi'
+                    [values.append(_id(x)) for x in value]
+                    indptr.append(len(values))
+
+            kind = kind or 'multi'
+            d_arrays[(name, "keys")] = keys
+            d_arrays[(name, "values")] = values
+            if kind != 'scalar':
+                d_arrays[(name, "indptr")] = indptr
+            if kind == 'weighted':
+                d_arrays[(name, "f")] = f
+                d_arrays[(name, "z")] = z
+            return kind
+
+        d_kinds = {name: _section(name, self._read_source(name))
+                   for name in SOURCES}
+
+        blob = bytearray()
+        offsets = array('I', [0])
+        for value in l_strings:
+            blob += value.encode('utf-8')
+            offsets.append(len(blob))
+
+        # compute the layout; arrays are placed after the header
+        payloads = [("strings", "offsets", offsets), ("strings", "blob", blob)]
+        payloads += [(section, name, values) for (section, name), values in d_arrays.items()]
+
+        def _header(base_offset: int) -> dict:
+            header = {
+                "ontology_name": self._ontology_name,
+                "byteorder": sys.byteorder,
+                "sources": self._source_stats(),
+                "strings": {},
+                "sections": {name: {"kind": d_kinds[name], "arrays": {}} for name in SOURCES}}
+
+            offset = base_offset
+            for section, name, values in payloads:
+                offset += (-offset) % 8
+                if isinstance(values, array):
+                    spec = [offset, len(values), values.typecode]
+                    length = len(values) * values.itemsize
+                else:
+                    spec = [offset, len(values), 'B']
+                    length = len(values)
+                if section == "strings":
+                    header["strings"][name] = spec
+                else:
+                    header["sections"][section]["arrays"][name] = spec
+                offset += length
+            return header
+
+        # the header length determines the array offsets (iterate to a fixed point)
+        header_bytes = b''
+        while True:
+            base_offset = len(MAGIC) + 4 + len(header_bytes)
+            _header_bytes = json.dumps(_header(base_offset)).encode('utf-8')
+            is_fixed = len(_header_bytes) == len(header_bytes)
+            header_bytes = _header_bytes  # the offsets of this header assume its own length
+            if is_fixed:
+                break
+
+        path = self.path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", 'wb') as handle:
+            handle.write(MAGIC)
+            handle.write(array('I', [len(header_bytes)]).tobytes())
+            handle.write(header_bytes)
+            offset = len(MAGIC) + 4 + len(header_bytes)
+            for _, _, values in payloads:
+                padding = (-offset) % 8
+                handle.write(b'\x00' * padding)
+                offset += padding
+                data = values.tobytes() if isinstance(values, array) else bytes(values)
+                handle.write(data)
+                offset += len(data)
+        os.replace(f"{path}.tmp", path)
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Built Ontology Snapshot",
+                f"\tPath: {path}",
+                f"\tTotal Strings: {len(l_strings)}",
+                f"\tTotal Size: {round(os.path.getsize(path) / 1024 / 1024, 2)}MB",
+                f"\tTime: {round(time.time() - start, 2)}s"]))
+
+        return path
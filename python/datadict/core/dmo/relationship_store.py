@@ -0,0 +1,143 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import time
+
+from base import BaseObject
+
+
+class RelationshipStore(BaseObject):
+    """ Normalized Forward and Reverse Adjacency Maps for all Relationship Dictionaries
+
+        the maps are built once per ontology and shared across instances """
+
+    _d_stores = {}
+
+    def __init__(self,
+                 ontology_name: str = 'base',
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   replace linear dictionary scans in 'find-relationships'
+        :param ontology_name:
+            the ontology to build the adjacency maps for
+        """
+        BaseObject.__init__(self, __name__)
+        self._is_debug = is_debug
+        self._ontology_name = ontology_name.lower().strip()
+
+        if self._ontology_name not in self._d_stores:
+            self._d_stores[self._ontology_name] = self._build()
+
+    @staticmethod
+    def _cleanse(some_token: str) -> str:
+        return some_token.lower().strip()
+
+    def _dictionaries(self) -> dict:
+        from datadict.core.dmo import DictionaryLoader
+
+        loader = DictionaryLoader(is_debug=self._is_debug,
+                                  ontology_name=self._ontology_name)
+
+        return {
+            "parents": loader.taxonomy().parents(),
+            "see_also": loader.synonyms().seeAlso(),
+            "owns": loader.relationships().owns(),
+            "parts": loader.relationships().parts(),
+            "implies": loader.relationships().implies(),
+            "defines": loader.relationships().defines(),
+            "requires": loader.relationships().requires(),
+            "versions": loader.relationships().versions(),
+            "runson": loader.relationships().runsOn(),
+            "produces": loader.relationships().produces(),
+            "similarity": loader.relationships().similarity(),
+            "infinitive": loader.relationships().infinitive(),
+            "references": loader.references()}
+
+    def _build(self) -> dict:
+        start = time.time()
+
+        d_store = {}
+        for rel_name, some_dict in self._dictionaries().items():
+
+            d_fwd = {}
+            d_rev = {}
+            d_raw_rev = {}
+
+            for key in some_dict:
+                _key = self._cleanse(key)
+                if _key not in d_fwd:  # the first matching key wins
+                    d_fwd[_key] = key
+
+                for value in some_dict[key]:
+                    _value = self._cleanse(value)
+                    if _value not in d_rev:
+                        d_rev[_value] = set()
+                    d_rev[_value].add(key)
+
+                    if value not in d_raw_rev:
+                        d_raw_rev[value] = set()
+                    d_raw_rev[value].add(key)
+
+            d_store[rel_name] = {
+                "dict": some_dict,
+                "fwd": d_fwd,
+                "rev": {k: sorted(v) for k, v in d_rev.items()},
+                "raw_rev": {k: sorted(v) for k, v in d_raw_rev.items()}}
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Relationship Store Built",
+                f"\tOntology Name: {self._ontology_name}",
+                f"\tTime: {round(time.time() - start, 2)}s"]))
+
+        return d_store
+
+    def _store(self,
+               rel_name: str) -> dict:
+        return self._d_stores[self._ontology_name][rel_name]
+
+    def dict(self,
+             rel_name: str) -> dict:
+        """
+        :return:
+            the underlying relationship dictionary
+        """
+        return self._store(rel_name)["dict"]
+
+    def key(self,
+            rel_name: str,
+            some_token: str) -> str or None:
+        """
+        :return:
+            the dictionary key that matches the (normalized) token
+        """
+        return self._store(rel_name)["fwd"].get(self._cleanse(some_token))
+
+    def forward(self,
+                rel_name: str,
+                some_token: str) -> list:
+        """
+        :return:
+            the values of the first dictionary key that matches the (normalized) token
+        """
+        key = self.key(rel_name, some_token)
+        if key is None:
+            return []
+        return self.dict(rel_name)[key]
+
+    def reverse(self,
+                rel_name: str,
+                some_token: str,
+                normalize: bool = True) -> list:
+        """
+        :param normalize:
+            if False    the token must match the dictionary value exactly
+        :return:
+            the sorted keys that have a value matching the token
+        """
+        if normalize:
+            return list(self._store(rel_name)["rev"].get(self._cleanse(some_token), []))
+        return list(self._store(rel_name)["raw_rev"].get(some_token, []))
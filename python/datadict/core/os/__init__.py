@@ -1,5 +1,3 @@
-from .base import *
-from .biotech import *
 from .certification_hierarchy_kb import the_certification_hierarchy_dict
 from .certifications_kb import the_certifications_dict
 from .city_region_kb import the_city_to_region_dict
@@ -13,7 +11,6 @@ from .dimensionality_sentiment_kb import the_dimesionality_sentiment_dict
 from .dimensionality_supply_kb import the_dimesionality_supply_dict
 from .mapping_rev import the_mapping_rev_dict
 from .mapping_table import the_mapping_table_dict
-from .references import the_references_dict
 from .stopwords_kb import the_stopwords_dict
 from .taxonomy_kb import the_flow_taxonomy_dict
 from .taxonomy_revmap_kb import the_flow_taxonomy_revmap
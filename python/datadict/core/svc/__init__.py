@@ -16,3 +16,4 @@ from .find_stop_word import FindStopword
 from .find_synonym import FindSynonym
 from .load_stop_words import LoadStopWords
 from .load_wordnet import LoadWordnet
+from .ontology_registry import OntologyRegistry
@@ -16,6 +16,9 @@ class FindDimensions(BaseObject):
     __blacklist = ['activity', 'agent', 'company', 'entity', 'industry', 'language', 'learning',
                    'provenance', 'role', 'situation', 'skill', 'state', 'root', 'telecommunication']
 
+    _d_schema_index = {}
+    _d_tables = {}
+
     @classmethod
     def sentiment(cls,
                   is_debug: bool = False) -> __name__:
@@ -56,18 +59,23 @@ class FindDimensions(BaseObject):
             craig.trim@ibm.com
             *   add biotech dimenmsionality schema
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1609
+        Updated:
+            18-Oct-2026
+            *   resolve every entity label to its dimensions once per (schema, ontology)
+                'find' is a dictionary lookup for known labels
         """
         BaseObject.__init__(self, __name__)
-        from datadict import FindSynonym
-        from datadict import FindRelationships
+        from datadict import OntologyRegistry
 
         self._is_debug = is_debug
+        self._schema = schema.lower()
+        self._ontology_name = ontology_name
         self._d_schema = self._load_schema(schema)
 
-        self._syn_finder = FindSynonym(is_debug=is_debug,
-                                       ontology_name=ontology_name)
-        self._rel_finder = FindRelationships(is_debug=is_debug,
-                                             ontology_name=ontology_name)
+        self._syn_finder = OntologyRegistry(is_debug=is_debug,
+                                            ontology_name=ontology_name).synonyms()
+        self._rel_finder = OntologyRegistry(is_debug=is_debug,
+                                            ontology_name=ontology_name).relationships()
 
     @staticmethod
     def _load_schema(schema: str) -> dict:
@@ -101,19 +109,28 @@ class FindDimensions(BaseObject):
     def top_level_entities(self) -> list:
         return sorted(self._d_schema.keys())
 
+    def _schema_index(self) -> dict:
+        """
+        :return:
+            a map of every lowercase schema key and value to the schema keys it belongs to
+        """
+        if self._schema not in self._d_schema_index:
+            d_index = {}
+            for k in self._d_schema:
+                for token in [k] + list(self._d_schema[k]):
+                    token = token.lower()
+                    if token not in d_index:
+                        d_index[token] = set()
+                    d_index[token].add(k)
+            self._d_schema_index[self._schema] = d_index
+        return self._d_schema_index[self._schema]
+
     def _find_in_schema(self,
                         input_text: str) -> set:
-        matches = set()
-
-        for k in self._d_schema:
-            if k.lower() == input_text:
-                matches.add(k)
-
-            for v in self._d_schema[k]:
-                if v.lower() == input_text:
-                    matches.add(k)
-
-        return matches
+        d_index = self._schema_index()
+        if input_text in d_index:
+            return set(d_index[input_text])
+        return set()
 
     @staticmethod
     def _cleanse_results(results: list) -> list:
@@ -132,8 +149,8 @@ class FindDimensions(BaseObject):
 
         return results
 
-    def find(self,
-             input_text: str) -> list:
+    def _find(self,
+              input_text: str) -> list:
         cache = set()
 
         def _inner_find(some_input_text: str) -> Optional[list]:
@@ -171,8 +188,44 @@ class FindDimensions(BaseObject):
 
             return matches
 
-        results = _inner_find(input_text.lower().strip())
-        results = self._cleanse_results(results)
+        return self._cleanse_results(_inner_find(input_text))
+
+    def table(self) -> dict:
+        """
+        Purpose:
+            Resolve every entity label to its dimensions
+            the table is built once per (schema, ontology)
+        :return:
+            a dictionary of lowercase entity labels to dimensions
+        """
+        key = (self._schema, self._ontology_name)
+        if key not in self._d_tables:
+            from datadict import OntologyRegistry
+
+            entity_finder = OntologyRegistry(is_debug=self._is_debug,
+                                             ontology_name=self._ontology_name).entity()
+
+            d_table = {}
+            for label in entity_finder.all_labels():
+                label = label.lower().strip()
+                if label not in d_table:
+                    d_table[label] = self._find(label)
+            self._d_tables[key] = d_table
+
+        return self._d_tables[key]
+
+    def find(self,
+             input_text: str) -> list:
+        _input = input_text.lower().strip()
+
+        d_table = self.table()
+        if _input in d_table:
+            results = d_table[_input]
+        else:  # unknown strings are resolved (but not cached)
+            results = self._find(_input)
+
+        if isinstance(results, list):  # callers may modify the result
+            results = list(results)
 
         if self._is_debug:
             self.logger.debug(f"Located Schema ("
@@ -26,6 +26,12 @@ class FindEntity(BaseObject):
     _d_patterns_revmap = None
     _d_lowercase_parents = None
     _l_lowercase_labels = None
+    _d_lowercase_labels = None
+    _d_lowercase_children = None
+    _d_ancestors = None
+    _d_descendants = None
+    _d_lowercase_ancestors = None
+    _d_lowercase_descendants = None
 
     def __init__(self,
                  ontology_name: str = 'base',
@@ -74,6 +80,9 @@ class FindEntity(BaseObject):
             craig.trim@ibm.com
             *   load dictionaries by ontology name
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1582
+        Updated:
+            18-Oct-2026
+            *   use lazily built hash indexes for label, children, ancestors and descendants
         """
         BaseObject.__init__(self, __name__)
         from datadict.core.dmo import DictionaryLoader
@@ -112,6 +121,37 @@ class FindEntity(BaseObject):
             self._l_lowercase_labels = [x.lower() for x in self._l_labels]
         return self._l_lowercase_labels
 
+    def _lowercase_labels_revmap(self) -> dict:
+        """
+        :return:
+            a dictionary of lowercase label to label
+            the first label wins if multiple labels share a lowercase form
+        """
+        if self._d_lowercase_labels is None:
+            d_lowercase_labels = {}
+            for label in self._l_labels:
+                _label = label.lower()
+                if _label not in d_lowercase_labels:
+                    d_lowercase_labels[_label] = label
+            self._d_lowercase_labels = d_lowercase_labels
+        return self._d_lowercase_labels
+
+    def _lowercase_children(self) -> dict:
+        """
+        :return:
+            a dictionary of (lowercase) parent to a set of children
+        """
+        if self._d_lowercase_children is None:
+            d_lowercase_children = {}
+            for key in self._d_parents:
+                for value in self._d_parents[key]:
+                    _value = value.lower().strip()
+                    if _value not in d_lowercase_children:
+                        d_lowercase_children[_value] = set()
+                    d_lowercase_children[_value].add(key)
+            self._d_lowercase_children = d_lowercase_children
+        return self._d_lowercase_children
+
     def _revmap_patterns(self) -> dict:
         if self._d_patterns_revmap is None:
             self._d_patterns_revmap = {}
@@ -125,6 +165,13 @@ class FindEntity(BaseObject):
     def all_labels(self) -> list:
         return self._l_labels
 
+    def all_patterns(self) -> list:
+        """
+        :return:
+            every (non-compound) pattern that resolves to a label
+        """
+        return list(self._revmap_patterns().keys())
+
     def label_or_self(self,
                       some_input: str) -> str:
         label = self.label(some_input)
@@ -137,9 +184,9 @@ class FindEntity(BaseObject):
 
         _input = some_input.lower().strip()
 
-        _lowercase_labels = self._lowercase_labels()
+        _lowercase_labels = self._lowercase_labels_revmap()
         if _input in _lowercase_labels:
-            return self._l_labels[_lowercase_labels.index(_input)]
+            return _lowercase_labels[_input]
 
         revmap_patterns = self._revmap_patterns()
         if _input in revmap_patterns:
@@ -204,58 +251,80 @@ class FindEntity(BaseObject):
 
         return "unknown"
 
+    def _closure(self,
+                 some_input: str,
+                 cache: dict,
+                 neighbors) -> frozenset:
+        """
+        Purpose:
+            Compute (and memoize) the transitive closure of a relationship
+        :param some_input:
+            the starting node
+        :param cache:
+            the memoization dictionary for this relationship
+        :param neighbors:
+            the function that returns the adjacent nodes
+        :return:
+            every node reachable from the input (including the input)
+        """
+        if some_input not in cache:
+            results = {some_input}
+            for neighbor in neighbors(some_input):
+                results.update(self._closure(neighbor, cache, neighbors))
+            cache[some_input] = frozenset(results)
+        return cache[some_input]
+
+    def _ancestors(self,
+                   some_input: str) -> frozenset:
+        if self._d_ancestors is None:
+            self._d_ancestors = {}
+        return self._closure(some_input, self._d_ancestors, self.parents)
+
+    def _descendants(self,
+                     some_input: str) -> frozenset:
+        if self._d_descendants is None:
+            self._d_descendants = {}
+        return self._closure(some_input, self._d_descendants, self.children)
+
     def ancestors(self,
                   some_input: str) -> list:
-
-        results = set()
-
-        def _parents(value: str):
-            if value != some_input:
-                results.add(value)
-            for parent in self.parents(value):
-                _parents(parent)
-
-        _parents(some_input)
-        return sorted(results)
+        return sorted(self._ancestors(some_input) - {some_input})
 
     def children(self,
                  some_input: str) -> list:
-        children = set()
-
         _input = some_input.lower().strip()
-        for key in self._d_parents:
-            for value in self._d_parents[key]:
-                if value.lower().strip() == _input:
-                    children.add(key)
-
-        return sorted(children)
+        children = self._lowercase_children()
+        if _input in children:
+            return sorted(children[_input])
+        return []
 
     def descendants(self,
                     some_input: str) -> list:
-        results = set()
-
-        def _children(value: str):
-            if value != some_input:
-                results.add(value)
-            for parent in self.children(value):
-                _children(parent)
-
-        _children(some_input)
-        return sorted(results)
+        return sorted(self._descendants(some_input) - {some_input})
 
     def has_descendant(self,
                        some_input: str,
                        some_descendant: str) -> bool:
+        if self._d_lowercase_descendants is None:
+            self._d_lowercase_descendants = {}
+        if some_input not in self._d_lowercase_descendants:
+            self._d_lowercase_descendants[some_input] = frozenset(
+                [x.lower().strip() for x in self._descendants(some_input) - {some_input} if x])
+
         _descendant = some_descendant.lower().strip()
-        return _descendant in [x.lower().strip()
-                               for x in self.descendants(some_input) if x]
+        return _descendant in self._d_lowercase_descendants[some_input]
 
     def has_ancestor(self,
                      some_input: str,
                      some_ancestor: str) -> bool:
+        if self._d_lowercase_ancestors is None:
+            self._d_lowercase_ancestors = {}
+        if some_input not in self._d_lowercase_ancestors:
+            self._d_lowercase_ancestors[some_input] = frozenset(
+                [x.lower().strip() for x in self._ancestors(some_input) - {some_input} if x])
+
         _ancestor = some_ancestor.lower().strip()
-        return _ancestor in [x.lower().strip()
-                             for x in self.ancestors(some_input) if x]
+        return _ancestor in self._d_lowercase_ancestors[some_input]
 
     def has_ancestor_from_list(self,
                                some_input: str,
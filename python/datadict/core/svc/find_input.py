@@ -36,7 +36,7 @@ class FindInput(BaseObject):
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1582
         """
         BaseObject.__init__(self, __name__)
-        from datadict.core.svc import FindEntity
+        from datadict.core.svc import OntologyRegistry
         from datadict.core.svc import LoadStopWords
 
         self._is_debug = is_debug
@@ -45,14 +45,14 @@ class FindInput(BaseObject):
         self._gowords = self._gowords()
         self._synonyms = self._load_syns()
         self._stopwords = LoadStopWords(is_debug=is_debug).load()
-        self._entity_finder = FindEntity(is_debug=is_debug,
-                                         ontology_name=ontology_name)
+        self._entity_finder = OntologyRegistry(is_debug=is_debug,
+                                               ontology_name=ontology_name).entity()
 
     def _load_syns(self):
-        from datadict.core.svc import FindSynonym
+        from datadict.core.svc import OntologyRegistry
 
-        syn_finder = FindSynonym(is_debug=self._is_debug,
-                                 ontology_name=self._ontology_name)
+        syn_finder = OntologyRegistry(is_debug=self._is_debug,
+                                      ontology_name=self._ontology_name).synonyms()
         return syn_finder.all(lower=True,
                               keep_regexp=False,
                               transform_spans=True)
@@ -2,6 +2,8 @@
 # -*- coding: UTF-8 -*-
 
 
+from collections.abc import Mapping
+
 from base import BaseObject
 from base import MandatoryParamError
 
@@ -9,6 +11,14 @@ from base import MandatoryParamError
 class FindRelationships(BaseObject):
     """ a single API for finding any relationship of any type across the knowledge base """
 
+    # the relationship functions (of a single token) supported by 'lookup-many'
+    REL_TYPES = frozenset(['ancestors', 'children', 'defined_by', 'defines',
+                           'has_part', 'has_version', 'implied_by', 'implies',
+                           'owned_by', 'owns', 'parent_of', 'parents', 'part_of',
+                           'producedBy', 'produces', 'referenced_by', 'references',
+                           'references_transitive', 'required_by', 'requires',
+                           'runsOn', 'see_also', 'similar_to', 'version_of'])
+
     def __init__(self,
                  ontology_name: str = 'base',
                  is_debug: bool = False):
@@ -44,32 +54,36 @@ class FindRelationships(BaseObject):
             craig.trim@ibm.com
             *   load dictionaries by ontology name
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1582
+        Updated:
+            18-Oct-2026
+            *   use the normalized forward/reverse adjacency maps of the 'relationship-store'
+                instead of scanning each relationship dictionary per query
+            *   add 'lookup-many' function
         """
         BaseObject.__init__(self, __name__)
-        from datadict import FindEntity
-        from datadict.core.os import the_references_dict
-        from datadict.core.dmo import DictionaryLoader
+        from datadict import OntologyRegistry
+        from datadict.core.dmo import RelationshipStore
 
         self.d_cache = {}
-        self.entity_finder = FindEntity(is_debug=is_debug,
-                                        ontology_name=ontology_name)
+        self.entity_finder = OntologyRegistry(is_debug=is_debug,
+                                              ontology_name=ontology_name).entity()
 
-        self._loader = DictionaryLoader(is_debug=is_debug,
+        self._store = RelationshipStore(is_debug=is_debug,
                                         ontology_name=ontology_name)
 
-        self.d_references = the_references_dict
-        self.d_parents = self._loader.taxonomy().parents()
-        self.d_see_also = self._loader.synonyms().seeAlso()
-        self.d_owns = self._loader.relationships().owns()
-        self.d_parts = self._loader.relationships().parts()
-        self.d_implies = self._loader.relationships().implies()
-        self.d_defines = self._loader.relationships().defines()
-        self.d_requires = self._loader.relationships().requires()
-        self.d_versions = self._loader.relationships().versions()
-        self.d_runson = self._loader.relationships().runsOn()
-        self.d_produces = self._loader.relationships().produces()
-        self.d_similarity = self._loader.relationships().similarity()
-        self.d_infinitive = self._loader.relationships().infinitive()
+        self.d_references = self._store.dict("references")
+        self.d_parents = self._store.dict("parents")
+        self.d_see_also = self._store.dict("see_also")
+        self.d_owns = self._store.dict("owns")
+        self.d_parts = self._store.dict("parts")
+        self.d_implies = self._store.dict("implies")
+        self.d_defines = self._store.dict("defines")
+        self.d_requires = self._store.dict("requires")
+        self.d_versions = self._store.dict("versions")
+        self.d_runson = self._store.dict("runson")
+        self.d_produces = self._store.dict("produces")
+        self.d_similarity = self._store.dict("similarity")
+        self.d_infinitive = self._store.dict("infinitive")
 
     @staticmethod
     def _cleanse(some_token: str) -> str:
@@ -77,29 +91,56 @@ class FindRelationships(BaseObject):
 
     def _forward_relationship(self,
                               some_token: str,
-                              some_dict: dict) -> list:
-        some_token = self._cleanse(some_token)
-        for key in some_dict:
-            if self._cleanse(key) == some_token:
-                return some_dict[key]
-        return []
+                              rel_name: str) -> list:
+        return self._store.forward(rel_name, some_token)
 
     def _reverse_relationship(self,
                               some_token: str,
-                              some_dict: dict) -> list:
-        s = set()
-        some_token = self._cleanse(some_token)
-        for key in some_dict:
-            for value in some_dict[key]:
-                if self._cleanse(value) == some_token:
-                    s.add(key)
-        return sorted(s)
+                              rel_name: str) -> list:
+        return self._store.reverse(rel_name, some_token)
+
+    def lookup_many(self,
+                    tags: list,
+                    rel_types: list) -> dict:
+        """
+        Purpose:
+            Perform multiple relationship queries for multiple tags in a single call
+        Sample Input:
+            tags        ['Python', 'Db2']
+            rel_types   ['parents', 'similar_to']
+        Sample Output:
+            {   'Python':   {   'parents':      ['Programming Language'],
+                                'similar_to':   [] },
+                'Db2':      {   'parents':      ['Database'],
+                                'similar_to':   ['Db2 Database'] }}
+        :param tags:
+            a list of tags (1..*)
+        :param rel_types:
+            a list of relationship function names on this class (see REL_TYPES)
+            e.g., 'parents', 'part_of', 'produces', 'producedBy', 'runsOn', 'similar_to'
+        :return:
+            a dictionary keyed by tag then by relationship type
+        """
+        functions = {}
+        for rel_type in rel_types:
+            if rel_type not in self.REL_TYPES:
+                raise NotImplementedError(f"Unrecognized Relationship Type: {rel_type}")
+            functions[rel_type] = getattr(self, rel_type)
+
+        d_results = {}
+        for tag in tags:
+            if tag in d_results:
+                continue
+            d_results[tag] = {rel_type: functions[rel_type](tag)
+                              for rel_type in rel_types}
+
+        return d_results
 
     @staticmethod
     def _all_relationships(some_dict: dict,
                            bidirectional: bool = False) -> dict:
 
-        if type(some_dict) != dict:
+        if not isinstance(some_dict, Mapping):
             raise MandatoryParamError("\n".join([
                 "Incorrect Datatype Parameter",
                 "\tExpected: dict",
@@ -218,7 +259,7 @@ class FindRelationships(BaseObject):
             either the infinitive form of the token or the token itself
         """
         results = self._forward_relationship(some_token,
-                                             self.d_infinitive)
+                                             "infinitive")
         if results and len(results):
             return results[0]
         return some_token
@@ -243,9 +284,9 @@ class FindRelationships(BaseObject):
 
         if bidirectional:
             [results.add(x) for x in self._forward_relationship(some_token,
-                                                                self.d_see_also)]
+                                                                "see_also")]
         [results.add(x) for x in self._reverse_relationship(some_token,
-                                                            self.d_see_also)]
+                                                            "see_also")]
 
         results = [x for x in results if x != some_token]
         return sorted(results)
@@ -280,7 +321,7 @@ class FindRelationships(BaseObject):
         :return:
         """
         results = self._forward_relationship(some_token,
-                                             self.d_implies)
+                                             "implies")
         if not common_implications:
             return results
 
@@ -293,7 +334,7 @@ class FindRelationships(BaseObject):
     def implied_by(self,
                    some_token: str) -> list:
         return self._reverse_relationship(some_token,
-                                          self.d_implies)
+                                          "implies")
 
     def all_implies(self,
                     bidirectional: bool = False) -> dict:
@@ -307,12 +348,12 @@ class FindRelationships(BaseObject):
     def requires(self,
                  some_token: str) -> list:
         return self._forward_relationship(some_token,
-                                          self.d_requires)
+                                          "requires")
 
     def required_by(self,
                     some_token: str) -> list:
         return self._reverse_relationship(some_token,
-                                          self.d_requires)
+                                          "requires")
 
     def all_requires(self,
                      bidirectional: bool = False) -> dict:
@@ -326,7 +367,7 @@ class FindRelationships(BaseObject):
     def runsOn(self,
                some_token: str) -> list:
         return self._forward_relationship(some_token,
-                                          self.d_runson)
+                                          "runson")
 
     def all_runsOn(self,
                    bidirectional: bool = False) -> dict:
@@ -340,12 +381,12 @@ class FindRelationships(BaseObject):
     def produces(self,
                  some_token: str) -> list:
         return self._forward_relationship(some_token,
-                                          self.d_produces)
+                                          "produces")
 
     def producedBy(self,
                    some_token: str) -> list:
         return self._reverse_relationship(some_token,
-                                          self.d_produces)
+                                          "produces")
 
     def all_produces(self,
                      bidirectional: bool = False) -> dict:
@@ -359,12 +400,12 @@ class FindRelationships(BaseObject):
     def has_version(self,
                     some_token: str) -> list:
         return self._forward_relationship(some_token,
-                                          self.d_versions)
+                                          "versions")
 
     def version_of(self,
                    some_token: str) -> list:
         return self._reverse_relationship(some_token,
-                                          self.d_versions)
+                                          "versions")
 
     def all_versions(self,
                      bidirectional: bool = False) -> dict:
@@ -454,7 +495,7 @@ class FindRelationships(BaseObject):
         """
         some_token = some_token.replace('_', ' ')  # GIT-1367-16010583
         return self._forward_relationship(some_token,
-                                          self.d_parents)
+                                          "parents")
 
     def ancestors(self,
                   some_token: str) -> list:
@@ -522,7 +563,7 @@ class FindRelationships(BaseObject):
                                 (e.g., 'Windows, 'RedHat Linux', 'Ubuntu')
         """
         return self._reverse_relationship(some_token,
-                                          self.d_parents)
+                                          "parents")
 
     def all_parents(self,
                     bidirectional: bool = False) -> dict:
@@ -548,13 +589,8 @@ class FindRelationships(BaseObject):
         :return:
             a list of all the direct children of an input entity
         """
-        children = set()
-        for k in self.d_parents:
-            for v in self.d_parents[k]:
-                if v == some_token:
-                    children.add(k)
-
-        return sorted(children)
+        return self._store.reverse("parents", some_token,
+                                   normalize=False)
 
     """ ****************************************
                     PARTONOMY
@@ -563,12 +599,12 @@ class FindRelationships(BaseObject):
     def has_part(self,
                  some_token: str) -> list:
         return self._forward_relationship(some_token,
-                                          self.d_parts)
+                                          "parts")
 
     def part_of(self,
                 some_token: str) -> list:
         return self._reverse_relationship(some_token,
-                                          self.d_parts)
+                                          "parts")
 
     def all_parts(self,
                   bidirectional: bool = False) -> dict:
@@ -609,7 +645,7 @@ class FindRelationships(BaseObject):
         """
 
         results = self._forward_relationship(some_token,
-                                             self.d_owns)
+                                             "owns")
         if not include_children:
             return results
 
@@ -640,7 +676,7 @@ class FindRelationships(BaseObject):
             a list of owners        (e.g., ['Microsoft'])
         """
         return self._reverse_relationship(some_token,
-                                          self.d_owns)
+                                          "owns")
 
     def all_owns(self,
                  bidirectional: bool = False) -> dict:
@@ -659,12 +695,12 @@ class FindRelationships(BaseObject):
     def defines(self,
                 some_token: str) -> list:
         return self._forward_relationship(some_token,
-                                          self.d_defines)
+                                          "defines")
 
     def defined_by(self,
                    some_token: str) -> list:
         return self._reverse_relationship(some_token,
-                                          self.d_defines)
+                                          "defines")
 
     def all_defines(self,
                     bidirectional: bool = False) -> dict:
@@ -717,45 +753,44 @@ class FindRelationships(BaseObject):
                    minimum_frequency: int = 2,
                    maximum_zscore: float = 2.0) -> list:
 
+        key = self._store.key("references", some_token)
+        if key is None:
+            return []
+
         some_token = self._cleanse(some_token)
-        for key in self.d_references:
-            if self._cleanse(key) == some_token:
-
-                def _valid(some_tag: str) -> bool:
-                    v = self.d_references[key][some_tag]
-                    if v["z"] > maximum_zscore:
-                        return False
-                    if v["f"] < minimum_frequency:
-                        return False
-                    return True
 
-                references = [x for x in self.d_references[key]
-                              if _valid(x)]
-                return [self.entity_finder.label_or_self(x) for x in references
-                        if self._cleanse(x) != some_token]
+        def _valid(some_tag: str) -> bool:
+            v = self.d_references[key][some_tag]
+            if v["z"] > maximum_zscore:
+                return False
+            if v["f"] < minimum_frequency:
+                return False
+            return True
 
-        return []
+        references = [x for x in self.d_references[key]
+                      if _valid(x)]
+        return [self.entity_finder.label_or_self(x) for x in references
+                if self._cleanse(x) != some_token]
 
     def referenced_by(self,
                       some_token: str,
                       minimum_frequency: int = 5,
                       maximum_zscore: float = 2.0) -> list:
         s = set()
-        some_token = self._cleanse(some_token)
-        for key in self.d_references:
-            for value in self.d_references[key]:
-                if self._cleanse(value) == some_token:
+        for key in self._store.reverse("references", some_token):
+
+            def _valid(some_tag: str) -> bool:
+                v = self.d_references[key][some_tag]
+                if v["zscore"] > maximum_zscore:
+                    return False
+                if v["frequency"] < minimum_frequency:
+                    return False
+                return True
 
-                    def _valid(some_tag: str) -> bool:
-                        v = self.d_references[key][some_tag]
-                        if v["zscore"] > maximum_zscore:
-                            return False
-                        if v["frequency"] < minimum_frequency:
-                            return False
-                        return True
+            [s.add(x) for x in self.d_references[key]
+             if _valid(x)]
 
-                    [s.add(x) for x in self.d_references[key]
-                     if _valid(x)]
+        some_token = self._cleanse(some_token)
 
         s = sorted([self.entity_finder.label_or_self(x) for x in s
                     if self._cleanse(x) != some_token])
@@ -769,9 +804,9 @@ class FindRelationships(BaseObject):
     def similar_to(self,
                    some_token: str) -> list:
         r1 = self._forward_relationship(some_token,
-                                        self.d_similarity)
+                                        "similarity")
         r2 = self._reverse_relationship(some_token,
-                                        self.d_similarity)
+                                        "similarity")
         return sorted(set(r1 + r2))
 
     def all_similar(self,
@@ -232,7 +232,9 @@ class FindSynonym(BaseObject):
     def see_also(self,
                  some_input: str) -> list:
         """
-
+        Updated:
+            18-Oct-2026
+            *   use a lowercase index rather than scanning the see-also dictionary
         :param some_input:
         :return:
         """
@@ -240,9 +242,16 @@ class FindSynonym(BaseObject):
         def _cleanse(a_token: str) -> str:
             return a_token.lower().strip()
 
-        for k in self._d_see_also:
-            if _cleanse(k) == _cleanse(some_input):
-                return self._d_see_also[k]
+        if self.__seealso_lcase is None:
+            self.__seealso_lcase = {}
+            for k in self._d_see_also:
+                _k = _cleanse(k)
+                if _k not in self.__seealso_lcase:  # the first matching key wins
+                    self.__seealso_lcase[_k] = self._d_see_also[k]
+
+        _input = _cleanse(some_input)
+        if _input in self.__seealso_lcase:
+            return self.__seealso_lcase[_input]
         return []
 
     def exists(self,
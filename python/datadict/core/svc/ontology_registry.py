@@ -0,0 +1,171 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import sys
+import time
+from collections.abc import Mapping
+from collections.abc import ValuesView
+
+from base import BaseObject
+
+
+class OntologyRegistry(BaseObject):
+    """ Process-wide Registry of Ontology Finders
+
+        each finder (and the indexes it derives) is built once per ontology per process
+        and shared by every caller; the finders are read-only after warm-up """
+
+    _d_registry = {}
+
+    def __init__(self,
+                 ontology_name: str = 'base',
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   stop rebuilding finders (and their derived indexes) per instance
+        :param ontology_name:
+            the name of the Ontology (e.g., 'base' or 'biotech')
+        """
+        BaseObject.__init__(self, __name__)
+        self._is_debug = is_debug
+        self._ontology_name = ontology_name.lower().strip()
+
+        if self._ontology_name not in self._d_registry:
+            self._d_registry[self._ontology_name] = {}
+
+    def _registry(self) -> dict:
+        return self._d_registry[self._ontology_name]
+
+    def _get(self,
+             key: str,
+             builder):
+        registry = self._registry()
+        if key not in registry:
+            start = time.time()
+            registry[key] = builder()
+            if self._is_debug:
+                self.logger.debug('\n'.join([
+                    "Registered Finder",
+                    f"\tName: {key}",
+                    f"\tOntology Name: {self._ontology_name}",
+                    f"\tTime: {round(time.time() - start, 2)}s"]))
+        return registry[key]
+
+    def entity(self):
+        from datadict import FindEntity
+        return self._get('entity', lambda: FindEntity(is_debug=self._is_debug,
+                                                      ontology_name=self._ontology_name))
+
+    def synonyms(self):
+        from datadict import FindSynonym
+        return self._get('synonyms', lambda: FindSynonym(is_debug=self._is_debug,
+                                                         ontology_name=self._ontology_name))
+
+    def patterns(self):
+        from datadict import FindPatterns
+        return self._get('patterns', lambda: FindPatterns(is_debug=self._is_debug,
+                                                          ontology_name=self._ontology_name))
+
+    def relationships(self):
+        from datadict import FindRelationships
+        return self._get('relationships', lambda: FindRelationships(is_debug=self._is_debug,
+                                                                    ontology_name=self._ontology_name))
+
+    def dimensions(self,
+                   schema: str):
+        from datadict import FindDimensions
+        return self._get(f'dimensions-{schema.lower()}', lambda: FindDimensions(schema=schema,
+                                                                                is_debug=self._is_debug,
+                                                                                ontology_name=self._ontology_name))
+
+    def warm_up(self,
+                schemas: list = None) -> dict:
+        """
+        Purpose:
+            Build every finder and its lazily derived indexes up front
+            this is intended to run once per worker (e.g., before forking or before the first record)
+        :param schemas:
+            an optional list of dimensionality schemas (e.g., ['supply', 'learning'])
+        :return:
+            the memory usage of the registry
+        """
+        start = time.time()
+
+        entity_finder = self.entity()
+        entity_finder.label('')
+        entity_finder.children('')
+        entity_finder.parents('')
+
+        self.synonyms()
+        self.patterns().long_distance()
+        self.relationships()
+
+        if schemas:
+            for schema in schemas:
+                self.dimensions(schema).table()
+
+        d_memory = self.memory_usage()
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Ontology Registry Warm-Up Complete",
+                f"\tOntology Name: {self._ontology_name}",
+                f"\tTotal Memory: {round(sum(d_memory.values()) / 1024 / 1024, 1)}MB",
+                f"\tTime: {round(time.time() - start, 2)}s"]))
+
+        return d_memory
+
+    @staticmethod
+    def _sizeof(obj,
+                seen: set) -> int:
+        """
+        Purpose:
+            Approximate the deep size (in bytes) of an object
+            objects that are shared between finders are only counted once
+            snapshot views only count the view (the mapped file is shared across processes)
+        """
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+
+        size = sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, bool, memoryview)) or obj is None:
+            return size
+
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                size += OntologyRegistry._sizeof(k, seen)
+                size += OntologyRegistry._sizeof(v, seen)
+        elif isinstance(obj, (list, tuple, set, frozenset, ValuesView)):
+            for x in obj:
+                size += OntologyRegistry._sizeof(x, seen)
+        elif isinstance(obj, Mapping):
+            return size
+        elif hasattr(obj, '__dict__'):
+            for k, v in vars(obj).items():
+                if k in ['logger', 'timer']:
+                    continue
+                size += OntologyRegistry._sizeof(v, seen)
+
+        return size
+
+    def memory_usage(self) -> dict:
+        """
+        :return:
+            the approximate size in bytes of each registered finder
+            Sample Output:
+                {   'entity':           48203944,
+                    'patterns':         12039422,
+                    ... }
+        """
+        seen = set()
+
+        # dimension finders share the synonym and relationship finders
+        # so account for the shared finders first
+        def _order(key: str) -> tuple:
+            return key.startswith('dimensions'), key
+
+        return {key: self._sizeof(self._registry()[key], seen)
+                for key in sorted(self._registry(), key=_order)}
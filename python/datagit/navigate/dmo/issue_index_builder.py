@@ -8,6 +8,8 @@ from typing import Optional
 from base import BaseObject
 from datamongo import CendantCollection
 
+QUERY_BATCH_SIZE = 5000
+
 
 class IssueIndexBuilder(BaseObject):
     """ Build an Index of records for a given GitHub Issue
@@ -45,6 +47,10 @@ class IssueIndexBuilder(BaseObject):
             craig.trim@ibm.com
             *   process flow optimizations in pursuit of
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1651
+        Updated:
+            18-Oct-2026
+            *   retrieve each level of the tree with a single query
+                instead of one query per record
         :param is_debug:
             if True     increase log output at DEBUG level
         """
@@ -57,20 +63,34 @@ class IssueIndexBuilder(BaseObject):
                                                   some_collection_name=collection_name)
 
     def _child_records(self,
-                       a_record: dict) -> list:
+                       key_fields: list) -> dict:
+        """
+        Purpose:
+            Retrieve the children of every given record with one '$in' query (per batch)
+        :param key_fields:
+            the key fields of a single level (frontier) of the traversal
+        :return:
+            a dictionary keyed by parent key field with a list of child records
+        """
+        d_children = {}
+
+        for i in range(0, len(key_fields), QUERY_BATCH_SIZE):
+            query = {"key_field_parent": {"$in": key_fields[i:i + QUERY_BATCH_SIZE]}}
+            children = self.__collection.find_by_query(query)
+            if not children:
+                continue
+
+            for child in children:
+                parent = child['key_field_parent']
+                if parent not in d_children:
+                    d_children[parent] = []
+                d_children[parent].append(child)
 
-        children = self.__collection.by_field(field_name="key_field_parent",
-                                             field_value=a_record['key_field'])
-        if not children:
-            return []
-        return children
+        return d_children
 
     def process(self,
                 key_field: str) -> Optional[dict]:
 
-        d_index = {}
-        s_unique = set()
-
         issue = self.__collection.by_key_field(key_field)
         if not issue:
             self.logger.warning('\n'.join([
@@ -79,24 +99,43 @@ class IssueIndexBuilder(BaseObject):
                 f"\tCollection: {self.__collection.collection_name}"]))
             return None
 
-        def _iter_children(a_record: dict) -> None:
+        # Step: retrieve the tree one level at a time
+        d_children = {}
+        frontier = [issue['key_field']]
+        s_visited = {issue['key_field']}
+        total_levels = 0
+
+        while frontier:
+            total_levels += 1
+            d_level = self._child_records(frontier)
+            d_children.update(d_level)
+
+            frontier = []
+            for children in d_level.values():
+                for child in children:
+                    if child['key_field'] not in s_visited:
+                        s_visited.add(child['key_field'])
+                        frontier.append(child['key_field'])
+
+        # Step: index the records in depth-first order
+        d_index = {}
+        s_unique = {issue['key_field']}
+        stack = [issue]
 
+        while stack:
+            a_record = stack.pop()
             d_index[a_record['key_field']] = a_record
-            s_unique.add(a_record['key_field'])
 
-            children = self._child_records(a_record)
-            children = [child for child in children
+            children = [child for child in d_children.get(a_record['key_field'], [])
                         if child['key_field'] not in s_unique]
-
             for child in children:
                 s_unique.add(child['key_field'])
-                _iter_children(child)
-
-        _iter_children(issue)
+            stack.extend(reversed(children))
 
         if self._is_debug:
             self.logger.debug('\n'.join([
                 f"Index Completed (issue={key_field})",
+                f"\tTotal Levels: {total_levels}",
                 pprint.pformat(d_index, indent=4)]))
 
         return d_index
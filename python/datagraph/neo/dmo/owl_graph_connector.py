@@ -2,8 +2,13 @@
 # -*- coding: UTF-8 -*-
 
 
+import hashlib
+import json
 import os
+import pickle
+import time
 
+import rdflib
 from rdflib import Graph
 from rdflib.namespace import Namespace
 
@@ -13,11 +18,36 @@ from base import MandatoryParamError
 
 
 class OwlGraphConnector(BaseObject):
-    """Loads the Skills Ontology as a Graph into memory"""
+    """Loads the Skills Ontology as a Graph into memory
+
+    a parsed graph is cached
+        1.  in-process (shared by every connector in this process)
+        2.  on disk (as a pickled graph) for subsequent processes
+    each cache entry is keyed by the file path, size and modification time of the ontology
+    so an edited ontology is parsed again
+
+    the cached graph is shared; consumers must not modify it
+
+    the on-disk cache location is
+        $OWL_CACHE_PATH     (if defined)
+        ~/.cache/owlgraph   (otherwise)
+
+    the cache directory must be trusted:
+        a cache file is unpickled, and unpickling a crafted file executes arbitrary code
+        -   the directory is created with owner-only permissions (0700), each file with 0600
+        -   a file is only read if it is owned by the current user, is not writable by others
+            and its header matches the cache key of the ontology
+        these checks catch stale or misplaced files; they do not make a shared directory safe
+    """
+
+    __graphs = {}  # ontology path -> (cache key, graph)
+
+    __cache_magic = b"OWLGRAPH-CACHE-1\n"
 
     def __init__(self,
                  ontology_name: str,
                  some_owl_format: str = "ttl",
+                 use_cache: bool = True,
                  is_debug: bool = True):
         """
         Created:
@@ -27,6 +57,15 @@ class OwlGraphConnector(BaseObject):
             14-Mar-2019
             craig.trim@ibm.com
             *   pass in params from consumer
+        Updated:
+            18-Oct-2026
+            *   cache the parsed graph in-process and on disk
+                rather than reparse the ontology on every call
+            *   only read a cache file whose header matches the cache key;
+                write cache files with owner-only permissions
+        :param use_cache:
+            if True     use (and populate) the in-process and on-disk caches
+            if False    always parse the ontology
         """
         BaseObject.__init__(self, __name__)
         if not ontology_name:
@@ -38,6 +77,8 @@ class OwlGraphConnector(BaseObject):
                 "Ontology Name Unknown",
                 f"Known Configuration: {_config.keys()}"]))
 
+        self._is_debug = is_debug
+        self._use_cache = use_cache
         self._owl_format = some_owl_format
         self._ns_path = _config[ontology_name]["ns"]
         self._owl_path = _config[ontology_name]["path"]
@@ -78,6 +119,129 @@ class OwlGraphConnector(BaseObject):
 
         return g
 
+    def _cache_key(self,
+                   input_path: str) -> str:
+        stat = os.stat(input_path)
+        return '|'.join([os.path.abspath(input_path),
+                         str(stat.st_size),
+                         str(stat.st_mtime_ns),
+                         self._owl_format,
+                         self._ns_prefix,
+                         self._ns_path,
+                         rdflib.__version__])
+
+    @staticmethod
+    def _cache_prefix(input_path: str) -> str:
+        """ all cache files for an ontology path share this prefix """
+        cache_dir = os.environ.get("OWL_CACHE_PATH",
+                                   os.path.join(os.path.expanduser("~"), ".cache", "owlgraph"))
+        digest = hashlib.sha1(os.path.abspath(input_path).encode('utf-8')).hexdigest()[:12]
+        return os.path.join(cache_dir,
+                            f"{os.path.basename(input_path)}.{digest}.")
+
+    def _cache_path(self,
+                    input_path: str,
+                    cache_key: str) -> str:
+        digest = hashlib.sha1(cache_key.encode('utf-8')).hexdigest()
+        return f"{self._cache_prefix(input_path)}{digest}.pickle"
+
+    def _cache_header(self,
+                      cache_key: str) -> bytes:
+        """ the magic line and the (json-encoded) cache key line that precede the pickle """
+        return self.__cache_magic + json.dumps(cache_key).encode('utf-8') + b"\n"
+
+    @staticmethod
+    def _is_trusted(cache_path: str) -> bool:
+        """ the file is owned by the current user and is not writable by group or others """
+        if not hasattr(os, "getuid"):
+            return True
+        stat = os.stat(cache_path)
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    def _read_cache(self,
+                    cache_path: str,
+                    cache_key: str) -> Graph or None:
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            if not self._is_trusted(cache_path):
+                raise ValueError("Untrusted Owner or Permissions")
+
+            header = self._cache_header(cache_key)
+            with open(cache_path, 'rb') as f:
+                if f.read(len(header)) != header:
+                    raise ValueError("Cache Key Mismatch")
+                return pickle.load(f)
+        except Exception as e:
+            self.logger.warning('\n'.join([
+                "Unreadable Graph Cache (the ontology will be parsed)",
+                f"\tPath: {cache_path}",
+                f"\tError: {e}"]))
+            return None
+
+    def _write_cache(self,
+                     input_path: str,
+                     cache_path: str,
+                     cache_key: str,
+                     g: Graph) -> None:
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._cache_header(cache_key))
+                pickle.dump(g, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)  # concurrent writers never expose a partial file
+
+            # remove the caches of prior versions of this ontology
+            prefix = os.path.basename(self._cache_prefix(input_path))
+            for file_name in os.listdir(cache_dir):
+                if file_name.startswith(prefix) and file_name.endswith(".pickle") and \
+                        file_name != os.path.basename(cache_path):
+                    os.remove(os.path.join(cache_dir, file_name))
+
+        except Exception as e:
+            self.logger.warning('\n'.join([
+                "Graph Cache Not Written",
+                f"\tPath: {cache_path}",
+                f"\tError: {e}"]))
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _load_cached(self,
+                     input_path: str) -> Graph:
+        start = time.time()
+
+        cache_key = self._cache_key(input_path)
+        if input_path in self.__graphs and self.__graphs[input_path][0] == cache_key:
+            return self.__graphs[input_path][1]
+
+        cache_path = self._cache_path(input_path, cache_key)
+
+        g = self._read_cache(cache_path, cache_key)
+        source = "Disk Cache"
+
+        if g is None:
+            g = self._load(input_path)
+            self._write_cache(input_path, cache_path, cache_key, g)
+            source = "Ontology"
+
+        self.__graphs[input_path] = (cache_key, g)
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                f"Loaded Ontology Graph (source={source})",
+                f"\tOWL Path: {input_path}",
+                f"\tCache Path: {cache_path}",
+                f"\tTotal Triples: {len(g)}",
+                f"\tTotal Time: {round(time.time() - start, 2)}s"]))
+
+        return g
+
     def process(self) -> Graph:
         """ load the ontology from disk as an RDF Graph """
-        return self._load(self._ontology_input_path())
+        if not self._use_cache:
+            return self._load(self._ontology_input_path())
+        return self._load_cached(self._ontology_input_path())
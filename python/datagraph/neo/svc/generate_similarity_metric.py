@@ -2,7 +2,11 @@
 # -*- coding: UTF-8 -*-
 
 
+import numpy as np
+from py2neo import Subgraph
 from py2neo import Transaction
+from scipy.sparse import csr_matrix
+from scipy.sparse import triu
 
 from base import BaseObject
 from base import MandatoryParamError
@@ -22,6 +26,10 @@ class GenerateSimilarityMetric(BaseObject):
             19-Mar-2019
             craig.trim@ibm.com
             *   refactored out of 'load-neo-from-manifest-2'
+        Updated:
+            18-Oct-2026
+            *   generate candidate pairs from a token inverted index
+                and create the relationships in a single batched write
         :param some_tx:
             an active neo transaction
         :param some_graph_context:
@@ -63,39 +71,67 @@ class GenerateSimilarityMetric(BaseObject):
             return _to_categorical()
         return "is-similar"
 
+    @staticmethod
+    def _token_overlap(tags: list) -> list:
+        """
+        Purpose:
+            Count the tokens shared by each pair of tags
+            only tags that share a token (via the token inverted index) are ever paired
+        :param tags:
+            a list of tags
+        :return:
+            a list of (i, j, total) tuples with i < j and more than one shared token
+        """
+        d_tokens = {}  # token -> column
+        rows = []
+        cols = []
+        for i, tag in enumerate(tags):
+            for token in set(tag.split(" ")):
+                if token not in d_tokens:
+                    d_tokens[token] = len(d_tokens)
+                rows.append(i)
+                cols.append(d_tokens[token])
+
+        # (tags x tokens) incidence matrix; the product with its transpose counts shared tokens
+        incidence = csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                               shape=(len(tags), len(d_tokens)))
+        overlap = triu(incidence @ incidence.T, k=1).tocoo()
+
+        mask = overlap.data > 1
+        pairs = sorted(zip(overlap.row[mask].tolist(),
+                           overlap.col[mask].tolist(),
+                           overlap.data[mask].tolist()))
+        return pairs
+
     def _similarity_metric(self,
                            d_tags: dict):
+        tags = list(d_tags)
+        if len(tags) < 2:
+            return
 
-        # create similarity metric
-        s_complete = set()
-
-        for tag1 in d_tags:
-            for tag2 in d_tags:
-                if tag1 == tag2:
-                    continue
-
-                total = len(set(tag1.split(" ")).intersection(set(tag2.split(" "))))
-                if total > 1:
+        relationships = []
+        for i, j, total in self._token_overlap(tags):
+            tag1 = tags[i]
+            tag2 = tags[j]
 
-                    # prevent dupes (e.g. bidirectional flows)
-                    key = "".join(sorted({tag1, tag2}))
-                    if key in s_complete:
-                        continue
+            _s = self.graph_context.find_or_create_node(self.tx,
+                                                        tag1,
+                                                        d_tags[tag1])
+            _p = self._relationship_name(total)
 
-                    s_complete.add(key)
+            _o = self.graph_context.find_or_create_node(self.tx,
+                                                        tag2,
+                                                        d_tags[tag2])
 
-                    _s = self.graph_context.find_or_create_node(self.tx,
-                                                                tag1,
-                                                                d_tags[tag1])
-                    _p = self._relationship_name(total)
+            relationships.append(NeoUtils.define_relationship(_s, _p, _o,
+                                                              activity="Probabilistic Relationship",
+                                                              entity="Vector Space"))
 
-                    _o = self.graph_context.find_or_create_node(self.tx,
-                                                                tag2,
-                                                                d_tags[tag2])
+        if relationships:
+            self.tx.create(Subgraph(relationships=relationships))
 
-                    NeoUtils.define_relationship(_s, _p, _o,
-                                                 activity="Probabilistic Relationship",
-                                                 entity="Vector Space")
+        self.logger.debug(f"Generated Similarity Metric "
+                          f"(tags={len(tags)}, relationships={len(relationships)})")
 
     def _generate_graph_dictionary(self) -> dict:
         """
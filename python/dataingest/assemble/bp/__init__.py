@@ -1 +1 @@
-from .assemble_api import AssembleAPI, call_assemble_api
+from .assemble_api import AssembleAPI, call_assemble_api, partition_assemble_sources
@@ -16,7 +16,8 @@ class AssembleAPI(BaseObject):
                  activity_name: str,
                  single_collection: str='',
                  first: int=-1,
-                 last: int=-1):
+                 last: int=-1,
+                 id_range: tuple=None):
         """
         Created:
             12-Mar-2019
@@ -25,6 +26,9 @@ class AssembleAPI(BaseObject):
             10-May-2019
             craig.trim@ibm.com
             *   updated logging
+        Updated:
+            18-Oct-2026
+            *   added 'id-range' and get_partitions()
         """
         from dataingest import AssembleManifestData
         BaseObject.__init__(self, __name__)
@@ -33,7 +37,8 @@ class AssembleAPI(BaseObject):
                                               single_collection,
                                               first,
                                               last,
-                                              is_debug=IS_DEBUG)
+                                              is_debug=IS_DEBUG,
+                                              id_range=id_range)
 
     def assemble(self):
 
@@ -49,32 +54,59 @@ class AssembleAPI(BaseObject):
     def get_sources(self):
         return self.assembler.source_collections()
 
+    def get_partitions(self, chunk_size):
+        return self.assembler.source_partitions(chunk_size)
+
     def index_target(self):
         return self.assembler.index_target()
 
 
 
-def call_assemble_api(manifest_name, activity_name, action, single_collection, first, last):
-    first = int(first) if first else -1
-    last = int(last) if last else -1
+def call_assemble_api(manifest_name, activity_name, action, single_collection, first, last, by_id_range=False):
+    """
+    :param first:
+        the first record offset (or the inclusive lower '_id' bound if by_id_range)
+    :param last:
+        the last record offset (or the exclusive upper '_id' bound if by_id_range)
+    """
+    id_range = None
+    if by_id_range:
+        id_range = (first, last)
+        first = last = -1
+    else:
+        first = int(first) if first else -1
+        last = int(last) if last else -1
     print(f"API Parameters "
           f"(manifest-name={manifest_name}, "
           f"activity-name={activity_name}, "
           f"action={action}, "
           f"single_collection={single_collection}, "
-          f"first={first}, last={last})")
+          f"first={first}, last={last}, "
+          f"id-range={id_range})")
 
     if manifest_name.startswith("assemble"):
         api = AssembleAPI(manifest_name,
                           activity_name,
                           single_collection,
                           first,
-                          last)
+                          last,
+                          id_range)
         return getattr(api, action)()
     else:
         raise ValueError(f"Unrecognized Manifest: {manifest_name}")
 
 
+def partition_assemble_sources(manifest_name, activity_name, chunk_size):
+    """
+    :return:
+        a list of (collection-name, [(lower, upper), ...]) '_id' ranges
+    """
+    if not manifest_name.startswith("assemble"):
+        raise ValueError(f"Unrecognized Manifest: {manifest_name}")
+    api = AssembleAPI(manifest_name, activity_name)
+    return api.get_partitions(int(chunk_size))
+
+
 def main(manifest_name, activity_name):
     call_assemble_api(manifest_name, activity_name, 'assemble', '' , -1, -1)
 
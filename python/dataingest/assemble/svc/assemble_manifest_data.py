@@ -45,7 +45,8 @@ class AssembleManifestData(BaseObject):
                  single_collection: str='',
                  first: int=-1,
                  last: int=-1,
-                 is_debug: bool = False):
+                 is_debug: bool = False,
+                 id_range: tuple = None):
         """
         Created:
             12-Mar-2019
@@ -93,6 +94,10 @@ class AssembleManifestData(BaseObject):
             xavier.verges@es.ibm.com
             *   use $addToSet instead of $push, to prevent re-adding the same fields
             *   allow to ignore field traceability (required for badges)
+        Updated:
+            18-Oct-2026
+            *   a single collection can be assembled by '_id' range
+                (see CendantCollection.partition)
         :param some_manifest_name:
             the name of the manifest
         :param some_activity_name:
@@ -114,7 +119,10 @@ class AssembleManifestData(BaseObject):
         self._single_collection = single_collection
         self._first = first
         self._last = last
+        self._id_range = id_range
         self._log_hint = '' if not single_collection else f'{single_collection}_{first}-{last} '
+        if single_collection and id_range:
+            self._log_hint = f'{single_collection}_{id_range[0]}-{id_range[1]} '
 
     def _bulk_insert_threshold(self,
                                default_value: int = 1000):
@@ -140,6 +148,17 @@ class AssembleManifestData(BaseObject):
             sources.append((name, value['collection'].count()))
         return sources
 
+    def source_partitions(self,
+                          chunk_size: int) -> list:
+        """
+        :return:
+            a list of (collection-name, [(lower, upper), ...]) '_id' ranges
+        """
+        partitions = []
+        for name, value in self._source_collections().items():
+            partitions.append((name, value['collection'].partition(chunk_size=chunk_size)))
+        return partitions
+
     def flush_target(self, target_collection=None) -> None:
         if not target_collection:
             target_collection = self._target_collection()
@@ -199,7 +218,10 @@ class AssembleManifestData(BaseObject):
 
 
             d_records = {}
-            if self._first < 0:
+            if self._id_range:
+                records = collection.by_id_range(*self._id_range)
+                limit = len(records)
+            elif self._first < 0:
                 records = collection.all()
                 limit = collection.count()
             else:
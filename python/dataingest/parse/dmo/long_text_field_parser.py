@@ -12,7 +12,7 @@ class LongTextFieldParser(BaseObject):
     """  Parse a field classified as 'long-text'
     """
 
-    # __text_parser = TextParser()
+    _text_parser = None
 
     def __init__(self,
                  len_threshold: int = 5,
@@ -28,6 +28,10 @@ class LongTextFieldParser(BaseObject):
             craig.trim@ibm.com
             *   tag iteration defect fix
                 https://github.ibm.com/-cdo/unstructured-analytics/issues/894#issuecomment-14536883
+        Updated:
+            18-Oct-2026
+            *   share a single text parser per process (rather than one per sentence)
+            *   tag every sentence of one-or-more fields in a single batch
         :param len_threshold:
             the minimum length of a text field for parsing to be activated
         :param is_debug:
@@ -54,45 +58,41 @@ class LongTextFieldParser(BaseObject):
             return False
         return True
 
-    def _parse_sentence(self,
-                        a_sentence: str) -> dict:
+    def _parser(self) -> TextParser:
+        if not LongTextFieldParser._text_parser:
+            LongTextFieldParser._text_parser = TextParser(is_debug=self._is_debug)
+        return LongTextFieldParser._text_parser
+
+    def _parse_sentences(self,
+                         sentences: list) -> dict:
         """
-        :param a_sentence:
-            an unstructured input sentence
+        :param sentences:
+            unstructured input sentences (duplicates are parsed once)
         :return:
-            a parser service result
-            of primary interest are the tags annotated (parsed) in the sentence
+            a dictionary of parser service results keyed by sentence
+            of primary interest are the tags annotated (parsed) in each sentence
         """
         _start = time.time()
 
-        text_parser = TextParser(is_debug=self._is_debug)
-        _svcresult = text_parser.process(a_sentence,
-                                         use_profiler=self._is_debug)
+        d_svcresults = self._parser().process_batch(sentences)
         if self._is_debug:
             parse_time = time.time() - _start
-            self.logger.debug(f"Text Parser: {parse_time}s")
+            self.logger.debug(f"Text Parser: {parse_time}s "
+                              f"(sentences={len(sentences)}, unique={len(d_svcresults)})")
 
-        return _svcresult
+        return d_svcresults
 
-    def process(self,
-                parse_field: dict):
-        """
-        :param parse_field:
-        :return:
-            an augmented parse field
-        """
+    def _merge(self,
+               parse_field: dict,
+               sentences: list,
+               d_svcresults: dict) -> dict:
         normalized = []
         supervised = set()
         unsupervised = set()
 
-        # Step: Filter out small sentences
-        sentences = [sentence for sentence in parse_field["value"]
-                     if self._is_valid(sentence)]
-
-        # Step: Parse each sentence in the record
         for sentence in sentences:
 
-            svcresult = self._parse_sentence(sentence)
+            svcresult = d_svcresults.get(sentence)
             if not svcresult:
                 continue
 
@@ -116,3 +116,40 @@ class LongTextFieldParser(BaseObject):
         parse_field["normalized"] = normalized
 
         return parse_field
+
+    def process_many(self,
+                     parse_fields: list) -> list:
+        """
+        Purpose:
+            Parse one-or-more fields (e.g., every long-text field in a chunk of records)
+            the valid sentences of all the fields are tagged as a single batch
+        :param parse_fields:
+            a list of long-text fields
+        :return:
+            the augmented parse fields (in input order)
+        """
+        # Step: Filter out small sentences
+        d_sentences = {}
+        for i, parse_field in enumerate(parse_fields):
+            d_sentences[i] = [sentence for sentence in parse_field["value"]
+                              if self._is_valid(sentence)]
+
+        # Step: Parse every sentence in the batch
+        all_sentences = []
+        for sentences in d_sentences.values():
+            all_sentences += sentences
+        d_svcresults = self._parse_sentences(all_sentences)
+
+        return [self._merge(parse_field=parse_field,
+                            sentences=d_sentences[i],
+                            d_svcresults=d_svcresults)
+                for i, parse_field in enumerate(parse_fields)]
+
+    def process(self,
+                parse_field: dict):
+        """
+        :param parse_field:
+        :return:
+            an augmented parse field
+        """
+        return self.process_many([parse_field])[0]
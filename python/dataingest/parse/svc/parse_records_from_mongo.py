@@ -55,6 +55,11 @@ class ParseRecordsFromMongo(BaseObject):
             xavier.verges@es.ibm.com
             *   check that a record is not already saved before processing
                 (similar to what IncrementalRecordRetriever did)
+        Updated:
+            18-Oct-2026
+            *   resolve the already saved records with one bulk query
+            *   parse records in batches of 'threshold';
+                the long-text sentences of a batch are tagged together
         """
         BaseObject.__init__(self, __name__)
         from dataingest.parse.dmo import BadgeFieldParser
@@ -71,40 +76,48 @@ class ParseRecordsFromMongo(BaseObject):
 
         self.logger.debug("Instantiate ParseRecordsFromMongo")
 
-    def _handle_record(self,
-                       record: dict) -> dict:
-        _fields = []
+    def _handle_records(self,
+                        records: list) -> list:
+        """
+        Purpose:
+            Parse the fields of a batch of records
+            the long-text fields of every record are tagged together
+            so that sentences shared across records are only tagged once
+        """
+        long_text_fields = []
+        for record in records:
+            long_text_fields += [field for field in record["fields"]
+                                 if field["type"] == "long-text"]
 
-        ctr = 0
-        total_fields = len(record["fields"])
+        if self._is_debug:
+            self.logger.debug(f"Field Processing "
+                              f"(records={len(records)}, "
+                              f"long-text-fields={len(long_text_fields)})")
 
-        for field in record["fields"]:
+        parsed = {id(field): result for field, result in
+                  zip(long_text_fields, self._text_field_parser.process_many(long_text_fields))}
 
-            ctr += 1
-            if self._is_debug:
-                if ctr % 10 == 0:
-                    self.logger.debug(f"Field Processing "
-                                      f"({ctr} - {total_fields})")
+        for record in records:
+            _fields = []
+            for field in record["fields"]:
 
-            def _handle_field():
-                if field["type"] == "badge":
-                    return self._badge_field_parser.process(badge_field=field)
-                elif field["type"] == "long-text":
-                    return self._text_field_parser.process(parse_field=field)
-                return field
+                def _handle_field():
+                    if field["type"] == "badge":
+                        return self._badge_field_parser.process(badge_field=field)
+                    elif field["type"] == "long-text":
+                        return parsed[id(field)]
+                    return field
 
-            _fields.append(_handle_field())
+                _fields.append(_handle_field())
 
-        record["fields"] = _fields
+            record["fields"] = _fields
 
-        return record
+        return records
 
     def process(self,
                 threshold: int = 25) -> int:
 
         process_start = time.time()
-        ctr = 0
-        _records = []
 
         total_persisted = 0
         total_skipped = 0
@@ -116,8 +129,11 @@ class ParseRecordsFromMongo(BaseObject):
         def log_ids(records):
             self.logger.error(f'insert_many error for records {[record["_id"] for record in records]}')
 
+        persisted_ids = self._target_collection.existing_ids(
+            [x['key_field'] for x in self._source_records])
+
         def is_record_already_persisted(id):
-            return self._target_collection.collection.count_documents({'_id': id}) != 0
+            return id in persisted_ids
 
         d_records: Dict[int, list] = {}
         for source_record in self._source_records:
@@ -131,49 +147,39 @@ class ParseRecordsFromMongo(BaseObject):
                               f"total-fields={total_fields}, "
                               f"total-records={len(d_records[total_fields])})")
 
+            source_records = []
             for source_record in d_records[total_fields]:
-
                 if is_record_already_persisted(source_record['key_field']):
                     total_skipped += 1
                     continue
+                source_records.append(source_record)
 
-                ctr += 1
+            # records are parsed (and persisted) in batches of 'threshold'
+            for i in range(0, len(source_records), threshold):
                 start = time.time()
 
-                source_record = self._sentencizer.process(source_record)
-                record = self._handle_record(source_record)
+                records = [self._sentencizer.process(x)
+                           for x in source_records[i:i + threshold]]
+                records = self._handle_records(records)
 
-                record_time = round((time.time() - start), 2)
+                batch_time = round((time.time() - start), 2)
                 total_time = round((time.time() - process_start), 2)
-                self.logger.debug(f"Handle Record. "
-                                  f"Still not persisted: {ctr}. Already persisted: {total_persisted}. "
+                self.logger.debug(f"Handle Records. "
+                                  f"Batch: {len(records)}. Already persisted: {total_persisted}. "
                                   f"Skipped: {total_skipped}. Total records: {total_records}. "
-                                  f"Time: record->{record_time}s total->{total_time}. Fields: {total_fields}. "
+                                  f"Time: batch->{batch_time}s total->{total_time}. Fields: {total_fields}. "
                                   f"Collection: {self._target_collection.collection_name}")
 
-                record["_id"] = record["key_field"]
-                record["meta"] = {"seconds_parsing": round(record_time)}
-
-                _records.append(record)
-
-                if ctr >= threshold and len(_records):
-                    ctr = 0
-
-                    self._target_collection.insert_many(_records,
-                                                        ordered_but_slower=False,
-                                                        augment_record=False,
-                                                        max_attempts=3,
-                                                        failure_logger=log_ids)
-                    total_persisted += len(_records)
-                    _records = []
-
-        if len(_records):
-            self._target_collection.insert_many(_records,
-                                                ordered_but_slower=False,
-                                                augment_record=False,
-                                                max_attempts=3,
-                                                failure_logger=log_ids)
-            total_persisted += len(_records)
+                for record in records:
+                    record["_id"] = record["key_field"]
+                    record["meta"] = {"seconds_parsing": round(batch_time / len(records))}
+
+                self._target_collection.insert_many(records,
+                                                    ordered_but_slower=False,
+                                                    augment_record=False,
+                                                    max_attempts=3,
+                                                    failure_logger=log_ids)
+                total_persisted += len(records)
 
         self.logger.debug(f"ParseRecordsFromMongo "
                           f"Persisted: {total_persisted}. Skipped: {total_skipped}. Total records: {total_records}.")
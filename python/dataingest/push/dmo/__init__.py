@@ -1,3 +1,5 @@
+from .bounded_pipeline import BoundedPipeline
+from .bulk_table_loader import BulkTableLoader
 from .persist_data_to_db import PersistDatatoDB
 from .tag_record_transformation import TagRecordTransformation
 from .xdm_record_transformation import XdmRecordTransformation
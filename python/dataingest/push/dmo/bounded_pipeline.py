@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import queue
+import threading
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+
+from base import BaseObject
+
+_DONE = object()
+
+
+class _Failure(object):
+    def __init__(self, err: Exception):
+        self.err = err
+
+
+class BoundedPipeline(BaseObject):
+    """ Overlap a (read -> transform -> write) flow
+
+        the source is read on one thread and transformed on another
+        while the caller consumes (writes) the results on its own thread
+
+        each stage hands off through a bounded queue
+        so no more than 'queue-size' items wait between any two stages
+
+        an error in the reader or transformer is raised to the caller
+
+        for df in BoundedPipeline(source=chunks, transform=to_dataframe):
+            writer.write(df) """
+
+    def __init__(self,
+                 source: Iterable,
+                 transform: Callable,
+                 queue_size: int = 4,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   overlap the mongo read, transformation and DB2 write in the push stage
+        :param source:
+            any iterable (e.g., collection chunks)
+        :param transform:
+            a function applied to each item of the source
+        :param queue_size:
+            the maximum number of items held between two stages
+        """
+        BaseObject.__init__(self, __name__)
+        if queue_size < 1:
+            raise ValueError(f"Invalid Queue Size: {queue_size}")
+
+        self._is_debug = is_debug
+        self._source = source
+        self._transform = transform
+
+        self._q_read = queue.Queue(maxsize=queue_size)
+        self._q_transform = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+
+    def _put(self,
+             a_queue: queue.Queue,
+             item) -> bool:
+        while not self._stop.is_set():
+            try:
+                a_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self,
+             a_queue: queue.Queue):
+        while not self._stop.is_set():
+            try:
+                return a_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _read(self) -> None:
+        try:
+            for item in self._source:
+                if not self._put(self._q_read, item):
+                    return
+        except Exception as err:
+            self._put(self._q_read, _Failure(err))
+            return
+        self._put(self._q_read, _DONE)
+
+    def _transform_all(self) -> None:
+        while True:
+            item = self._get(self._q_read)
+            if item is _DONE or isinstance(item, _Failure):
+                self._put(self._q_transform, item)
+                return
+
+            try:
+                result = self._transform(item)
+            except Exception as err:
+                self._put(self._q_transform, _Failure(err))
+                return
+
+            if not self._put(self._q_transform, result):
+                return
+
+    def __iter__(self) -> Iterator:
+        threads = [threading.Thread(target=self._read, daemon=True),
+                   threading.Thread(target=self._transform_all, daemon=True)]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self._q_transform.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.err
+                yield item
+
+        finally:
+            # also stops the upstream stages if the caller fails (or stops early)
+            self._stop.set()
+            for thread in threads:
+                thread.join()
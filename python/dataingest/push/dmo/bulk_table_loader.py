@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import pandas as pd
+
+from base import BaseObject
+
+
+class BulkTableLoader(BaseObject):
+    """ Bulk Load DataFrames into a Database Table
+
+        rows are inserted with one multi-row (executemany) statement per batch
+        and committed every 'commit-size' rows rather than once per statement
+
+        any SQLAlchemy connection is supported (e.g., DB2 in production and SQLite in tests)
+
+        with BulkTableLoader(connection, 'MY_TABLE', 'CENDANT') as loader:
+            loader.write(df) """
+
+    def __init__(self,
+                 connection,
+                 table_name: str,
+                 schema_name: str = None,
+                 batch_size: int = 5000,
+                 commit_size: int = 50000,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   replace row-wise 'to-sql' inserts in the push stage
+        :param connection:
+            an open SQLAlchemy connection
+        :param table_name:
+            the name of the target table (the table must exist)
+        :param schema_name:
+            the name of the schema (None for the default schema)
+        :param batch_size:
+            the number of rows per (executemany) statement
+        :param commit_size:
+            the number of rows per transaction
+        """
+        BaseObject.__init__(self, __name__)
+        if batch_size < 1 or commit_size < 1:
+            raise ValueError(f"Invalid Batch Sizes (batch-size={batch_size}, commit-size={commit_size})")
+
+        self._is_debug = is_debug
+        self._connection = connection
+        self._table_name = table_name
+        self._schema_name = schema_name
+        self._batch_size = batch_size
+        self._commit_size = commit_size
+
+        self._transaction = None
+        self._uncommitted = 0
+        self.total_rows = 0
+        self.total_commits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type:
+            self.rollback()
+        else:
+            self.commit()
+
+    def _statement(self,
+                   columns: list):
+        from sqlalchemy import column
+        from sqlalchemy import insert
+        from sqlalchemy import table
+
+        return insert(table(self._table_name,
+                            *[column(x) for x in columns],
+                            schema=self._schema_name))
+
+    @staticmethod
+    def _rows(df: pd.DataFrame) -> list:
+        """
+        Purpose:
+            Transform a DataFrame into DBAPI parameters
+            missing values become NULL and numpy scalars become python scalars
+        """
+        df = df.astype(object).where(df.notna(), None)
+        return df.to_dict('records')
+
+    def _begin(self) -> None:
+        if self._transaction is not None:
+            return
+
+        # SQLAlchemy 2.x connections begin a transaction implicitly on first use
+        # (e.g., by a prior DDL statement); commit it so an explicit transaction can begin
+        if self._connection.in_transaction() and hasattr(self._connection, 'commit'):
+            self._connection.commit()
+
+        self._transaction = self._connection.begin()
+
+    def commit(self) -> None:
+        if self._transaction is None:
+            return
+
+        self._transaction.commit()
+        self._transaction = None
+        self._uncommitted = 0
+        self.total_commits += 1
+
+    def rollback(self) -> None:
+        if self._transaction is None:
+            return
+
+        self._transaction.rollback()
+        self._transaction = None
+        self._uncommitted = 0
+
+    def write(self,
+              df: pd.DataFrame) -> int:
+        """
+        :param df:
+            a DataFrame with columns named as the table columns
+        :return:
+            the number of rows written
+        """
+        if df.empty:
+            return 0
+
+        statement = self._statement(list(df.columns))
+        rows = self._rows(df)
+
+        for i in range(0, len(rows), self._batch_size):
+            batch = rows[i:i + self._batch_size]
+
+            self._begin()
+            self._connection.execute(statement, batch)
+            self._uncommitted += len(batch)
+
+            if self._uncommitted >= self._commit_size:
+                self.commit()
+
+        self.total_rows += len(rows)
+
+        if self._is_debug:
+            self.logger.debug(f"Bulk Loaded Rows "
+                              f"(table={self._schema_name}.{self._table_name}, "
+                              f"rows={len(rows)}, "
+                              f"total={self.total_rows}, "
+                              f"commits={self.total_commits})")
+
+        return len(rows)
@@ -149,6 +149,26 @@ class PersistDatatoDB(BaseObject):
                   if_exists='append',
                   index=False)
 
+    def bulk_loader(self,
+                    schema_name: str,
+                    table_name: str,
+                    batch_size: int = 5000,
+                    commit_size: int = 50000):
+        """
+        Purpose:
+            A multi-row (executemany) alternative to 'insert-dataframe-into-table'
+            on the same connection
+        :return:
+            a BulkTableLoader
+        """
+        from dataingest.push.dmo import BulkTableLoader
+
+        return BulkTableLoader(connection=self._db2.connection,
+                               table_name=table_name.upper(),
+                               schema_name=schema_name.upper(),
+                               batch_size=batch_size,
+                               commit_size=commit_size)
+
     def update_refresh_stats(self,
                              schema_name: str,
                              table_name: str) -> None:
@@ -2,6 +2,8 @@
 # -*- coding: UTF-8 -*-
 
 
+from pandas import DataFrame
+
 from base import BaseObject
 from base import MandatoryParamError
 from datamongo import BaseMongoClient
@@ -41,6 +43,9 @@ class PushCollection(BaseObject):
             xavier.verges@es.ibm.com
             *   Folded PushTagCollection and PushXdmCollection into PushCollection
             *   Process the records incrementally
+        Updated:
+            18-Oct-2026
+            *   add a bulk load mode (pipelined, with multi-row inserts and configurable commits)
         :param mongo_collection_name:
             the name of the source collection to extract the data from
         :param mongo_database_name:
@@ -67,9 +72,67 @@ class PushCollection(BaseObject):
         self._transformation_type = transformation_type
         self._tag_confidence_threshold = tag_confidence_threshold
 
+    def _transform(self,
+                   ordinal: int,
+                   chunk: list,
+                   chunk_size: int,
+                   total: int) -> DataFrame:
+        first = (ordinal - 1) * chunk_size
+        last = ordinal * chunk_size - 1
+        self.logger.debug(f"Pushing records {first}-{last} of {total} ({self._collection_name}->{self._table_name})")
+        record_transformer = self._transformation_class(records=chunk,
+                                                        is_debug=self._is_debug and ordinal == 1,
+                                                        collection_name=self._collection_name)
+        df_collection = record_transformer.process(self._tag_confidence_threshold)
+        df_collection.columns = [x.upper() for x in df_collection.columns]
+        return df_collection
+
+    def _load(self,
+              db2_writer,
+              chunk_size: int) -> None:
+        """ read, transform and write each chunk in sequence with row-wise inserts """
+        total = self._collection.count()
+        for ordinal, chunk in enumerate(self._collection.by_chunks(chunk_size=chunk_size), start=1):
+            df_collection = self._transform(ordinal, chunk, chunk_size, total)
+            db2_writer.insert_dataframe_into_table(df_collection, self._schema_name, self._table_name)
+
+    def _bulk_load(self,
+                   db2_writer,
+                   chunk_size: int,
+                   batch_size: int,
+                   commit_size: int,
+                   queue_size: int) -> int:
+        """ overlap the read, transformation and multi-row write of the chunks """
+        from dataingest.push.dmo import BoundedPipeline
+
+        total = self._collection.count()
+
+        def _transform(item: tuple) -> DataFrame:
+            ordinal, chunk = item
+            return self._transform(ordinal, chunk, chunk_size, total)
+
+        pipeline = BoundedPipeline(source=enumerate(self._collection.by_chunks(chunk_size=chunk_size), start=1),
+                                   transform=_transform,
+                                   queue_size=queue_size,
+                                   is_debug=self._is_debug)
+
+        with db2_writer.bulk_loader(schema_name=self._schema_name,
+                                    table_name=self._table_name,
+                                    batch_size=batch_size,
+                                    commit_size=commit_size) as loader:
+            for df_collection in pipeline:
+                loader.write(df_collection)
+
+        return loader.total_rows
+
     def process(self,
                 skip: int = None,
-                limit: int = None):
+                limit: int = None,
+                bulk_load: bool = True,
+                chunk_size: int = 1000,
+                batch_size: int = 5000,
+                commit_size: int = 50000,
+                queue_size: int = 4):
         """
         :param skip:
             the number of records to skip
@@ -77,6 +140,18 @@ class PushCollection(BaseObject):
         :param limit:
             the total number of records to return
             Optional    if None, return all
+        :param bulk_load:
+            if True     overlap the read, transformation and write of the chunks
+                        and insert rows with multi-row (executemany) statements
+            if False    process each chunk in sequence with row-wise inserts
+        :param chunk_size:
+            the number of mongo records per chunk
+        :param batch_size:
+            the number of rows per insert statement (bulk load only)
+        :param commit_size:
+            the number of rows per transaction (bulk load only)
+        :param queue_size:
+            the number of chunks held between the read, transformation and write (bulk load only)
         :return:
         """
         from dataingest.push.dmo import PersistDatatoDB
@@ -91,20 +166,15 @@ class PushCollection(BaseObject):
                 self.logger.info("Failed to create table")
                 db2_writer.clear_table(self._schema_name, self._table_name)
 
-            chunk_size = 1000
-            chunk_count = 0
-            total = self._collection.count()
-            for chunk in self._collection.by_chunks(chunk_size=chunk_size):
-                first = chunk_count * chunk_size
-                chunk_count += 1
-                last = chunk_count * chunk_size - 1
-                self.logger.debug(f"Pushing records {first}-{last} of {total} ({self._collection_name}->{self._table_name})")
-                record_transformer = self._transformation_class(records=chunk,
-                                                                is_debug=self._is_debug and chunk_count == 1,
-                                                                collection_name=self._collection_name)
-                df_collection = record_transformer.process(self._tag_confidence_threshold)
-                df_collection.columns = [x.upper() for x in df_collection.columns]
-
-                db2_writer.insert_dataframe_into_table(df_collection, self._schema_name, self._table_name)
+            if bulk_load:
+                total_rows = self._bulk_load(db2_writer,
+                                             chunk_size=chunk_size,
+                                             batch_size=batch_size,
+                                             commit_size=commit_size,
+                                             queue_size=queue_size)
+                self.logger.debug(f"Bulk Loaded {total_rows} rows ({self._collection_name}->{self._table_name})")
+            else:
+                self._load(db2_writer,
+                           chunk_size=chunk_size)
 
         self.logger.info(f"Completed pushing {self._collection_name} to DB2")
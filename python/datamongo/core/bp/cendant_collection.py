@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
+import math
 import time
 from typing import Callable, Iterator, Iterable, Optional, Union
 
@@ -64,6 +65,13 @@ class CendantCollection(BaseObject):
                 a generator instead of a list. Your regular iterating across
                 records will still work, but referring to them by index won't,
                 unless you do list(collection.all()) or collection.all(as_list=True).
+        Updated:
+            18-Oct-2026
+            *   keyset pagination on '_id' for by_chunks(), chunk() and the results iterator
+                skip-and-limit paging is quadratic on large collections
+            *   added stream() and by_id_range() with projection support
+            *   added partition() to split a collection into '_id' ranges
+            *   added existing_ids() for bulk existence checks
         :param some_base_client:
             an instantiated base mongo client
         :param some_db_name:
@@ -105,9 +113,10 @@ class CendantCollection(BaseObject):
         for record in records:
             ...
         """
-        def __init__(self, collection, limit):
+        def __init__(self, collection, limit, batch_size=1000):
             self.collection = collection
             self.limit = limit
+            self.batch_size = batch_size
 
         def __len__(self):
             if self.limit:
@@ -123,15 +132,8 @@ class CendantCollection(BaseObject):
             return next(self._gen)
 
         def _generator(self):
-            counter = 0
-            #for chunk in self.collection.by_chunks():
-            for document in self.collection.all(as_list=True):
-                #for document in chunk:
-                    #counter += 1
-                    #if self.limit and self.limit < counter:
-                    #    return
-                    #else:
-                yield document
+            return self.collection.stream(batch_size=self.batch_size,
+                                          limit=self.limit)
 
     def log(self) -> str:
         return "\n\t".join([
@@ -262,14 +264,12 @@ class CendantCollection(BaseObject):
         def chunk_retrieval():
             x = 0
             buffer = []
-            while x < total_records:
-                chunk_results = self.skip_and_limit(skip=x, limit=chunk_size)
-                chunk_length = len(chunk_results)
-                if not chunk_length:
-                    return buffer
-                buffer.extend(chunk_results)
-                x += chunk_length
+            for chunk_results in self.by_chunks(chunk_size=chunk_size):
+                buffer.extend(chunk_results[:total_records - x])
+                x = len(buffer)
                 self.logger.debug(f"Got {x} of {total_records} in {self.collection_name}")
+                if x >= total_records:
+                    break
             return buffer
 
         results = chunk_retrieval()
@@ -318,32 +318,256 @@ class CendantCollection(BaseObject):
         """
         return self.read_record.skip_and_limit(skip, limit)
 
+    @staticmethod
+    def _id_range_query(query: Optional[dict],
+                        id_range: Optional[tuple]) -> dict:
+        """
+        :param query:
+            an optional MongoDB query
+        :param id_range:
+            an optional (lower, upper) tuple of '_id' bounds
+            the lower bound is inclusive and the upper bound exclusive; None is unbounded
+        :return:
+            the query restricted to the '_id' range
+        """
+        query = dict(query) if query else {}
+        if not id_range:
+            return query
+
+        lower, upper = id_range
+        d_range = {}
+        if lower is not None:
+            d_range['$gte'] = lower
+        if upper is not None:
+            d_range['$lt'] = upper
+        if not d_range:
+            return query
+
+        if '_id' in query:
+            return {'$and': [query, {'_id': d_range}]}
+        query['_id'] = d_range
+        return query
+
     def by_chunks(self,
-                  chunk_size: int = 500) -> Iterator[list]:
+                  chunk_size: int = 500,
+                  query: dict = None,
+                  projection: dict = None,
+                  id_range: tuple = None) -> Iterator[list]:
         """
         Iterator that returns collection chunks.
 
         Has much smaller memory demands for large collections.
 
-        Supposedly faster implementation than skip+limit, according  to
+        Pages on '_id' (keyset pagination) rather than skip+limit, according to
         https://scalegrid.io/blog/fast-paging-with-mongodb/
+        each chunk is a single indexed range query, regardless of its position in the collection
 
         for chunk in collection.by_chunks(1000):
             for record in chunk:
                 # do something with the record
+
+        :param chunk_size:
+            the number of records per chunk
+        :param query:
+            an optional MongoDB query
+        :param projection:
+            an optional MongoDB projection ('_id' is always returned)
+        :param id_range:
+            an optional (lower, upper) tuple of '_id' bounds (see partition())
         """
-        last_id = ''
+        if projection and not projection.get('_id', True):
+            raise ValueError("Keyset Pagination requires the '_id' field")
+
+        base_query = self._id_range_query(query, id_range)
+
+        last_id = None
         while True:
-            filter = {
-                '_id': {'$gt': last_id}
-            }
-            cursor = self.collection.find(filter).limit(chunk_size)
+            page_query = base_query
+            if last_id is not None and base_query:
+                page_query = {'$and': [base_query, {'_id': {'$gt': last_id}}]}
+            elif last_id is not None:
+                page_query = {'_id': {'$gt': last_id}}
+
+            cursor = self.collection.find(page_query, projection) \
+                .sort('_id', 1) \
+                .limit(chunk_size)
             chunk = self.helper.to_result_set(cursor)
             cursor.close()
             if not len(chunk):
                 break
             last_id = chunk[-1]['_id']
             yield chunk
+            if len(chunk) < chunk_size:
+                break
+
+    def stream(self,
+               batch_size: int = 1000,
+               query: dict = None,
+               projection: dict = None,
+               id_range: tuple = None,
+               limit: int = None) -> Iterator[dict]:
+        """
+        Purpose:
+            Stream records one at a time, holding at most one batch in memory
+        :param batch_size:
+            the number of records fetched per round-trip
+        :param query:
+            an optional MongoDB query
+        :param projection:
+            an optional MongoDB projection
+        :param id_range:
+            an optional (lower, upper) tuple of '_id' bounds (see partition())
+        :param limit:
+            an optional limit on the total number of records
+        """
+        counter = 0
+        if limit:
+            batch_size = min(batch_size, limit)
+
+        for chunk in self.by_chunks(chunk_size=batch_size,
+                                    query=query,
+                                    projection=projection,
+                                    id_range=id_range):
+            for record in chunk:
+                if limit and counter >= limit:
+                    return
+                counter += 1
+                yield record
+
+    def by_id_range(self,
+                    lower,
+                    upper,
+                    projection: dict = None) -> list:
+        """
+        Purpose:
+            Return every record within an '_id' range
+        :param lower:
+            the inclusive lower bound (None is unbounded)
+        :param upper:
+            the exclusive upper bound (None is unbounded)
+        :param projection:
+            an optional MongoDB projection
+        :return:
+            a list of records
+        """
+        results = []
+        for chunk in self.by_chunks(chunk_size=5000,
+                                    projection=projection,
+                                    id_range=(lower, upper)):
+            results.extend(chunk)
+        return results
+
+    def partition(self,
+                  total_partitions: int = None,
+                  chunk_size: int = None) -> list:
+        """
+        Purpose:
+            Split the collection into contiguous '_id' ranges of (roughly) equal size
+            only the '_id' index is scanned
+        Sample Output:
+            [   (None, 'key-2000'),
+                ('key-2000', 'key-4000'),
+                ('key-4000', None) ]
+        Notes:
+            -   the lower bound is inclusive and the upper bound exclusive
+            -   the first and last ranges are unbounded so that they cover
+                records inserted after the partition is computed
+        :param total_partitions:
+            the number of ranges to split the collection into
+        :param chunk_size:
+            the number of records per range (an alternative to total-partitions)
+        :return:
+            a list of (lower, upper) tuples (empty for an empty collection)
+        """
+        if not total_partitions and not chunk_size:
+            raise MandatoryParamError("Total Partitions or Chunk Size")
+
+        total_records = self.collection.count_documents({})
+        if not total_records:
+            return []
+
+        if not chunk_size:
+            chunk_size = math.ceil(total_records / total_partitions)
+        chunk_size = max(chunk_size, 1)
+
+        boundaries = []
+        cursor = self.collection.find({}, {'_id': 1}) \
+            .sort('_id', 1) \
+            .batch_size(10000)
+        for i, record in enumerate(cursor):
+            if i and i % chunk_size == 0:
+                boundaries.append(record['_id'])
+        cursor.close()
+
+        lowers = [None] + boundaries
+        uppers = boundaries + [None]
+        partitions = list(zip(lowers, uppers))
+
+        if self.is_debug:
+            self.logger.debug('\n'.join([
+                "Partitioned Collection",
+                f"\tCollection Name: {self.collection_name}",
+                f"\tTotal Records: {total_records}",
+                f"\tTotal Partitions: {len(partitions)}"]))
+
+        return partitions
+
+    def existing_ids(self,
+                     ids: list,
+                     batch_size: int = 5000) -> set:
+        """
+        Purpose:
+            Resolve which of the given '_id' values are already in the collection
+            one '$in' query (covered by the '_id' index) per batch instead of one query per id
+        :param ids:
+            a list of '_id' values
+        :param batch_size:
+            the maximum number of ids per query
+        :return:
+            the set of ids that exist
+        """
+        ids = list(set(ids))
+
+        existing = set()
+        for i in range(0, len(ids), batch_size):
+            cursor = self.collection.find({'_id': {'$in': ids[i:i + batch_size]}}, {'_id': 1})
+            existing.update([x['_id'] for x in cursor])
+            cursor.close()
+
+        if self.is_debug:
+            self.logger.debug(f"Resolved Existing Ids "
+                              f"(collection={self.collection_name}, "
+                              f"total={len(ids)}, "
+                              f"existing={len(existing)})")
+
+        return existing
+
+    def by_ids(self,
+               ids: list,
+               batch_size: int = 5000,
+               projection: dict = None) -> list:
+        """
+        Purpose:
+            Return the records for the given '_id' values
+            one '$in' query per batch
+        :param ids:
+            a list of '_id' values
+        :param batch_size:
+            the maximum number of ids per query
+        :param projection:
+            an optional MongoDB projection
+        :return:
+            a list of records (in '_id' order)
+        """
+        ids = list(set(ids))
+
+        results = []
+        for i in range(0, len(ids), batch_size):
+            cursor = self.collection.find({'_id': {'$in': ids[i:i + batch_size]}}, projection)
+            results.extend(self.helper.to_result_set(cursor))
+            cursor.close()
+
+        return sorted(results, key=lambda x: x['_id'])
 
     def delete(self,
                keep_indexes: bool = True) -> None:
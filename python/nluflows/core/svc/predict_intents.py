@@ -80,75 +80,128 @@ class PredictIntents(BaseObject):
 
         return svcresult
 
-    def _by_text(self,
-                 input_text: str) -> dict:
-        from nluflows.mapping.bp import ServiceCatalogMapper
-        from nluflows.summarize.bp import ServiceCatalogSummarizer
-
+    def _preprocess(self,
+                    input_text: str) -> str:
         if not self._text_api:
             self._text_api = TextAPI()
 
-        original_text = input_text
+        if not self.preprocess_text:
+            return input_text
 
-        # Step: Tag the Input Text
-        if self.preprocess_text:
-            input_text = self._text_api.preprocess(input_text,
-                                                   lowercase=True,
-                                                   no_urls=True,
-                                                   no_emails=True,
-                                                   no_phone_numbers=True,
-                                                   no_numbers=True,
-                                                   no_currency_symbols=True,
-                                                   no_punct=True,
-                                                   no_contractions=True,
-                                                   no_accents=True,
-                                                   remove_inside_brackets=True)
-
-        def _intent_not_tagged():
-            return self.service_result(svcresult=self._intent_not_tagged(),
-                                       input_text=input_text,
-                                       input_text_original=original_text,
-                                       input_tags=None)
+        return self._text_api.preprocess(input_text,
+                                         lowercase=True,
+                                         no_urls=True,
+                                         no_emails=True,
+                                         no_phone_numbers=True,
+                                         no_numbers=True,
+                                         no_currency_symbols=True,
+                                         no_punct=True,
+                                         no_contractions=True,
+                                         no_accents=True,
+                                         remove_inside_brackets=True)
 
-        def _intent_not_mapped(some_input_tags: list):
-            return self.service_result(svcresult=self._intent_not_mapped(),
-                                       input_text=input_text,
-                                       input_text_original=original_text,
-                                       input_tags=some_input_tags)
-
-        def _intent_mapped(analysis: dict,
-                           some_input_tags: list):
-            return self.service_result(svcresult=analyses,
-                                       input_text=input_text,
-                                       input_text_original=original_text,
-                                       input_tags=some_input_tags)
-
-        # Step: Parse the Input Text
+    def _input_tags(self,
+                    input_text: str) -> list:
         df_results = self._text_api.parse(input_text)
         if df_results.empty:
-            return _intent_not_tagged()
+            return []
 
-        input_tags = sorted(df_results.Tag.unique())
+        return sorted(df_results.Tag.unique())
+
+    def _summarize(self,
+                   analyses: list or dict,
+                   input_text_original: str,
+                   input_text: str,
+                   input_tags: list) -> dict:
+        from nluflows.summarize.bp import ServiceCatalogSummarizer
+
+        def _intent_not_mapped():
+            return self.service_result(svcresult=self._intent_not_mapped(),
+                                       input_text=input_text,
+                                       input_text_original=input_text_original,
+                                       input_tags=input_tags)
 
-        # Step: Map Tags to Intents
-        analyses = ServiceCatalogMapper(some_tags=input_tags,
-                                        is_debug=self.is_debug).process()
         if not analyses or not len(analyses):
-            return _intent_not_mapped(some_input_tags=input_tags)
+            return _intent_not_mapped()
 
         # Step: Summarize Mapping Results
         analyses = ServiceCatalogSummarizer(some_analyses=analyses,
                                             is_debug=self.is_debug).process()
         if not analyses or not len(analyses):
-            return _intent_not_mapped(some_input_tags=input_tags)
+            return _intent_not_mapped()
 
         # Step: Normalize Results
         analyses = self._normalize(analyses)
         if not analyses or not len(analyses):
-            return _intent_not_mapped(some_input_tags=input_tags)
+            return _intent_not_mapped()
 
         # Step: Return Final Results
-        return _intent_mapped(analyses, input_tags)
+        return self.service_result(svcresult=analyses,
+                                   input_text=input_text,
+                                   input_text_original=input_text_original,
+                                   input_tags=input_tags)
+
+    def _intent_not_tagged_result(self,
+                                  input_text_original: str,
+                                  input_text: str) -> dict:
+        return self.service_result(svcresult=self._intent_not_tagged(),
+                                   input_text=input_text,
+                                   input_text_original=input_text_original,
+                                   input_tags=None)
+
+    def _by_text(self,
+                 input_text: str) -> dict:
+        from nluflows.mapping.bp import ServiceCatalogMapper
+
+        original_text = input_text
+
+        # Step: Tag the Input Text
+        input_text = self._preprocess(input_text)
+
+        # Step: Parse the Input Text
+        input_tags = self._input_tags(input_text)
+        if not input_tags:
+            return self._intent_not_tagged_result(input_text_original=original_text,
+                                                  input_text=input_text)
+
+        # Step: Map Tags to Intents
+        analyses = ServiceCatalogMapper(some_tags=input_tags,
+                                        is_debug=self.is_debug).process()
+
+        return self._summarize(analyses=analyses,
+                               input_text_original=original_text,
+                               input_text=input_text,
+                               input_tags=input_tags)
+
+    def _by_texts(self,
+                  input_texts: list) -> list:
+        from nluflows.mapping.svc import ScoreMappingFromTags
+
+        original_texts = input_texts
+
+        # Step: Tag the Input Texts
+        input_texts = [self._preprocess(x) for x in input_texts]
+
+        # Step: Parse the Input Texts
+        input_tags = [self._input_tags(x) for x in input_texts]
+
+        # Step: Map Tags to Intents (all texts are scored at once)
+        l_analyses = ScoreMappingFromTags(some_tag_sets=input_tags,
+                                          is_debug=self.is_debug).analyses()
+
+        results = []
+        for i in range(len(input_texts)):
+            if not input_tags[i]:
+                results.append(self._intent_not_tagged_result(input_text_original=original_texts[i],
+                                                              input_text=input_texts[i]))
+                continue
+
+            results.append(self._summarize(analyses=l_analyses[i],
+                                           input_text_original=original_texts[i],
+                                           input_text=input_texts[i],
+                                           input_tags=input_tags[i]))
+
+        return results
 
     @staticmethod
     def _intent_not_tagged() -> dict:
@@ -197,3 +250,29 @@ class PredictIntents(BaseObject):
             self.mapping_event_collection.save(svcresult)
 
         return svcresult
+
+    def process_batch(self,
+                      input_texts: list) -> list:
+        """
+        Purpose:
+            Predict the intents of many texts (e.g., a backlog of Slack events)
+            the mapping for all texts is scored at once against the compiled mapping table
+            rather than analyzing each candidate flow per text
+        :param input_texts:
+            a list of input texts
+        :return:
+            a list of service results (one per input text)
+            each result is in the format returned by 'process'
+        """
+        svcresults = self._by_texts(input_texts=input_texts)
+
+        if self.is_debug:
+            self.logger.debug("\n".join([
+                "Batch Intent Prediction Completed",
+                "\tTotal Texts: {}".format(len(svcresults))]))
+
+        if self.persist_result:
+            for svcresult in svcresults:
+                self.mapping_event_collection.save(svcresult)
+
+        return svcresults
@@ -6,4 +6,5 @@ from .flag_computer import FlagComputer
 from .high_match_computer import HighMatchComputer
 from .include_all_of_computer import IncludeAllOfComputer
 from .include_one_of_computer import IncludeOneOfComputer
+from .mapping_matrix import MappingMatrix
 from .tag_analyzer import TagAnalyzer
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import numpy as np
+from scipy import sparse
+
+from base import BaseObject
+from nluflows.mapping.dmo.tag_analyzer import term_discrimination
+
+
+class MappingMatrix(BaseObject):
+    """
+    Purpose:
+        A compiled form of the Mapping Table
+        that scores a batch of tag sets against every flow at once
+
+    Implementation:
+        -   each mapping segment (include-one-of, include-all-of, exclude-one-of)
+            is compiled once into a (flow x tag) incidence matrix
+        -   the remaining rules (exclusivity, deduction, tie-break) become per-flow vectors
+        -   a batch of tag sets becomes a (message x tag) incidence matrix;
+            one sparse product per segment gives the number of matched tags
+            for every (message, flow) pair
+        -   the confidence of each candidate is computed as
+                svc:ComputeConfidenceLevels would compute it from dmo:TagAnalyzer
+            including the post-processing in dmo:ConfidenceLevelPostProcessor
+
+    Note:
+        a candidate flow shares at least one tag with the tag set (via the reverse map)
+        tags are matched exactly (the caller normalizes case)
+    """
+
+    def __init__(self,
+                 some_mapping: dict,
+                 some_rev_mapping: dict,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   compile the mapping table once rather than analyzing each candidate flow
+                per message in svc:AnalyzeMappingFromTags
+        :param some_mapping:
+            the mapping table (e.g., 'the-mapping-table-dict')
+        :param some_rev_mapping:
+            the reverse mapping table (e.g., 'the-mapping-rev-dict')
+        :param is_debug:
+            if True     increase log output at DEBUG level
+        """
+        BaseObject.__init__(self, __name__)
+        self.is_debug = is_debug
+
+        self._flows = sorted(some_mapping.keys())
+        self._d_tags = {}
+
+        def _vocab(tags) -> list:
+            for tag in tags:
+                if tag not in self._d_tags:
+                    self._d_tags[tag] = len(self._d_tags)
+            return [self._d_tags[tag] for tag in set(tags)]
+
+        def _segment(name: str) -> list:
+            return [_vocab(some_mapping[flow][name]) for flow in self._flows]
+
+        d_flows = {flow: i for i, flow in enumerate(self._flows)}
+        rev_mapping = [[] for _ in self._flows]
+        for tag in some_rev_mapping:
+            for flow in some_rev_mapping[tag]:
+                rev_mapping[d_flows[flow]].append(tag)
+
+        include_one_of = _segment("include_one_of")
+        include_all_of = _segment("include_all_of")
+        exclude_one_of = _segment("exclude_one_of")
+        candidates = [_vocab(tags) for tags in rev_mapping]
+
+        self._include_one_of = self._incidence(include_one_of)
+        self._include_all_of = self._incidence(include_all_of)
+        self._exclude_one_of = self._incidence(exclude_one_of)
+        self._candidates = self._incidence(candidates)
+
+        # the discriminatory boost is counted once per inclusion segment
+        weights = np.zeros(len(self._d_tags))
+        for tag, i in self._d_tags.items():
+            if tag in term_discrimination["high"]:
+                weights[i] = 1
+            elif tag in term_discrimination["low"]:
+                weights[i] = -1
+        self._discriminatory = (self._include_one_of + self._include_all_of).multiply(weights).tocsr()
+
+        def _entries(name: str) -> np.ndarray:
+            return np.array([len(some_mapping[flow][name]) for flow in self._flows])
+
+        self._total_include_one_of = _entries("include_one_of")
+        self._total_include_all_of = _entries("include_all_of")
+        self._unique_include_all_of = np.array([len(x) for x in include_all_of])
+
+        self._exclusive = np.array([bool(some_mapping[flow]["exclusive"]) for flow in self._flows])
+        self._exclusive_total = self._total_include_all_of + (self._total_include_one_of > 1)
+
+        deductions = [some_mapping[flow]["deduction"] for flow in self._flows]
+        self._deduction = np.clip(np.array([x if x else 0 for x in deductions], dtype=float), 0, 100)
+
+        if self.is_debug:
+            self.logger.debug("\n".join([
+                "Compiled Mapping Matrix",
+                "\tTotal Flows: {}".format(len(self._flows)),
+                "\tTotal Tags: {}".format(len(self._d_tags))]))
+
+    def _incidence(self,
+                   rows: list) -> sparse.csr_matrix:
+        indptr = np.cumsum([0] + [len(x) for x in rows])
+        indices = np.array([i for x in rows for i in x], dtype=np.int64)
+        return sparse.csr_matrix((np.ones(len(indices)), indices, indptr),
+                                 shape=(len(rows), len(self._d_tags)))
+
+    def _messages(self,
+                  tag_sets: list) -> sparse.csr_matrix:
+        return self._incidence([[self._d_tags[tag] for tag in tags if tag in self._d_tags]
+                                for tags in tag_sets])
+
+    def _post_process(self,
+                      rows: np.ndarray,
+                      cols: np.ndarray,
+                      confidence: np.ndarray,
+                      total_messages: int) -> np.ndarray:
+        """
+        Purpose:
+            Apply dmo:ConfidenceLevelPostProcessor to the candidates of every message
+            1.  tie-break:  the candidates at the maximum confidence gain
+                            5 points per 'include-all-of' tag
+            2.  fit-curve:  shift all candidates down so the maximum is (at most) 100
+                            and no candidate is below 0
+        """
+
+        def _max_confidence() -> np.ndarray:
+            max_confidence = np.zeros(total_messages)
+            np.maximum.at(max_confidence, rows, confidence)
+            return max_confidence[rows]
+
+        is_max = confidence == _max_confidence()
+        confidence = confidence + np.where(is_max, self._total_include_all_of[cols] * 5, 0)
+
+        delta = np.maximum(_max_confidence() - 100, 0)
+        return np.maximum(confidence - delta, 0)
+
+    def process(self,
+                tag_sets: list) -> list:
+        """
+        :param tag_sets:
+            a list of tag sets (one per message)
+        :return:
+            a list (one per message) of candidate analyses
+            [   {   'process': 'CHITCHAT_GREETING_1',
+                    'direct-match': True,
+                    'confidence': 100.0 }]
+        """
+        tag_sets = [set(tags) for tags in tag_sets]
+        messages = self._messages(tag_sets)
+
+        candidates = (messages @ self._candidates.T).tocsr()
+        rows, cols = candidates.nonzero()
+        if not len(rows):  # no message has a candidate flow
+            return [[] for _ in tag_sets]
+
+        def _matches(segment: sparse.csr_matrix) -> np.ndarray:
+            return np.asarray((messages @ segment.T).tocsr()[rows, cols]).ravel()
+
+        include_one_of = _matches(self._include_one_of)
+        include_all_of = _matches(self._include_all_of)
+        exclude_one_of = _matches(self._exclude_one_of)
+        discriminatory = _matches(self._discriminatory)
+
+        total_tags = np.array([len(tags) for tags in tag_sets])[rows]
+        missing_include_all_of = self._unique_include_all_of[cols] - include_all_of
+
+        # dmo:IncludeOneOfComputer
+        has_include_one_of = self._total_include_one_of[cols] > 0
+        include_one_of_score = np.where(include_one_of > 0, include_one_of * 5.0,
+                                        np.where(has_include_one_of, -75, 0))
+
+        # dmo:IncludeAllOfComputer
+        include_all_of_score = missing_include_all_of * -100.0
+
+        # dmo:ExcludeOneOfComputer
+        exclude_one_of_score = exclude_one_of * -75.0
+
+        # dmo:ExcludeAllOfComputer always returns 0 (it tests for the 'exclude-one-of' segment)
+
+        # dmo:ExclusiveFlagComputer
+        is_exclusive = self._exclusive[cols]
+        has_exclusivity = self._exclusive_total[cols] == total_tags
+        exclusive_score = np.where(is_exclusive, np.where(has_exclusivity, 5, -75), 0)
+
+        # dmo:HighMatchComputer
+        high_match_score = np.where(include_all_of > 0, include_all_of * 5, -25)
+
+        # dmo:FlagComputer
+        flag_score = (0 - self._deduction[cols]) + (discriminatory * 10)
+
+        confidence = 100 + include_one_of_score
+        confidence = confidence + include_all_of_score
+        confidence = confidence + exclude_one_of_score
+        confidence = confidence + exclusive_score
+        confidence = confidence + high_match_score
+        confidence = confidence + flag_score
+
+        confidence = self._post_process(rows, cols, confidence, len(tag_sets))
+
+        def _direct_match(i: int) -> bool or None:
+            if missing_include_all_of[i] > 0:
+                return False
+            if not has_include_one_of[i]:
+                return None
+            return bool(include_one_of[i] > 0)
+
+        results = [[] for _ in tag_sets]
+        for i in range(len(rows)):
+            results[rows[i]].append({
+                "process": self._flows[cols[i]],
+                "direct-match": _direct_match(i),
+                "confidence": float(confidence[i])})
+
+        if self.is_debug:
+            self.logger.debug("\n".join([
+                "Mapping Matrix Scoring Completed",
+                "\tTotal Messages: {}".format(len(tag_sets)),
+                "\tTotal Candidates: {}".format(len(rows))]))
+
+        return results
@@ -1,2 +1,3 @@
 from .analyze_mapping_from_tags import AnalyzeMappingFromTags
 from .compute_confidence_levels import ComputeConfidenceLevels
+from .score_mapping_from_tags import ScoreMappingFromTags
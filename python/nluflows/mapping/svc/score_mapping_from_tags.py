@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+from base import BaseObject
+from datadict import the_mapping_rev_dict
+from datadict import the_mapping_table_dict
+
+
+class ScoreMappingFromTags(BaseObject):
+    """
+    Purpose:
+        score a batch of tag sets against the compiled mapping table
+        the result for each tag set is equivalent to
+            bp:ServiceCatalogMapper
+        and can be passed directly into
+            bp:ServiceCatalogSummarizer
+    """
+
+    _matrix = None
+
+    def __init__(self,
+                 some_tag_sets: list,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   batch scoring for large event backlogs
+        :param some_tag_sets:
+            a list of tag lists (one per message)
+        :param is_debug:
+            if True     increase log output at DEBUG level
+        """
+        BaseObject.__init__(self, __name__)
+        from nluflows.mapping.dmo import MappingMatrix
+
+        self.is_debug = is_debug
+        self.tag_sets = [[x.lower().strip() for x in tags if x]
+                         for tags in some_tag_sets]
+
+        if ScoreMappingFromTags._matrix is None:
+            ScoreMappingFromTags._matrix = MappingMatrix(some_mapping=the_mapping_table_dict,
+                                                         some_rev_mapping=the_mapping_rev_dict,
+                                                         is_debug=self.is_debug)
+
+    def analyses(self) -> list:
+        """
+        :return:
+            a list (one per tag set) of candidate analyses
+            an empty list means no mapping was found
+        """
+        return self._matrix.process(self.tag_sets)
@@ -2,7 +2,7 @@
 # -*- coding: UTF-8 -*-
 
 
-import itertools
+import bisect
 import pprint
 from typing import Optional
 
@@ -21,6 +21,7 @@ class CoordMatcherToken(BaseObject):
                  d_tokenized_input: dict,
                  entity_text: str,
                  d_tokenized_entity: dict,
+                 d_token_positions: dict = None,
                  is_debug: bool = False):
         """
         Created:
@@ -36,6 +37,10 @@ class CoordMatcherToken(BaseObject):
             15-Jan-2020
             craig.trim@ibm.com
             *   renamed from 'tokenized-coord-matcher'
+        Updated:
+            18-Oct-2026
+            *   locate the optimal sequence without a cartesian product of candidate positions
+            *   accept a shared position index for the tokenized input
         :param input_text:
             The normalized form of the utterance being analyzed
             Sample Input:
@@ -43,6 +48,9 @@ class CoordMatcherToken(BaseObject):
         :param entity_text:
             the entity text to match on
             this text will be tokenized and compared to the tokenized form of the input text
+        :param d_token_positions:
+            (Optional) the position index of the tokenized input (see 'token-positions')
+            computed from the tokenized input if not provided
         """
         BaseObject.__init__(self, __name__)
 
@@ -51,6 +59,7 @@ class CoordMatcherToken(BaseObject):
         self._entity_text = entity_text
         self._d_tokenized_input = d_tokenized_input
         self._d_tokenized_entity = d_tokenized_entity
+        self._d_token_positions = d_token_positions
 
         if self._is_debug:
             self.logger.debug('\n'.join([
@@ -81,116 +90,97 @@ class CoordMatcherToken(BaseObject):
         return tokens
 
     @staticmethod
-    def _candidate_token_sequences(pattern_tokens: list,
-                                   normalized_tokens: list) -> list:
+    def token_positions(d_tokenized_input: dict) -> dict:
         """
         Purpose:
-            Find a list of candidate token sequences within the normalized_input_text
-        :param pattern_tokens:
-            a list of 1..* tokens forming a match pattern
-        :param normalized_tokens:
-            the tokenized form of the normalized_input_text
+            Index the position of each (normalized) token in the tokenized input
+        :param d_tokenized_input:
+            the output of dmo:CharacterLevelTokenizer
         :return:
-            a list of possible token sequences
+            a dictionary of normalized tokens to ascending positions
             Sample Output:
-                [   (5, 2, 1), (5, 2, 11),
-                    (5, 9, 11), (5, 9, 13),
-                    ...
-                    (8, 9, 11), (8, 9, 13),
-                    (15, 9, 11), (15, 9, 13) ]
+                {   'natural': [5, 8, 15],
+                    'killer': [2, 9],
+                    'cells': [1, 11, 13] }
         """
+        d_positions = {}
+        for index in d_tokenized_input:
+            token = d_tokenized_input[index]['normalized'].lower()
+            if token not in d_positions:
+                d_positions[token] = []
+            d_positions[token].append(index)
 
-        def find_index_position(a_pattern_token: str) -> list:
-            m = []
-            for index in range(0, len(normalized_tokens)):
-                if a_pattern_token.lower() == normalized_tokens[index].lower():
-                    m.append(index)
-            return m
-
-        matches = []
-        [matches.append(find_index_position(pattern_token))
-         for pattern_token in pattern_tokens]
-
-        cartesian = []
-        for element in itertools.product(*matches):
-            cartesian.append(element)
-
-        return cartesian
+        return d_positions
 
     @staticmethod
-    def _filter_candidate_sequences(candidates: list) -> list:
+    def _locate_optimal_sequence(pattern_tokens: list,
+                                 d_positions: dict) -> Optional[list]:
         """
         Purpose:
-            Discard candidate sequences that fail to meet criteria
-        :param candidates:
-            Sample Input:
-                [   (5, 2, 1), (5, 2, 11),
-                    (5, 9, 11), (5, 9, 13),
-                    ...
-                    (8, 9, 11), (8, 9, 13),
-                    (15, 9, 11), (15, 9, 13) ]
-        :return:
-            Sample Output:
-                [   (5, 9, 11), (5, 9, 13),
-                    (8, 9, 11), (8, 9, 13)]
-        """
-
-        def is_continous_order(seq: list) -> bool:
-            """
-            Criteria:
-                A token match sequence must be in continuous order
-
+            Find the sequence of token positions with tightly clustered numbers (lowest delta)
+        Criteria:
+            A token match sequence must be in continuous order
                 Valid Sequence:
                     [8, 9, 11]
                 Invalid Sequence:
                     [8, 3, 11]
-
-            :param seq:
-                a given sequence
-            :return:
-                True        sequence is valid
-                False       sequence is invalid
-            """
-            for i in range(0, len(seq)):
-                if i + 1 >= len(seq):
-                    return True
-                elif seq[i] > seq[i + 1]:
-                    return False
-
-            return True
-
-        return [x for x in candidates
-                if is_continous_order(list(x))]
-
-    @staticmethod
-    def _locate_optimal_sequence(candidates: list) -> Optional[list]:
-        """
-        Purpose:
-            Find the sequence with tightly clustered numbers (lowest delta)
-        :param candidates:
+            Where several sequences have the lowest delta, the last in (ascending) order is chosen
+        Implementation:
+            Rather than compute the cartesian product of all candidate positions,
+            -   for each position of the first token, the nearest valid position of each following token
+                gives the lowest delta starting from that position
+            -   for the chosen start, the latest valid position of each (middle) token is taken
+        :param pattern_tokens:
+            a list of 1..* tokens forming a match pattern
             Sample Input:
-                [   (5, 9, 11), (5, 9, 13),
-                    (8, 9, 11), (8, 9, 13)]
+                [ 'natural', 'killer', 'cells' ]
+        :param d_positions:
+            the position index of the tokenized input
+            Sample Input:
+                {   'natural': [5, 8, 15],
+                    'killer': [2, 9],
+                    'cells': [1, 11, 13] }
         :return:
             Sample Output:
                 [   8, 9, 11]
         """
+        if not pattern_tokens:
+            return None
+
+        positions = [d_positions.get(x.lower()) for x in pattern_tokens]
+        if not all(positions):
+            return None
 
-        def add_deltas(seq: list) -> int:
-            total = 0
-            for i in range(0, len(seq)):
-                if i + 1 >= len(seq):
-                    return total
-                total += (seq[i + 1] - seq[i])
-            return total
+        def _nearest_last(first: int) -> Optional[int]:
+            last = first
+            for candidates in positions[1:]:
+                i = bisect.bisect_left(candidates, last)
+                if i == len(candidates):
+                    return None
+                last = candidates[i]
+            return last
+
+        optimal = None
+        for first in positions[0]:
+            last = _nearest_last(first)
+            if last is None:  # no later start can complete the sequence either
+                break
+            if not optimal or last - first <= optimal[1] - optimal[0]:
+                optimal = [first, last]
 
-        d_result = {}
-        for a_sequence in candidates:
-            delta = add_deltas(list(a_sequence))
-            d_result[delta] = a_sequence
+        if not optimal:
+            return None
+        if len(positions) == 1:
+            return optimal[:1]
 
-        if d_result:
-            return list(d_result[min(d_result.keys())])
+        first, last = optimal
+        sequence = [last]
+        for candidates in reversed(positions[1:-1]):
+            i = bisect.bisect_right(candidates, sequence[-1])
+            sequence.append(candidates[i - 1])
+        sequence.append(first)
+
+        return list(reversed(sequence))
 
     def _perform_match(self,
                        optimal_sequence: list) -> dict:
@@ -223,23 +213,13 @@ class CoordMatcherToken(BaseObject):
 
         normalized_pattern_tokens = [self._d_tokenized_entity[x]['normalized']
                                      for x in self._d_tokenized_entity]
-        normalized_input_tokens = [self._d_tokenized_input[x]['normalized']
-                                   for x in self._d_tokenized_input]
-
-        candidates = self._candidate_token_sequences(pattern_tokens=normalized_pattern_tokens,
-                                                     normalized_tokens=normalized_input_tokens)
-        if not candidates:
-            return None
-        elif self._is_debug:
-            self.logger.debug(f"Candidate Token Sequences: {candidates}")
 
-        candidates = self._filter_candidate_sequences(candidates)
-        if not candidates:
-            return None
-        elif self._is_debug:
-            self.logger.debug(f"Filtered Candidate Sequences: {candidates}")
+        d_positions = self._d_token_positions
+        if d_positions is None:
+            d_positions = self.token_positions(self._d_tokenized_input)
 
-        optimal = self._locate_optimal_sequence(candidates)
+        optimal = self._locate_optimal_sequence(pattern_tokens=normalized_pattern_tokens,
+                                                d_positions=d_positions)
         if not optimal:
             return None
         elif self._is_debug:
@@ -249,7 +229,6 @@ class CoordMatcherToken(BaseObject):
         if self._is_debug:
             self.logger.debug('\n'.join([
                 "Long Distance Coordinate Match Found",
-                f"\tCandidate Sequences: {candidates}",
                 pprint.pformat(svcresult, indent=4)]))
 
         return svcresult
@@ -25,6 +25,11 @@ class PerformCoordExtraction(BaseObject):
             craig.trim@ibm.com
             *   refactoring and simplification based on
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1732
+        Updated:
+            18-Oct-2026
+            *   add 'process-all' to extract the coordinates of many entities in one pass;
+                the input text is tokenized (and indexed) once,
+                and synonym patterns are built (and tokenized) once per entity
         """
         BaseObject.__init__(self, __name__)
         self._is_debug = is_debug
@@ -32,17 +37,24 @@ class PerformCoordExtraction(BaseObject):
         self._syn_finder = FindSynonym(is_debug=self._is_debug,
                                        ontology_name=ontology_name)
 
+        self._stack_builder = None
+        self._d_patterns = {}
+        self._d_tokenized_patterns = {}
+        self._tokenized_input = None
+
     def _match_tokens(self,
                       input_text: str,
                       d_tokenized_input: dict,
                       entity_text: str,
-                      d_tokenized_entity: dict) -> Optional[dict]:
+                      d_tokenized_entity: dict,
+                      d_token_positions: dict) -> Optional[dict]:
         from nlusvc.coords.dmo import CoordMatcherToken
 
         svcresult = CoordMatcherToken(entity_text=entity_text,
                                       input_text=input_text,
                                       d_tokenized_input=d_tokenized_input,
                                       d_tokenized_entity=d_tokenized_entity,
+                                      d_token_positions=d_token_positions,
                                       is_debug=self._is_debug).process()
 
         if self._is_debug and svcresult:
@@ -82,10 +94,14 @@ class PerformCoordExtraction(BaseObject):
     def _synonyms(self,
                   a_term: str) -> list:
         from nlusvc.coords.svc import BuildSynonymStack
-        builder = BuildSynonymStack(is_debug=self._is_debug,
-                                    ontology_name=self._ontology_name)
 
-        return builder.process(a_term)['patterns']
+        if a_term not in self._d_patterns:
+            if not self._stack_builder:
+                self._stack_builder = BuildSynonymStack(is_debug=self._is_debug,
+                                                        ontology_name=self._ontology_name)
+            self._d_patterns[a_term] = self._stack_builder.process(a_term)['patterns']
+
+        return self._d_patterns[a_term]
 
     @staticmethod
     def _tokenize(some_input: str) -> dict:
@@ -95,6 +111,37 @@ class PerformCoordExtraction(BaseObject):
 
         return svc.process()
 
+    def _tokenize_pattern(self,
+                          pattern: str) -> dict:
+        if pattern not in self._d_tokenized_patterns:
+            self._d_tokenized_patterns[pattern] = self._tokenize(pattern)
+        return self._d_tokenized_patterns[pattern]
+
+    def _tokenize_input(self,
+                        input_text: str) -> (dict, dict):
+        """
+        Purpose:
+            Tokenize the Input Text (once) into an offset-mapped token stream
+            and index the position of each normalized token
+        :return:
+            the tokenized input
+            the position index of the tokenized input
+        """
+        from nlusvc.coords.dmo import CoordMatcherToken
+
+        if not self._tokenized_input or self._tokenized_input[0] != input_text:
+            d_tokenized_input = self._tokenize(input_text)
+            if self._is_debug:
+                self.logger.debug('\n'.join([
+                    "Tokenized Input Text",
+                    pprint.pformat(d_tokenized_input)]))
+
+            self._tokenized_input = (input_text,
+                                     d_tokenized_input,
+                                     CoordMatcherToken.token_positions(d_tokenized_input))
+
+        return self._tokenized_input[1], self._tokenized_input[2]
+
     @staticmethod
     def _preprocess_input(input_text: str):
         """
@@ -127,11 +174,7 @@ class PerformCoordExtraction(BaseObject):
 
         patterns = self._synonyms(entity_text)
 
-        d_tokenized_input = self._tokenize(input_text)
-        if self._is_debug:
-            self.logger.debug('\n'.join([
-                "Tokenized Input Text",
-                pprint.pformat(d_tokenized_input)]))
+        d_tokenized_input, d_token_positions = self._tokenize_input(input_text)
 
         for pattern in patterns:
             svcresult = self._match_entity(input_text=input_text,
@@ -140,7 +183,7 @@ class PerformCoordExtraction(BaseObject):
                 results.append(svcresult)
 
             # Simple Match on Tokenized Input
-            d_tokenized_entity = self._tokenize(pattern)
+            d_tokenized_entity = self._tokenize_pattern(pattern)
             if self._is_debug:
                 self.logger.debug('\n'.join([
                     f"Tokenized Pattern Text (pattern='{pattern}')",
@@ -149,7 +192,8 @@ class PerformCoordExtraction(BaseObject):
             svcresult = self._match_tokens(input_text=input_text,
                                            entity_text=pattern,
                                            d_tokenized_input=d_tokenized_input,
-                                           d_tokenized_entity=d_tokenized_entity)
+                                           d_tokenized_entity=d_tokenized_entity,
+                                           d_token_positions=d_token_positions)
             if svcresult:
                 results.append(svcresult)
 
@@ -184,6 +228,34 @@ class PerformCoordExtraction(BaseObject):
 
         return results[0]
 
+    def _extract(self,
+                 input_text: str,
+                 entity_text: str) -> Optional[dict]:
+        results = self._perform_match(input_text=input_text,
+                                      entity_text=entity_text)
+
+        if not results or not len(results):
+            if self._is_debug:
+                self.logger.debug('\n'.join([
+                    "Coordinate Extraction Failure",
+                    f"\tEntity: {entity_text}",
+                    f"\tInput Text: {input_text}"]))
+            return None
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Coordinate Extraction Candidates",
+                pprint.pformat(results, indent=4)]))
+
+        svcresult = self._choose_result(results)
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Coordinate Extraction Completed",
+                pprint.pformat(svcresult, indent=4)]))
+
+        return svcresult
+
     def process(self,
                 input_text: str,
                 entity_text: str) -> Optional[dict]:
@@ -205,29 +277,48 @@ class PerformCoordExtraction(BaseObject):
         :return:
             a dictionary of the (x,y) coordinates
         """
-        input_text = self._preprocess_input(input_text)
-
-        results = self._perform_match(input_text=input_text,
-                                      entity_text=entity_text)
+        return self._extract(input_text=self._preprocess_input(input_text),
+                             entity_text=entity_text)
 
-        if not results or not len(results):
-            if self._is_debug:
-                self.logger.debug('\n'.join([
-                    "Coordinate Extraction Failure",
-                    f"\tEntity: {entity_text}",
-                    f"\tInput Text: {input_text}"]))
-            return None
-
-        if self._is_debug:
-            self.logger.debug('\n'.join([
-                "Coordinate Extraction Candidates",
-                pprint.pformat(results, indent=4)]))
+    def process_all(self,
+                    input_text: str,
+                    entity_texts: list) -> dict:
+        """
+        Purpose:
+            Extract the (x,y) Coordinates of many Entities in the Input Text
+            the input text is tokenized once and shared by every entity
+        Sample Input:
+            Input Text:
+                "and the cytotoxic activity of natural killer (NK) cells"
+            Entity Texts:
+                [ "Natural Killer Cell", "Cytotoxic Activity" ]
+        Sample Output:
+            {   'Natural Killer Cell': {
+                    'x': 30, y: '55',
+                    'substring': 'natural killer (NK) cells' },
+                'Cytotoxic Activity': {
+                    'x': 8, y: '26',
+                    'substring': 'cytotoxic activity' }}
+        :param input_text:
+            any input text in an original state (non-normalized)
+        :param entity_texts:
+            a list of extracted (Ontology) entities
+        :return:
+            a dictionary of each entity to the (x,y) coordinates
+            the value is None for an entity that could not be located
+        """
+        input_text = self._preprocess_input(input_text)
 
-        svcresult = self._choose_result(results)
+        d_coords = {}
+        for entity_text in entity_texts:
+            if entity_text not in d_coords:
+                d_coords[entity_text] = self._extract(input_text=input_text,
+                                                      entity_text=entity_text)
 
         if self._is_debug:
             self.logger.debug('\n'.join([
-                "Coordinate Extraction Completed",
-                pprint.pformat(svcresult, indent=4)]))
+                "Coordinate Extraction (All) Completed",
+                f"\tTotal Entities: {len(d_coords)}",
+                f"\tTotal Located: {len([x for x in d_coords.values() if x])}"]))
 
-        return svcresult
+        return d_coords
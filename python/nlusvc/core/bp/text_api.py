@@ -89,6 +89,29 @@ class TextAPI(BaseObject):
         return svc.process(input_text=input_text,
                            entity_text=entity_text)
 
+    def coords_all(self,
+                   input_text: str,
+                   entity_texts: list) -> dict:
+        """
+        Purpose:
+            Extract the (x,y) Coordinates of many Entities in the Input Text
+            the input text is tokenized once and shared by every entity
+        :param input_text:
+            any input text in an original state (non-normalized)
+        :param entity_texts:
+            a list of extracted (Ontology) entities
+        :return:
+            a dictionary of each entity to the (x,y) coordinates
+            the value is None for an entity that could not be located
+        """
+        from nlusvc.coords.svc import PerformCoordExtraction
+
+        svc = PerformCoordExtraction(is_debug=self.is_debug,
+                                     ontology_name=self._ontology_name)
+
+        return svc.process_all(input_text=input_text,
+                               entity_texts=entity_texts)
+
     def has_match(self,
                   a_token: str,
                   some_text: str) -> bool:
@@ -77,6 +77,10 @@ class EvidenceExtractor(BaseObject):
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1359#issue-10828085
             *   add transform-records
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1359#issuecomment-16009176
+        Updated:
+            18-Oct-2026
+            *   preserve record order in transform-records (dictionaries are not sortable)
+            *   add results() for chunk-level evidence extraction
         :param some_records:
         :param xdm_schema:
         :param is_debug:
@@ -111,9 +115,9 @@ class EvidenceExtractor(BaseObject):
             return [some_records]
         elif type(some_records) == list:
             master = []
-            for record in sorted(some_records):
+            for record in some_records:
                 if type(record) == list:
-                    master += sorted(record)
+                    master += record
                 elif type(record) == dict:
                     master.append(record)
                 else:
@@ -220,8 +224,12 @@ class EvidenceExtractor(BaseObject):
 
         return results
 
-    def process(self) -> DataFrame or None:
-
+    def results(self) -> list:
+        """
+        :return:
+            a list of evidence structures (in record order)
+            tags without a name produce no evidence
+        """
         results = []
         for record in self._records:
             key_field = record["key_field"]
@@ -229,7 +237,10 @@ class EvidenceExtractor(BaseObject):
                 results += self._extract_results_from_field(field=field,
                                                             key_field=key_field)
 
-        df_evidence = pd.DataFrame(results)
+        return [x for x in results if x]
+
+    def process(self) -> DataFrame or None:
+        df_evidence = pd.DataFrame(self.results())
 
         if self._is_debug:
             self.logger.debug("\n".join([
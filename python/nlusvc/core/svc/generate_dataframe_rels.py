@@ -9,11 +9,7 @@ from pandas import DataFrame
 from tabulate import tabulate
 
 from base import BaseObject
-from datadict import FindDimensions
-from datadict import FindEntity
-from datadict import FindPatterns
-from datadict import FindRelationships
-from datadict import FindSynonym
+from datadict import OntologyRegistry
 from nlutext import NormalizeIncomingText
 
 
@@ -80,6 +76,9 @@ class GenerateDataFrameRels(BaseObject):
             craig.trim@ibm.com
             *   load dictionaries by ontology name
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1582
+        Updated:
+            18-Oct-2026
+            *   retrieve all relationships for a tag with a single 'lookup-many' call
         :param xdm_schema:
             the name of the schema to perform the type lookup
             Notes:
@@ -136,17 +135,16 @@ class GenerateDataFrameRels(BaseObject):
         self.add_wiki_references = add_wiki_references
         self.filter_on_key_terms = filter_on_key_terms
 
-        self.pattern_finder = FindPatterns(is_debug=is_debug,
-                                           ontology_name=ontology_name)
-        self.entity_finder = FindEntity(is_debug=is_debug,
-                                        ontology_name=ontology_name)
-        self.synonym_finder = FindSynonym(is_debug=is_debug,
-                                          ontology_name=ontology_name)
-        self.rel_finder = FindRelationships(is_debug=is_debug,
-                                            ontology_name=ontology_name)
-        self._dim_finder = FindDimensions(schema=xdm_schema,
-                                          is_debug=is_debug,
-                                          ontology_name=ontology_name)
+        self.pattern_finder = OntologyRegistry(is_debug=is_debug,
+                                               ontology_name=ontology_name).patterns()
+        self.entity_finder = OntologyRegistry(is_debug=is_debug,
+                                              ontology_name=ontology_name).entity()
+        self.synonym_finder = OntologyRegistry(is_debug=is_debug,
+                                               ontology_name=ontology_name).synonyms()
+        self.rel_finder = OntologyRegistry(is_debug=is_debug,
+                                           ontology_name=ontology_name).relationships()
+        self._dim_finder = OntologyRegistry(is_debug=is_debug,
+                                            ontology_name=ontology_name).dimensions(xdm_schema)
 
         total_time = time.time() - start
         if self._is_debug:
@@ -190,6 +188,9 @@ class GenerateDataFrameRels(BaseObject):
         s_unique.add(an_existing_tag)
 
         if self.add_tag_rels:
+            d_rels = self.rel_finder.lookup_many(tags=[an_existing_tag],
+                                                 rel_types=['part_of', 'produces', 'producedBy',
+                                                            'runsOn', 'similar_to', 'parents'])[an_existing_tag]
 
             # [self._add(inference_counter=inference_counter + 1,
             #            an_existing_tag=an_existing_tag,
@@ -230,7 +231,7 @@ class GenerateDataFrameRels(BaseObject):
                        an_implied_tag=x,
                        original_tags=original_tags,
                        s_unique=s_unique,
-                       results=results) for x in self.rel_finder.part_of(an_existing_tag)]
+                       results=results) for x in d_rels["part_of"]]
 
             # [self._add(inference_counter=inference_counter + 1,
             #            an_existing_tag=an_existing_tag,
@@ -246,7 +247,7 @@ class GenerateDataFrameRels(BaseObject):
                        an_implied_tag=x,
                        original_tags=original_tags,
                        s_unique=s_unique,
-                       results=results) for x in self.rel_finder.produces(an_existing_tag)]
+                       results=results) for x in d_rels["produces"]]
 
             [self._add(inference_counter=inference_counter + 1,
                        an_existing_tag=an_existing_tag,
@@ -254,7 +255,7 @@ class GenerateDataFrameRels(BaseObject):
                        an_implied_tag=x,
                        original_tags=original_tags,
                        s_unique=s_unique,
-                       results=results) for x in self.rel_finder.producedBy(an_existing_tag)]
+                       results=results) for x in d_rels["producedBy"]]
 
             [self._add(inference_counter=inference_counter + 1,
                        an_existing_tag=an_existing_tag,
@@ -262,7 +263,7 @@ class GenerateDataFrameRels(BaseObject):
                        an_implied_tag=x,
                        original_tags=original_tags,
                        s_unique=s_unique,
-                       results=results) for x in self.rel_finder.runsOn(an_existing_tag)]
+                       results=results) for x in d_rels["runsOn"]]
 
             # if self.add_rel_owns:
             #     _owns_references = self.rel_finder.owns(an_existing_tag,
@@ -282,7 +283,7 @@ class GenerateDataFrameRels(BaseObject):
                        an_implied_tag=x,
                        original_tags=original_tags,
                        s_unique=s_unique,
-                       results=results) for x in self.rel_finder.similar_to(an_existing_tag)]
+                       results=results) for x in d_rels["similar_to"]]
 
             [self._add(inference_counter=inference_counter + 1,
                        an_existing_tag=an_existing_tag,
@@ -290,7 +291,7 @@ class GenerateDataFrameRels(BaseObject):
                        an_implied_tag=x,
                        original_tags=original_tags,
                        s_unique=s_unique,
-                       results=results) for x in self.rel_finder.parents(an_existing_tag)]
+                       results=results) for x in d_rels["parents"]]
 
             # _child_references = self.rel_finder.parent_of(an_existing_tag)
             # if len(_child_references) < 10:
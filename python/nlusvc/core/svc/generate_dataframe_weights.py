@@ -12,6 +12,9 @@ from base import BaseObject
 from datadict import FindBadges
 from datadict import FindDimensions
 
+EXPLICIT_SCHEMA_WEIGHT = 1.0
+IMPLICIT_SCHEMA_WEIGHT = 0.2
+
 
 class GenerateDataframeWeights(BaseObject):
 
@@ -55,6 +58,10 @@ class GenerateDataframeWeights(BaseObject):
             craig.trim@ibm.com
             *   remove 'entity-schema-finder' in favor of new approach
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/916#issuecomment-15620801
+        Updated:
+            18-Oct-2026
+            *   renamed 'find-weight' to 'rule-weight' for use by the batch dimension engine
+            *   'inference', 'transform' and 'schema-weights' are shared with the batch dimension engine
         :param xdm_schema:
             the name of the schema to perform the type lookup
             Notes:
@@ -102,11 +109,11 @@ class GenerateDataframeWeights(BaseObject):
 
         return pd.DataFrame(results)
 
-    def _find_weight(self,
-                     collection: str,
-                     field_name: str,
-                     tags: list,
-                     original_text: str) -> float:
+    def rule_weight(self,
+                    collection: str,
+                    field_name: str,
+                    tags: list,
+                    original_text: str) -> float:
 
         def _collection_weight() -> float:
             if self._add_provenance_weight:
@@ -157,58 +164,121 @@ class GenerateDataframeWeights(BaseObject):
         return total_weight
 
     @staticmethod
-    def _transform(df_evidence: DataFrame,
-                   df_inference: DataFrame) -> []:
+    def inference(df_inference: DataFrame) -> dict:
+        """
+        Purpose:
+            Count the schemas each tag is related to by inference
+        :param df_inference:
+            a pandas DataFrame containing implicit (inferred) tags
+        :return:
+            a dictionary keyed by tag with a Counter of schemas
+            a schema is counted once for each of
+                the explicit and implicit schemas of the rows where the tag is the explicit tag
+                the explicit and implicit schemas of the rows where the tag is the implicit tag
+        """
+        d_explicit = {}
+        d_implicit = {}
+        for row in df_inference[['ExplicitSchema', 'ExplicitTag',
+                                 'ImplicitSchema', 'ImplicitTag']].itertuples(index=False):
+            explicit_schema, explicit_tag, implicit_schema, implicit_tag = row
+            for d_tags, a_tag in [(d_explicit, explicit_tag), (d_implicit, implicit_tag)]:
+                if a_tag not in d_tags:
+                    d_tags[a_tag] = (set(), set())
+                d_tags[a_tag][0].add(explicit_schema)
+                d_tags[a_tag][1].add(implicit_schema)
+
+        d_counts = {}
+        for d_tags in [d_explicit, d_implicit]:
+            for a_tag, schema_sets in d_tags.items():
+                if a_tag not in d_counts:
+                    d_counts[a_tag] = Counter()
+                for schema_set in schema_sets:
+                    d_counts[a_tag].update(schema_set)
+
+        return d_counts
+
+    @staticmethod
+    def transform(evidence: list,
+                  d_inference: dict) -> list:
         """
         Purpose:
-            Merge (and summarize) both incoming DataFrames into a single dictionary
+            Merge (and summarize) the evidence and the inference into a single dictionary
+            by original text and then by explicit schema (in order of occurrence)
         Rationale:
             Optimize information for Rules-based processing
         Reference:
             https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/818#issuecomment-14070410
+        :param evidence:
+            a list of evidence records (the rows of the evidence DataFrame)
+        :param d_inference:
+            the schema counts by tag (see 'inference')
         :return:
             a merged dictionary
         """
-        results = []
-
-        for original_text in df_evidence['OriginalText'].unique():
-            df2 = df_evidence[df_evidence['OriginalText'] == original_text]
-            field_name = list(df2['FieldName'].unique())[0]
-            collection = list(df2['Collection'].unique())[0]
+        d_texts = {}
+        for result in evidence:
+            original_text = result["OriginalText"]
+            if original_text not in d_texts:
+                d_texts[original_text] = {
+                    "FieldName": result["FieldName"],
+                    "Collection": result["Collection"],
+                    "Schemas": {}}
+
+            d_schemas = d_texts[original_text]["Schemas"]
+            schema = result["Schema"]
+            if schema not in d_schemas:
+                d_schemas[schema] = {
+                    "Confidence": result["TagScore"],
+                    "Tags": []}
+            if result["Tag"] not in d_schemas[schema]["Tags"]:
+                d_schemas[schema]["Tags"].append(result["Tag"])
 
+        results = []
+        for original_text, d_text in d_texts.items():
             explicit_schema_counter = Counter()
-            for explicit_schema in df2['Schema'].unique():
-
+            for explicit_schema, d_schema in d_text["Schemas"].items():
                 explicit_schema_counter.update({explicit_schema: 1})
 
-                df3 = df2[df2['Schema'] == explicit_schema]
-                confidence = df3['TagScore'].unique()[0]
-
                 implicit_schema_counter = Counter()
-
-                for tag in df3['Tag'].unique():
-                    df_infer_1 = df_inference[df_inference['ExplicitTag'] == tag]
-                    df_infer_2 = df_inference[df_inference['ImplicitTag'] == tag]
-
-                    schemas = []
-                    schemas += list(df_infer_1['ExplicitSchema'].unique())
-                    schemas += list(df_infer_1['ImplicitSchema'].unique())
-                    schemas += list(df_infer_2['ExplicitSchema'].unique())
-                    schemas += list(df_infer_2['ImplicitSchema'].unique())
-
-                    [implicit_schema_counter.update({x: 1}) for x in schemas]
+                for tag in d_schema["Tags"]:
+                    if tag in d_inference:
+                        implicit_schema_counter.update(d_inference[tag])
 
                 results.append({
                     "OriginalText": original_text,
-                    "FieldName": field_name,
-                    "Collection": collection,
-                    "Confidence": confidence,
-                    "Tags": sorted(df3['Tag'].unique()),
+                    "FieldName": d_text["FieldName"],
+                    "Collection": d_text["Collection"],
+                    "Confidence": d_schema["Confidence"],
+                    "Tags": sorted(d_schema["Tags"]),
                     "ExplicitSchemas": dict(explicit_schema_counter),
                     "ImplicitSchemas": dict(implicit_schema_counter)})
 
         return results
 
+    @staticmethod
+    def schema_weights(result: dict,
+                       rule_weight: float) -> list:
+        """
+        Purpose:
+            Weight each schema of a transformed result
+        :param result:
+            a single result of 'transform'
+        :param rule_weight:
+            the rule weight of the result
+        :return:
+            a list of (schema, weight) tuples
+            explicit schemas first, then implicit schemas
+        """
+        confidence_weight = float(result["Confidence"]) / 100
+
+        weights = []
+        for schema_type, schema_weight in [("ExplicitSchemas", EXPLICIT_SCHEMA_WEIGHT),
+                                           ("ImplicitSchemas", IMPLICIT_SCHEMA_WEIGHT)]:
+            for a_schema, count in result[schema_type].items():
+                weights.append((a_schema, rule_weight * count * confidence_weight * schema_weight))
+
+        return weights
+
     def process(self,
                 df_evidence: DataFrame,
                 df_inference: DataFrame) -> DataFrame:
@@ -228,8 +298,8 @@ class GenerateDataframeWeights(BaseObject):
             if schema not in d_weights:
                 d_weights[schema] = []
 
-        results = self._transform(df_evidence=df_evidence,
-                                  df_inference=df_inference)
+        results = self.transform(evidence=df_evidence.to_dict('records'),
+                                 d_inference=self.inference(df_inference))
 
         if self._is_debug:
             self.logger.debug('\n'.join([
@@ -237,42 +307,26 @@ class GenerateDataframeWeights(BaseObject):
                 pprint.pformat(results, indent=4)]))
 
         for result in results:
-            rule_weight = self._find_weight(collection=result["Collection"],
-                                            field_name=result["FieldName"],
-                                            tags=result["Tags"],
-                                            original_text=result["OriginalText"])
-
-            confidence_weight = float(result["Confidence"]) / 100
-
-            def apply_to_schema(schema_type: str,
-                                schema_weight: float) -> None:
-
-                for a_schema in result[schema_type]:
-                    count = result[schema_type][a_schema]
-                    total_weight = rule_weight * count * confidence_weight * schema_weight
-
-                    if a_schema not in d_weights:
-                        d_weights[a_schema] = []
-                    d_weights[a_schema].append(total_weight)
-
-                    if self._is_debug:
-                        self.logger.debug('\n'.join([
-                            "Final Weighting:",
-
-                            f"\tSchema ("
-                            f"name={a_schema}, type={schema_type})",
-
-                            f"\tWeights ("
-                            f"schema={schema_weight}, "
-                            f"count={count}, "
-                            f"rule={rule_weight}, "
-                            f"confidence={confidence_weight}, "
-                            f"total={round(total_weight, 2)})"]))
-
-            apply_to_schema(schema_type="ExplicitSchemas",
-                            schema_weight=1.0)
-
-            apply_to_schema(schema_type="ImplicitSchemas",
-                            schema_weight=0.2)
+            rule_weight = self.rule_weight(collection=result["Collection"],
+                                           field_name=result["FieldName"],
+                                           tags=result["Tags"],
+                                           original_text=result["OriginalText"])
+
+            for a_schema, total_weight in self.schema_weights(result, rule_weight):
+                if a_schema not in d_weights:
+                    d_weights[a_schema] = []
+                d_weights[a_schema].append(total_weight)
+
+                if self._is_debug:
+                    self.logger.debug('\n'.join([
+                        "Final Weighting:",
+
+                        f"\tSchema ("
+                        f"name={a_schema})",
+
+                        f"\tWeights ("
+                        f"rule={rule_weight}, "
+                        f"confidence={result['Confidence']}, "
+                        f"total={round(total_weight, 2)})"]))
 
         return self._to_dataframe(d_weights)
@@ -45,6 +45,9 @@ class DisplacySpanExtractor(BaseObject):
             craig.trim@ibm.com
             *   Replace code with Coordinate Extraction service
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1722
+        Updated:
+            18-Oct-2026
+            *   extract the coordinates of all tags in one call
         :param d_cluster:
             a dictionary that clusters the tags around the chosen dimensions
             Sample Input:
@@ -115,11 +118,14 @@ class DisplacySpanExtractor(BaseObject):
 
         input_text = self._input_text.lower()
 
+        d_all_coords = self._text_api.coords_all(input_text=input_text,
+                                                 entity_texts=[tag for key in self._d_cluster
+                                                               for tag in self._d_cluster[key]])
+
         for key in self._d_cluster:
             for tag in self._d_cluster[key]:
 
-                d_coords = self._text_api.coords(input_text=input_text,
-                                                 entity_text=tag)
+                d_coords = d_all_coords[tag]
 
                 if not d_coords:
                     continue
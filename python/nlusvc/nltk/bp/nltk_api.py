@@ -64,6 +64,34 @@ class NtlkAPI(BaseObject):
         return svc.multiple(input_text=input_text,
                             candidate_matches=candidate_matches)
 
+    def edit_distance_nearest(self,
+                              input_texts: list,
+                              candidate_matches: list,
+                              top_k: int = None,
+                              max_distance: int = None) -> DataFrame:
+        """
+        Purpose:
+            Provide index-backed NLTK edit distance matching
+            the candidates are indexed once (per vocabulary) and shared by every query
+        :param input_texts:
+            a list of one-or-more string values to compare to
+        :param candidate_matches:
+            a list of one-or-more key terms
+        :param top_k:
+            (Optional) the maximum number of matches per input text
+        :param max_distance:
+            (Optional) the maximum distance of a match (inclusive)
+        :return:
+            a pandas DataFrame (in the format of 'edit-distance-multiple')
+        """
+        from nlusvc.nltk.svc import FindEditDistance
+
+        svc = FindEditDistance(is_debug=self._is_debug)
+        return svc.nearest(input_texts=input_texts,
+                           candidate_matches=candidate_matches,
+                           top_k=top_k,
+                           max_distance=max_distance)
+
 
 if __name__ == "__main__":
     tokens = ['Conosa',
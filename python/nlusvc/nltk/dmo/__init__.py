@@ -1 +1,2 @@
+from .edit_distance_index import EditDistanceIndex
 from .nltk_edit_distance import NltkEditDistance
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import heapq
+from typing import Optional
+
+from base import BaseObject
+
+
+class EditDistanceIndex(BaseObject):
+    """
+    Purpose:
+        A Nearest-Neighbour Index (BK-Tree) over a Candidate Vocabulary for Edit Distance Matching
+
+    Implementation:
+        -   each candidate is normalized as dmo:NltkEditDistance normalizes it
+            (lower-case, tokenized and stemmed)
+        -   each distinct normalized form is one node in the tree;
+            a child is keyed by its (Levenshtein) distance from the parent
+        -   the triangle inequality bounds the search:
+                a query within distance 'r' of a node at distance 'd'
+                only needs the children keyed in [d-r, d+r]
+        -   distances are computed with an early cutoff
+            as soon as every alignment exceeds the bound the computation stops
+
+    Distances are identical to those computed by dmo:NltkEditDistance
+    """
+
+    def __init__(self,
+                 candidate_matches: list,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   index the candidates once rather than compute the edit distance
+                against every candidate per query in svc:FindEditDistance
+        :param candidate_matches:
+            a list of candidate terms (e.g., an ontology label set)
+        :param is_debug:
+            if True     increase log output at DEBUG level
+        """
+        from nlusvc.nltk.dmo import NltkEditDistance
+
+        BaseObject.__init__(self, __name__)
+        self._is_debug = is_debug
+        self._edit_distance = NltkEditDistance(is_debug=is_debug)
+
+        self._root = None
+        self._d_candidates = {}  # normalized form -> [(ordinal, candidate), ...]
+
+        for ordinal, candidate in enumerate(candidate_matches):
+            self._add(ordinal, candidate.lower().strip())
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Built Edit Distance Index",
+                f"\tTotal Candidates: {len(candidate_matches)}",
+                f"\tTotal Nodes: {len(self._d_candidates)}"]))
+
+    def __len__(self) -> int:
+        return len(self._d_candidates)
+
+    @staticmethod
+    def distance(s1: str,
+                 s2: str,
+                 max_distance: int = None) -> Optional[int]:
+        """
+        Purpose:
+            Compute the Levenshtein Distance between two (normalized) strings
+        :param max_distance:
+            (Optional) stop as soon as the distance is known to exceed this value
+        :return:
+            the distance
+            None if the distance exceeds 'max-distance'
+        """
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
+        if max_distance is not None and len(s1) - len(s2) > max_distance:
+            return None
+
+        previous = list(range(len(s2) + 1))
+        for i, c1 in enumerate(s1, 1):
+            current = [i]
+            for j, c2 in enumerate(s2, 1):
+                current.append(min(previous[j] + 1,
+                                   current[j - 1] + 1,
+                                   previous[j - 1] + (c1 != c2)))
+
+            if max_distance is not None and min(current) > max_distance:
+                return None
+            previous = current
+
+        distance = previous[-1]
+        if max_distance is not None and distance > max_distance:
+            return None
+        return distance
+
+    def _add(self,
+             ordinal: int,
+             candidate: str) -> None:
+        term = self._edit_distance.normalize(candidate)
+
+        if term in self._d_candidates:
+            if candidate not in [x[1] for x in self._d_candidates[term]]:
+                self._d_candidates[term].append((ordinal, candidate))
+            return
+
+        self._d_candidates[term] = [(ordinal, candidate)]
+
+        if self._root is None:
+            self._root = (term, {})
+            return
+
+        node = self._root
+        while True:
+            d = self.distance(term, node[0])
+            if d not in node[1]:
+                node[1][d] = (term, {})
+                return
+            node = node[1][d]
+
+    def _search(self,
+                term: str,
+                max_distance: int = None,
+                top_k: int = None) -> list:
+        """
+        :return:
+            a list of (distance, ordinal, normalized form) tuples
+        """
+        results = []  # a max-heap of (-distance, -ordinal, normalized form)
+
+        def _radius() -> int or None:
+            if top_k and len(results) >= top_k:
+                radius = -results[0][0]
+                if max_distance is not None:
+                    return min(radius, max_distance)
+                return radius
+            return max_distance
+
+        def _add(distance: int,
+                 a_term: str) -> None:
+            ordinal = self._d_candidates[a_term][0][0]
+            item = (-distance, -ordinal, a_term)
+            if not top_k:
+                results.append(item)
+            elif len(results) < top_k:
+                heapq.heappush(results, item)
+            elif item > results[0]:
+                heapq.heapreplace(results, item)
+
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            radius = _radius()
+
+            if radius is None:
+                d = self.distance(term, node[0])
+            else:
+                bound = radius + max(node[1].keys(), default=0)
+                d = self.distance(term, node[0], max_distance=bound)
+                if d is None:
+                    continue
+
+            if radius is None or d <= radius:
+                _add(d, node[0])
+                radius = _radius()
+
+            for k, child in node[1].items():
+                if radius is None or d - radius <= k <= d + radius:
+                    stack.append(child)
+
+        return sorted([(-x[0], -x[1], x[2]) for x in results])
+
+    def search(self,
+               input_text: str,
+               max_distance: int = None,
+               top_k: int = None) -> list:
+        """
+        Purpose:
+            Find the candidates nearest to the input text
+        :param input_text:
+            an input string
+        :param max_distance:
+            (Optional) the maximum distance of any match (inclusive)
+        :param top_k:
+            (Optional) the maximum number of matches
+            matches at the same distance are returned in candidate order
+        :return:
+            a list of matches sorted by distance
+            Sample Output:
+                [   {'Input': 'cristae', 'Candidate': 'crista', 'Distance': 0},
+                    {'Input': 'cristae', 'Candidate': 'cristae', 'Distance': 0},
+                    {'Input': 'cristae', 'Candidate': 'cryptista', 'Distance': 3} ]
+        """
+        input_text = input_text.lower().strip()
+        term = self._edit_distance.normalize(input_text)
+
+        matches = []
+        for distance, _, a_term in self._search(term,
+                                                max_distance=max_distance,
+                                                top_k=top_k):
+            for ordinal, candidate in self._d_candidates[a_term]:
+                matches.append((distance, ordinal, candidate))
+
+        matches = sorted(matches)
+        if top_k:
+            matches = matches[:top_k]
+
+        return [{"Input": input_text,
+                 "Candidate": candidate,
+                 "Distance": distance} for distance, _, candidate in matches]
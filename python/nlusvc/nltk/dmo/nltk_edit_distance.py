@@ -79,6 +79,17 @@ class NltkEditDistance(BaseObject):
         self.d_cache_normalize[text] = _process()
         return self.d_cache_normalize[text]
 
+    def normalize(self,
+                  text: str) -> str:
+        """
+        :param text:
+            an input string
+        :return:
+            the normalized (lower-cased, tokenized and stemmed) form
+            used to compute the edit distance
+        """
+        return self._normalize(text)
+
     def process(self,
                 s1: str,
                 s2: str) -> int:
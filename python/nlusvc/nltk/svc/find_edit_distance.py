@@ -2,6 +2,8 @@
 # -*- coding: UTF-8 -*-
 
 
+from collections import OrderedDict
+
 import pandas as pd
 from pandas import DataFrame
 
@@ -11,6 +13,10 @@ from base import BaseObject
 class FindEditDistance(BaseObject):
     """ Perform Edit Distance Matching across multiple strings """
 
+    MAX_CACHED_INDEXES = 4
+
+    __indexes = OrderedDict()  # candidate vocabulary -> EditDistanceIndex
+
     def __init__(self,
                  is_debug: bool = False):
         """
@@ -22,6 +28,9 @@ class FindEditDistance(BaseObject):
             craig.trim@ibm.com
             *   minor updates in pursuit of
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1829
+        Updated:
+            18-Oct-2026
+            *   add 'nearest' for index-backed (top-k or within-distance) matching
         """
         BaseObject.__init__(self, __name__)
         self._is_debug = is_debug
@@ -106,3 +115,76 @@ class FindEditDistance(BaseObject):
         dmo = NltkEditDistance(is_debug=self._is_debug)
         return dmo.process(s1=input_text,
                            s2=candidate_match)
+
+    def _index(self,
+               candidate_matches: list):
+        """
+        Purpose:
+            Retrieve (or build) the index for a candidate vocabulary
+            the most recently used indexes are kept for subsequent queries
+        """
+        from nlusvc.nltk.dmo import EditDistanceIndex
+
+        key = tuple(candidate_matches)
+        if key in self.__indexes:
+            self.__indexes.move_to_end(key)
+            return self.__indexes[key]
+
+        index = EditDistanceIndex(is_debug=self._is_debug,
+                                  candidate_matches=candidate_matches)
+
+        self.__indexes[key] = index
+        while len(self.__indexes) > self.MAX_CACHED_INDEXES:
+            self.__indexes.popitem(last=False)
+
+        return index
+
+    def nearest(self,
+                input_texts: list,
+                candidate_matches: list,
+                top_k: int = None,
+                max_distance: int = None) -> DataFrame:
+        """
+        Purpose:
+            Find the nearest candidates to each input text
+            the candidates are indexed once and the index is shared by every input text
+            (and by subsequent calls with the same candidates)
+        Sample Input:
+            Input Texts:
+                [ 'cristae' ]
+            Candidate Matches:
+                (as for 'multiple')
+            Max Distance:
+                3
+        Sample Output:
+            +----+----------------------+------------+---------+
+            |    | Candidate            |   Distance | Input   |
+            |----+----------------------+------------+---------|
+            |  0 | crista               |          0 | cristae |
+            |  1 | cristae              |          0 | cristae |
+            |  2 | cryptista            |          3 | cristae |
+            +----+----------------------+------------+---------+
+        :param input_texts:
+            a list of one-or-more input strings
+        :param candidate_matches:
+            a list of one-or-more matches to compare against
+        :param top_k:
+            (Optional) the maximum number of matches per input text
+        :param max_distance:
+            (Optional) the maximum distance of a match (inclusive)
+        :return:
+            the matches for each input text (in input order) sorted by distance
+            the distances are those computed by 'multiple'
+        """
+        if not top_k and max_distance is None:
+            raise ValueError("Either Top-K or Max Distance is required")
+
+        index = self._index(candidate_matches)
+
+        results = []
+        for input_text in input_texts:
+            results += index.search(input_text=input_text,
+                                    top_k=top_k,
+                                    max_distance=max_distance)
+
+        return pd.DataFrame(results, columns=["Input", "Candidate", "Distance"])
@@ -1,5 +1,6 @@
 from .entity_to_tag_generator import EntityToTagGenerator
 from .exact_entity_matcher import ExactEntityMatcher
+from .long_distance_index import LongDistanceIndex
 from .long_distance_matcher import LongDistanceMatcher
 from .long_distance_scoring import LongDistanceScoring
 from .value_to_tag_generator import ValueToTagGenerator
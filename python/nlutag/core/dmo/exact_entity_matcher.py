@@ -7,7 +7,7 @@ from math import log
 
 from base import BaseObject
 from base import MandatoryParamError
-from datadict import FindEntity
+from datadict import OntologyRegistry
 from nlutag.core.dto.token_match import TokenMatches
 
 
@@ -73,8 +73,8 @@ class ExactEntityMatcher(BaseObject):
         self._matches = some_matches
         self._ontology_name = ontology_name
 
-        self._entity_finder = FindEntity(is_debug=self._is_debug,
-                                         ontology_name=self._ontology_name)
+        self._entity_finder = OntologyRegistry(is_debug=self._is_debug,
+                                               ontology_name=self._ontology_name).entity()
 
         if self._is_debug:
             self.logger.debug("\n".join([
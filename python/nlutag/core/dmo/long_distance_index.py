@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+from collections import Counter
+
+from base import BaseObject
+from datadict import FindPatterns
+from datadict import OntologyRegistry
+
+# suffixes tolerated by 'LongDistanceMatcher._get_token_regexp'
+LDM_SUFFIXES = ['e', 'ed', 'ing', 'es', 'eth', 'er', 'esses', 'ly']
+
+# tokens containing these characters are interpreted as regular expressions
+# by the long-distance matcher and can not be resolved by a simple lookup
+REGEXP_CHARS = set('.^$*+?{}[]\\|()')
+
+
+class LongDistanceIndex(BaseObject):
+    """ Inverted Token Index for Long Distance Matching
+
+        Each long-distance formation is indexed under its rarest token;
+        only formations whose rarest token is present in the input
+        are evaluated by the Long Distance Matcher """
+
+    _d_index = {}
+
+    def __init__(self,
+                 ontology_name: str,
+                 pattern_finder: FindPatterns = None,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   avoid evaluating every long-distance formation per input
+        :param ontology_name:
+            the ontology the index is built for (built once per ontology)
+        :param pattern_finder:
+            an optional instantiation of FindPatterns
+        """
+        BaseObject.__init__(self, __name__)
+        self._is_debug = is_debug
+        self._ontology_name = ontology_name
+
+        if self._ontology_name not in self._d_index:
+            if not pattern_finder:
+                pattern_finder = OntologyRegistry(is_debug=self._is_debug,
+                                                  ontology_name=self._ontology_name).patterns()
+            self._d_index[self._ontology_name] = self._build(pattern_finder)
+
+    @staticmethod
+    def _is_indexable(token: str) -> bool:
+        if not token or token != token.strip() or ' ' in token:
+            return False
+        return not len(REGEXP_CHARS.intersection(token))
+
+    def _build(self,
+               pattern_finder: FindPatterns) -> dict:
+        formations = []
+        for group in pattern_finder.long_distance():
+            formations += group
+
+        c_tokens = Counter()
+        for formation in formations:
+            c_tokens.update(set(formation["pattern"]))
+
+        d_index = {}
+        unindexed = []
+        for ordinal, formation in enumerate(formations):
+            tokens = [x for x in set(formation["pattern"])
+                      if self._is_indexable(x)]
+            if not len(tokens):
+                unindexed.append(ordinal)
+                continue
+
+            rarest = sorted(tokens, key=lambda x: (c_tokens[x], x))[0]
+            if rarest not in d_index:
+                d_index[rarest] = []
+            d_index[rarest].append(ordinal)
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Long Distance Index Built",
+                f"\tOntology Name: {self._ontology_name}",
+                f"\tTotal Formations: {len(formations)}",
+                f"\tTotal Index Keys: {len(d_index)}",
+                f"\tTotal Unindexed: {len(unindexed)}"]))
+
+        return {
+            "formations": formations,
+            "index": d_index,
+            "unindexed": unindexed}
+
+    @staticmethod
+    def _lookup_keys(ngrams: list) -> set:
+        """
+        Purpose:
+            Generate every token a formation could have been matched on
+            this includes the ngrams themselves, the whitespace delimited tokens
+            and the tokens with any tolerated suffix removed
+        """
+        from nlutag.core.dmo.long_distance_matcher import LDN_FALSE_POSITIVES
+
+        keys = set(ngrams)
+
+        sentence = " ".join(ngrams)
+        stripped = sentence
+        for values in LDN_FALSE_POSITIVES.values():
+            for value in values:
+                stripped = stripped.replace(value, "")
+
+        for token in set(sentence.split()).union(stripped.split()):
+            keys.add(token)
+            for suffix in LDM_SUFFIXES:
+                if token.endswith(suffix) and len(token) > len(suffix):
+                    keys.add(token[:-len(suffix)])
+
+        return keys
+
+    def formations(self) -> list:
+        return self._d_index[self._ontology_name]["formations"]
+
+    def candidates(self,
+                   *input_ngrams: list) -> list:
+        """
+        :param input_ngrams:
+            one-or-more lists of (normalized or stemmed) input ngrams
+        :return:
+            the candidate formations in ontology order
+        """
+        d_index = self._d_index[self._ontology_name]
+
+        keys = set()
+        for ngrams in input_ngrams:
+            keys = keys.union(self._lookup_keys(ngrams))
+
+        ordinals = set(d_index["unindexed"])
+        for key in keys:
+            if key in d_index["index"]:
+                ordinals.update(d_index["index"][key])
+
+        formations = d_index["formations"]
+        return [formations[x] for x in sorted(ordinals)]
@@ -10,7 +10,8 @@ from nltk.stem.snowball import SnowballStemmer
 from spacy.tokens import Doc
 
 from base import BaseObject
-from datadict import FindPatterns
+from datadict import OntologyRegistry
+from nlutag.core.dmo.long_distance_index import LongDistanceIndex
 from nlutag.core.dto.token_match import TokenMatches
 
 LDN_FALSE_POSITIVES = {
@@ -93,6 +94,9 @@ class LongDistanceMatcher(BaseObject):
             craig.trim@ibm.com
             *   pass in ontology name as a param
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/pull/1587
+        Updated:
+            18-Oct-2026
+            *   only evaluate candidate formations from the 'long-distance-index'
         :param doc:
             a spaCy document representing the (normalized) text
         :param some_input:
@@ -107,10 +111,13 @@ class LongDistanceMatcher(BaseObject):
         self._ontology_name = ontology_name
 
         self._is_debug = is_debug
-        self._pattern_finder = FindPatterns(is_debug=self._is_debug,
-                                            ontology_name=self._ontology_name)
+        self._pattern_finder = OntologyRegistry(is_debug=self._is_debug,
+                                                ontology_name=self._ontology_name).patterns()
         self._stemmer = SnowballStemmer(language="english",
                                         ignore_stopwords=False)
+        self._index = LongDistanceIndex(is_debug=self._is_debug,
+                                        ontology_name=self._ontology_name,
+                                        pattern_finder=self._pattern_finder)
 
     @staticmethod
     def normalize(some_dict):
@@ -268,57 +275,55 @@ class LongDistanceMatcher(BaseObject):
 
         stemmed_ngrams = self.stem(the_input_ngrams)
 
-        # for key in the_entity_revmap:
-        long_distance_patterns = self._pattern_finder.long_distance()
-
-        for formations in long_distance_patterns:
-
-            for formation in formations:
-                penalty = 0
-
-                label = formation["label"]
-                pattern = formation["pattern"]
-                label_size = len(label.split(' '))
-
-                # try the normal tuple
-                if self.has_exact_values(pattern, the_input_ngrams):
-
-                    score = self._normalize_score(self._score(pattern) + penalty)
-                    self._matches.add(some_key=label,
-                                      some_match=pattern,
-                                      some_type="ldm",
-                                      some_sub_type="n-tuple",
-                                      some_confidence=score)
-
-                # try a stemmed tuple
-                elif self.has_startswith_values(pattern,
-                                                stemmed_ngrams):
-                    score = self._normalize_score(70 - ((total_tokens / label_size) - total_input_ngrams))
-                    self._matches.add(some_key=label,
-                                      some_match=pattern,
-                                      some_type="ldm",
-                                      some_sub_type="s-tuple",
-                                      some_confidence=score)
-
-                # try a stemmed tuple
-                elif self.has_exact_values(pattern,
-                                           stemmed_ngrams):
-                    score = self._normalize_score(80 - ((total_tokens / label_size) - total_input_ngrams))
-                    self._matches.add(some_key=label,
-                                      some_match=pattern,
-                                      some_type="ldm",
-                                      some_sub_type="e-tuple",
-                                      some_confidence=score)
-
-                # try the normal tuple
-                elif self.has_startswith_values(pattern,
-                                                the_input_ngrams):
-                    score = self._normalize_score(90 - ((total_tokens / label_size) - total_input_ngrams))
-                    self._matches.add(some_key=label,
-                                      some_match=pattern,
-                                      some_type="ldm",
-                                      some_sub_type="n-tuple",
-                                      some_confidence=score)
+        candidates = self._index.candidates(the_input_ngrams,
+                                            stemmed_ngrams)
+
+        for formation in candidates:
+            penalty = 0
+
+            label = formation["label"]
+            pattern = formation["pattern"]
+            label_size = len(label.split(' '))
+
+            # try the normal tuple
+            if self.has_exact_values(pattern, the_input_ngrams):
+
+                score = self._normalize_score(self._score(pattern) + penalty)
+                self._matches.add(some_key=label,
+                                  some_match=pattern,
+                                  some_type="ldm",
+                                  some_sub_type="n-tuple",
+                                  some_confidence=score)
+
+            # try a stemmed tuple
+            elif self.has_startswith_values(pattern,
+                                            stemmed_ngrams):
+                score = self._normalize_score(70 - ((total_tokens / label_size) - total_input_ngrams))
+                self._matches.add(some_key=label,
+                                  some_match=pattern,
+                                  some_type="ldm",
+                                  some_sub_type="s-tuple",
+                                  some_confidence=score)
+
+            # try a stemmed tuple
+            elif self.has_exact_values(pattern,
+                                       stemmed_ngrams):
+                score = self._normalize_score(80 - ((total_tokens / label_size) - total_input_ngrams))
+                self._matches.add(some_key=label,
+                                  some_match=pattern,
+                                  some_type="ldm",
+                                  some_sub_type="e-tuple",
+                                  some_confidence=score)
+
+            # try the normal tuple
+            elif self.has_startswith_values(pattern,
+                                            the_input_ngrams):
+                score = self._normalize_score(90 - ((total_tokens / label_size) - total_input_ngrams))
+                self._matches.add(some_key=label,
+                                  some_match=pattern,
+                                  some_type="ldm",
+                                  some_sub_type="n-tuple",
+                                  some_confidence=score)
 
         if self._is_debug:
             if len(self._matches.get_matches()) > 0:
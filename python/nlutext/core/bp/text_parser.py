@@ -2,13 +2,17 @@
 # -*- coding: UTF-8 -*-
 
 
+import copy
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 from pandas import DataFrame
 
 from base import BaseObject
-from datadict import FindEntity
+from base import MemoCache
+from base import RedisClient
+from datadict import OntologyRegistry
 from nlutext.core.dmo import CertificationConfidenceComputer
 from nlutext.core.svc import PerformSupervisedParsing
 
@@ -22,8 +26,12 @@ class TextParser(BaseObject):
             a.  typically higher recall
     """
 
+    _d_caches = {}
+
     def __init__(self,
                  ontology_name: str = 'base',
+                 cache_size: int = 50000,
+                 use_redis_cache: bool = False,
                  is_debug: bool = False):
         """
         Created:
@@ -80,6 +88,19 @@ class TextParser(BaseObject):
             craig.trim@ibm.com
             *   load dictionaries by ontology name
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1582
+        Updated:
+            18-Oct-2026
+            *   add 'process-many' to tag many strings with a shared spaCy pipe
+                and an optional process pool
+            *   memoize normalization and tagging results in a bounded LRU cache
+            *   add 'process-batch' (legacy results for many strings)
+                batches consult and fill the tagging cache
+        :param cache_size:
+            the maximum number of tagged strings (and normalized strings) held in memory
+            0       do not cache
+        :param use_redis_cache:
+            if True     back the caches with Redis so they are shared across workers
+                        entries expire, and are keyed by the ontology build version
         """
         BaseObject.__init__(self, __name__)
         from nlutext.core.svc import NormalizeIncomingText
@@ -87,22 +108,64 @@ class TextParser(BaseObject):
         self._results = dict()
         self._is_debug = is_debug
         self._ontology_name = ontology_name
-        self._entity_finder = FindEntity(is_debug=is_debug,
-                                         ontology_name=ontology_name)
+        self._entity_finder = OntologyRegistry(is_debug=is_debug,
+                                               ontology_name=ontology_name).entity()
         self._normalizer = NormalizeIncomingText(is_debug=is_debug,
+                                                 cache_size=cache_size,
+                                                 use_redis_cache=use_redis_cache,
                                                  ontology_name=ontology_name)
+        self._cache = self._get_cache(cache_size, use_redis_cache)
 
         if self._is_debug:
             self.logger.debug('\n'.join([
                 "Instantiate TextParser",
                 f"\tOntology Name: {ontology_name}"]))
 
+    def _get_cache(self,
+                   cache_size: int,
+                   use_redis_cache: bool) -> MemoCache or None:
+        from datadict.core.dmo import DictionaryLoader
+
+        if not cache_size:
+            return None
+
+        # a regenerated ontology has a new version (and so a new cache)
+        version = DictionaryLoader(ontology_name=self._ontology_name).version()
+
+        key = (self._ontology_name, version, cache_size, use_redis_cache)
+        if key not in self._d_caches:
+            redis_db = RedisClient.NLU_CACHE_DB if use_redis_cache else None
+            self._d_caches[key] = MemoCache(name="text-parser",
+                                            max_size=cache_size,
+                                            redis_db=redis_db,
+                                            namespace=f"{self._ontology_name}_{version}",
+                                            is_debug=self._is_debug)
+
+        return self._d_caches[key]
+
+    def cache_stats(self) -> dict:
+        """
+        :return:
+            the hit/miss statistics of the tagging and normalization caches
+        """
+        if not self._cache:
+            return {}
+        return {
+            "tags": self._cache.stats(),
+            "normalization": self._normalizer.cache_stats()}
+
     def results(self) -> dict:
         return self._results
 
+    def _supervised_parser(self) -> PerformSupervisedParsing:
+        return PerformSupervisedParsing(is_debug=self._is_debug,
+                                        ontology_name=self._ontology_name)
+
     def _tags(self,
               original_ups: str,
-              normalized_ups: str) -> dict:
+              normalized_ups: str,
+              doc=None,
+              supervised_parser: PerformSupervisedParsing = None) -> dict:
 
         if not normalized_ups or len(normalized_ups) == 0:
             return {
@@ -110,9 +173,14 @@ class TextParser(BaseObject):
                 "unsupervised": []}
 
         # Create Supervised Tag Set
-        supervised_parser = PerformSupervisedParsing(is_debug=self._is_debug,
-                                                     ontology_name=self._ontology_name)
-        tags_1 = supervised_parser.process(original_ups, normalized_ups)
+        if not supervised_parser:
+            supervised_parser = self._supervised_parser()
+        if doc is None:
+            tags_1 = supervised_parser.process(original_ups, normalized_ups)
+        else:
+            tags_1 = supervised_parser.process_doc(doc=doc,
+                                                   original_ups=original_ups,
+                                                   normalized_ups=normalized_ups)
 
         # Remove Subsumed Tags
         subsumed = set()
@@ -166,6 +234,14 @@ class TextParser(BaseObject):
                     "original": original_ups,
                     "normalized": normalized_ups}}
 
+        return pd.DataFrame(self._to_records(original_ups=original_ups,
+                                             normalized_ups=normalized_ups,
+                                             tags=tags))
+
+    def _to_records(self,
+                    original_ups: str,
+                    normalized_ups: str,
+                    tags: dict) -> list:
         results = []
         for tag_tuple in tags["supervised"]:
             tag_label = self._entity_finder.label_or_self(tag_tuple[0])
@@ -175,7 +251,7 @@ class TextParser(BaseObject):
                 "Tag": tag_label,
                 "Confidence": tag_tuple[1]})
 
-        return pd.DataFrame(results)
+        return results
 
     def process(self,
                 original_ups: str,
@@ -208,6 +284,17 @@ class TextParser(BaseObject):
                         'original': 'the exocrine gland with prostate and redhat certified skills'}}
         """
 
+        key = (self._ontology_name, original_ups)
+        if self._cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                normalized_ups, tags = copy.deepcopy(cached)
+                self._results = self._to_result_set(original_ups=original_ups,
+                                                    normalized_ups=normalized_ups,
+                                                    tags=tags,
+                                                    as_dataframe=as_dataframe)
+                return self._results
+
         start = time.time()
 
         normalized_ups = self._normalizer.process(original_ups)["normalized"]
@@ -225,8 +312,170 @@ class TextParser(BaseObject):
             self.logger.debug(f"Tagging: {total_time}s")
 
         normalized_ups = self._postprocess(normalized_ups)
+        if self._cache:
+            self._cache.put(key, copy.deepcopy((normalized_ups, tags)))
+
         self._results = self._to_result_set(original_ups=original_ups,
                                             normalized_ups=normalized_ups,
                                             tags=tags,
                                             as_dataframe=as_dataframe)
         return self._results
+
+    def _parse_batch(self,
+                     texts: list,
+                     batch_size: int) -> dict:
+        """
+        Purpose:
+            Normalize and tag a batch of (unique) strings
+            the normalized strings are tokenized together via 'nlp.pipe'
+            strings already in the cache are not re-tagged
+        :return:
+            a dictionary keyed by input string of (normalized string, tags) tuples
+        """
+        d_results = {}
+
+        uncached = []
+        for text in texts:
+            cached = None
+            if self._cache:
+                cached = self._cache.get((self._ontology_name, text))
+            if cached is not None:
+                d_results[text] = copy.deepcopy(cached)
+            else:
+                uncached.append(text)
+
+        if not uncached:
+            return d_results
+
+        supervised_parser = self._supervised_parser()
+
+        normalized = [self._normalizer.process(x)["normalized"]
+                      for x in uncached]
+
+        docs = supervised_parser.docs(normalized, batch_size=batch_size)
+        for original_ups, normalized_ups, doc in zip(uncached, normalized, docs):
+            tags = self._tags(original_ups=original_ups,
+                              normalized_ups=normalized_ups,
+                              doc=doc,
+                              supervised_parser=supervised_parser)
+
+            result = (self._postprocess(normalized_ups), tags)
+            if self._cache:
+                self._cache.put((self._ontology_name, original_ups), copy.deepcopy(result))
+            d_results[original_ups] = result
+
+        return d_results
+
+    def _process_batch(self,
+                       texts: list,
+                       batch_size: int) -> dict:
+        """
+        :return:
+            a dictionary keyed by input string of result records
+        """
+        d_results = {}
+        for original_ups, (normalized_ups, tags) in self._parse_batch(texts, batch_size).items():
+            d_results[original_ups] = self._to_records(original_ups=original_ups,
+                                                       normalized_ups=normalized_ups,
+                                                       tags=tags)
+
+        return d_results
+
+    def process_batch(self,
+                      texts: list,
+                      batch_size: int = 1000) -> dict:
+        """
+        Purpose:
+            Tag many strings in a single call and return the legacy result for each
+            duplicate strings are only tagged once
+        :param texts:
+            a list of input strings
+        :param batch_size:
+            the number of strings normalized and tokenized together
+        :return:
+            a dictionary keyed by (unique) input string
+            each value is the result of 'process(as_dataframe=False)' for that string
+        """
+        unique = list(dict.fromkeys([x for x in texts if x]))
+
+        d_results = {}
+        for i in range(0, len(unique), batch_size):
+            d_batch = self._parse_batch(unique[i:i + batch_size], batch_size)
+            for original_ups, (normalized_ups, tags) in d_batch.items():
+                d_results[original_ups] = self._to_result_set(original_ups=original_ups,
+                                                              normalized_ups=normalized_ups,
+                                                              tags=tags,
+                                                              as_dataframe=False)
+
+        return d_results
+
+    def process_many(self,
+                     texts: list,
+                     batch_size: int = 1000,
+                     n_process: int = 1) -> DataFrame:
+        """
+        Purpose:
+            Tag many strings in a single call
+            duplicate strings are only tagged once
+        :param texts:
+            a list of input strings
+        :param batch_size:
+            the number of strings normalized and tokenized together
+        :param n_process:
+            the number of worker processes to fan the tagging out to
+            1       tag in this process
+        :return:
+            a single DataFrame with the same columns as 'process(as_dataframe=True)'
+            rows are in input order
+        """
+        start = time.time()
+
+        unique = list(dict.fromkeys([x for x in texts if x]))
+        batches = [unique[i:i + batch_size]
+                   for i in range(0, len(unique), batch_size)]
+
+        d_results = {}
+        if n_process <= 1 or len(batches) <= 1:
+            for batch in batches:
+                d_results.update(self._process_batch(batch, batch_size))
+        else:
+            with ProcessPoolExecutor(max_workers=n_process,
+                                     initializer=_init_worker,
+                                     initargs=(self._ontology_name, self._is_debug)) as executor:
+                for result in executor.map(_process_batch,
+                                           batches,
+                                           [batch_size] * len(batches)):
+                    d_results.update(result)
+
+        results = []
+        for text in texts:
+            if text in d_results:
+                results += d_results[text]
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Process Many Complete",
+                f"\tTotal Inputs: {len(texts)}",
+                f"\tTotal Unique: {len(unique)}",
+                f"\tTotal Tags: {len(results)}",
+                f"\tTotal Processes: {n_process}",
+                f"\tTime: {round(time.time() - start, 2)}s"]))
+
+        return pd.DataFrame(results,
+                            columns=["InputText", "NormalizedText", "Tag", "Confidence"])
+
+
+# each worker process builds (and reuses) a single parser
+_worker_parser = None
+
+
+def _init_worker(ontology_name: str,
+                 is_debug: bool) -> None:
+    global _worker_parser
+    _worker_parser = TextParser(is_debug=is_debug,
+                                 ontology_name=ontology_name)
+
+
+def _process_batch(texts: list,
+                   batch_size: int) -> dict:
+    return _worker_parser._process_batch(texts, batch_size)
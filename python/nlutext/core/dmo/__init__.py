@@ -1,4 +1,5 @@
 from .apostrophe_expansion import ApostropheExpansion
+from .automaton_synonym_swapper import AutomatonSynonymSwapper
 from .certification_confidence_computer import CertificationConfidenceComputer
 from .compute_skipgrams import ComputeSkipGrams
 from .enclictic_expansion import EnclicticExpansion
@@ -8,6 +9,7 @@ from .perform_semantic_segmentation import PerformSemanticSegmentation
 from .punctuation_remover import PunctuationRemover
 from .skipgram_generator import SkipgramGenerator
 from .spelling_corrector import SpellingCorrector
+from .symmetric_delete_index import SymmetricDeleteIndex
 from .synonym_swapper import SynonymSwapper
 from .text_normalizer import TextNormalizer
 from .text_preprocessor import TextPreprocessor
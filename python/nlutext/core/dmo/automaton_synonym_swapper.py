@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import time
+
+from base import BaseObject
+from base import MandatoryParamError
+from datadict import OntologyRegistry
+
+
+class AutomatonSynonymSwapper(BaseObject):
+    """ Swap Synonyms using a precompiled (word-level) Aho-Corasick Automaton
+
+        Behaves like 'SynonymSwapper' but locates every synonym in a single
+        pass over the input rather than testing each synonym against the input
+
+        The sequential semantics of 'SynonymSwapper' are kept:
+            n-gram levels are swapped from the highest to the lowest, and within a level
+            synonyms are swapped in dictionary order, each against the output of the previous swap
+            (a swap can create, or remove, a synonym for a later key or a lower level)
+
+        A synonym only matches whole (space separated) words, so the output differs where
+        'SynonymSwapper' rewrites on substrings:
+            -   a repeated synonym ('a a') is swapped at every occurrence,
+                where 'SynonymSwapper' skips an occurrence that shares a space with the previous one
+            -   where a synonym starts (or ends) the input, 'SynonymSwapper' also swaps it
+                inside other words, e.g. 'cert' in 'cert for concert now' """
+
+    _d_automata = {}
+
+    def __init__(self,
+                 some_input: str,
+                 some_iterations: int = 3,
+                 slow_log_threshold: int = 25,
+                 ontology_name: str = 'base',
+                 is_debug: bool = False,
+                 final_logger: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   alternative to 'synonym-swapper'
+                the automaton is built once per ontology from the by-word-length
+                synonym tables of 'find-synonym'
+        :param some_input:
+        :param some_iterations: the number of times to execute the synonym swap
+        """
+        BaseObject.__init__(self, __name__)
+        if not some_input:
+            raise MandatoryParamError("Input")
+
+        self.input = some_input
+        self.is_debug = is_debug
+        self.final_logger = final_logger
+        self.iterations = some_iterations
+        self._ontology_name = ontology_name
+        self._slow_log_threshold = slow_log_threshold
+
+        self._synonyms_finder = OntologyRegistry(is_debug=is_debug,
+                                                 ontology_name=ontology_name).synonyms()
+
+        if self._ontology_name not in self._d_automata:
+            self._d_automata[self._ontology_name] = self._build()
+
+    def _build(self) -> dict:
+        """
+        Purpose:
+            Build a word-level Aho-Corasick automaton
+        Implementation:
+            each state has
+                a goto table    (word -> next state)
+                a failure link  (the state of the longest proper suffix)
+                an output       a list of (level, rank, replacement) if a synonym ends here
+            and a dictionary link to the next state on the failure chain that has an output
+            the rank is the position of the (key, synonym) pair in the iteration order of 'synonym-swapper'
+        """
+        start = time.time()
+
+        goto = [{}]
+        depth = [0]
+        output = [[]]
+
+        rank = 0
+        level = self._synonyms_finder.max_ngram()
+        while level > 0:
+            for replacement in self._synonyms_finder.keys_in_swap_level(level):
+                for candidate in self._synonyms_finder.synonyms_in_swap_level(replacement, level):
+                    state = 0
+                    for word in candidate.split(' '):
+                        if word not in goto[state]:
+                            goto.append({})
+                            depth.append(depth[state] + 1)
+                            output.append([])
+                            goto[state][word] = len(goto) - 1
+                        state = goto[state][word]
+                    output[state].append((level, rank, replacement))
+                    rank += 1
+            level -= 1
+
+        fail = [0] * len(goto)
+        dict_link = [None] * len(goto)
+
+        queue = list(goto[0].values())
+        while queue:
+            next_queue = []
+            for state in queue:
+                for word, child in goto[state].items():
+                    f = fail[state]
+                    while f and word not in goto[f]:
+                        f = fail[f]
+                    fail[child] = goto[f][word] if word in goto[f] and goto[f][word] != child else 0
+                    dict_link[child] = fail[child] if output[fail[child]] else dict_link[fail[child]]
+                    next_queue.append(child)
+            queue = next_queue
+
+        if self.is_debug:
+            self.logger.debug('\n'.join([
+                "Synonym Automaton Built",
+                f"\tOntology Name: {self._ontology_name}",
+                f"\tTotal States: {len(goto)}",
+                f"\tTime: {round(time.time() - start, 2)}s"]))
+
+        return {
+            "goto": goto,
+            "fail": fail,
+            "depth": depth,
+            "output": output,
+            "dict_link": dict_link}
+
+    def _matches(self,
+                 tokens: list) -> list:
+        """
+        :param tokens:
+            the input split on spaces
+        :return:
+            a list of (level, rank, start, end, replacement) token spans
+        """
+        automaton = self._d_automata[self._ontology_name]
+        goto = automaton["goto"]
+        fail = automaton["fail"]
+        depth = automaton["depth"]
+        output = automaton["output"]
+        dict_link = automaton["dict_link"]
+
+        matches = []
+
+        state = 0
+        for i, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+
+            match = state if output[state] else dict_link[state]
+            while match:
+                for level, rank, replacement in output[match]:
+                    matches.append((level, rank, i + 1 - depth[match], i + 1, replacement))
+                match = dict_link[match]
+
+        return matches
+
+    def swap_by_regexp(self,
+                       some_normalized: str) -> str:
+        original = some_normalized
+        for regexp, replacement in self._synonyms_finder.regexps_with_synonyms().items():
+            some_normalized = regexp.sub(replacement, some_normalized)
+        if original != some_normalized:
+            while "  " in some_normalized:
+                some_normalized = some_normalized.replace("  ", " ")
+        return some_normalized
+
+    def swap_by_automaton(self,
+                          some_normalized: str) -> str:
+        """
+        Purpose:
+            Replace every synonym with its canonical form
+            in the order 'synonym-swapper' would replace them
+        :param some_normalized:
+        :return:
+            normalized string
+        """
+        tokens = some_normalized.split(' ')
+
+        matches = self._matches(tokens)
+        if not matches:
+            return some_normalized
+
+        level = self._synonyms_finder.max_ngram()
+        while level > 0:
+            last_rank = -1
+            while True:
+                candidates = [x for x in matches if x[0] == level and x[1] > last_rank]
+                if not candidates:
+                    break
+
+                # swap every (non-overlapping) occurrence of the next synonym in order
+                last_rank = min([x[1] for x in candidates])
+                spans = sorted([x[2:] for x in candidates if x[1] == last_rank])
+
+                occurrences = []
+                for start, end, replacement in spans:
+                    if occurrences and start < occurrences[-1][1]:
+                        continue
+                    occurrences.append((start, end, replacement))
+
+                is_changed = False
+                for start, end, replacement in reversed(occurrences):
+                    words = replacement.split(' ')
+                    if tokens[start:end] != words:
+                        tokens[start:end] = words
+                        is_changed = True
+
+                if is_changed:
+                    matches = self._matches(tokens)
+            level -= 1
+
+        return ' '.join(tokens)
+
+    def swap(self, normalized):
+        normalized = self.swap_by_regexp(normalized)
+        return self.swap_by_automaton(normalized)
+
+    def process(self):
+        counter = 0
+        start = time.time()
+
+        normalized = self.input
+        last_normalized = self.input
+
+        while counter < self.iterations:
+            normalized = self.swap(normalized).strip()
+
+            # check if the synonym swapping algorithm modified the string
+            if normalized == last_normalized:
+                # no changes were made
+                break
+
+            last_normalized = normalized
+            counter += 1
+
+        end = int(time.time() - start)
+        if end > self._slow_log_threshold:
+            self.logger.warning('\n'.join([
+                f"Slow Swapping: {end}s, "
+                f"input={len(self.input)}, "
+                f"output={len(normalized)}"]))
+
+        if self.final_logger and self.input != normalized:
+            self.logger.debug(f"Synonym Swapping Complete (time={end}s)")
+
+        return normalized
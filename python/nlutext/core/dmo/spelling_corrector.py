@@ -3,9 +3,7 @@
 
 
 from base import BaseObject
-from datadict import FindEntity
-from datadict import FindStopword
-from datadict import FindSynonym
+from nlutext.core.dmo.symmetric_delete_index import SymmetricDeleteIndex
 
 ACRONYM_THRESHOLD: int = 6
 
@@ -16,6 +14,7 @@ class SpellingCorrector(BaseObject):
     def __init__(self,
                  some_tokens,
                  ontology_name: str = 'base',
+                 max_distance: int = 1,
                  is_debug: bool = False):
         """
         Created:
@@ -71,7 +70,13 @@ class SpellingCorrector(BaseObject):
             craig.trim@ibm.com
             *   removed find-acronym service; the underlying data file was empty
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1580
+        Updated:
+            18-Oct-2026
+            *   use a precomputed symmetric-delete index rather than probing every Norvig variation
+                candidates are ranked by edit distance and then by frequency
         :param some_tokens:
+        :param max_distance:
+            the maximum edit distance of a correction (1 or 2)
         """
         BaseObject.__init__(self, __name__)
 
@@ -80,25 +85,11 @@ class SpellingCorrector(BaseObject):
         self._ontology_name = ontology_name
 
         self._alphabet = self.get_alphabet()
-        self._entity_finder = FindEntity(is_debug=is_debug,
-                                         ontology_name=ontology_name)
-        self._syn_finder = FindSynonym(is_debug=is_debug,
-                                       ontology_name=ontology_name)
-
-    def edits(self, word):
-        """
-        Reference:
-            Peter Norvig style spell checker
-            <http://stackoverflow.com/questions/3449968/large-scale-spell-checking-in-python>
-        :param word:
-        :return:
-        """
-        s = [(word[:i], word[i:]) for i in range(len(word) + 1)]
-        deletes = [a + b[1:] for a, b in s if b]
-        transposes = [a + b[1] + b[0] + b[2:] for a, b in s if len(b) > 1]
-        replaces = [a + c + b[1:] for a, b in s for c in self._alphabet if b]
-        inserts = [a + c + b for a, b in s for c in self._alphabet]
-        return list(set(deletes + transposes + replaces + inserts))
+        self._max_distance = max_distance
+        self._index = SymmetricDeleteIndex(is_debug=is_debug,
+                                           max_distance=max_distance,
+                                           alphabet=self._alphabet,
+                                           ontology_name=ontology_name)
 
     def get_correct_spelling(self, token):
         """
@@ -106,17 +97,15 @@ class SpellingCorrector(BaseObject):
             computationally efficient spell correction
 
             Rules:
-                1.  If a token does not exist in either Entities or Synonyms
-                2.  Generate Norvig Variations
-                3.  Return the first variation that exists in either Entities or Synonyms
+                1.  If a token does not exist in either Entities, Synonyms or Stopwords
+                2.  Look up the known tokens within the maximum edit distance
+                3.  Return the closest (and then most frequent) known token
         :param token:
         :return:
             correctly spelled token
             or the original token
         """
-        edits = self.edits(token)
-
-        corrected = self.get_known_entity(token, edits)
+        corrected = self._index.correct(token, self._max_distance)
         if corrected:
             return corrected
 
@@ -124,30 +113,7 @@ class SpellingCorrector(BaseObject):
 
     def is_known_entity(self,
                         token: str):
-        is_synonym = self._syn_finder.exists(token)
-        if is_synonym:
-            return True
-
-        is_entity = self._entity_finder.exists(token)
-        if is_entity:
-            return True
-
-        is_stopword = FindStopword(token).exists()
-        if is_stopword:
-            return True
-
-        return False
-
-    def get_known_entity(self,
-                         token,
-                         candidates):
-        for token in candidates:
-            if (self._syn_finder.exists(token) or
-                    self._entity_finder.exists(token) or
-                    FindStopword(token).exists()):
-                return token
-
-        return None
+        return self._index.exists(token)
 
     @staticmethod
     def has_digit(some_input):
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import string
+import time
+from collections import Counter
+
+from base import BaseObject
+from datadict import OntologyRegistry
+
+
+class SymmetricDeleteIndex(BaseObject):
+    """ Symmetric-Delete Spelling Index
+
+        Every known unigram (entity, synonym and stopword) is indexed under each string
+        that can be formed by deleting up to 'max-distance' characters;
+        a misspelling is corrected by generating its own deletes and looking them up
+
+        candidates are verified with the edits of the Norvig style checker:
+        a character can be deleted or transposed, but only inserted or replaced by a letter of the alphabet
+
+        Reference:
+            Wolf Garbe, "1000x Faster Spelling Correction algorithm"
+            <https://wolfgarbe.medium.com/1000x-faster-spelling-correction-algorithm-2012-8701fcd87a5f> """
+
+    _d_index = {}
+
+    def __init__(self,
+                 ontology_name: str = 'base',
+                 max_distance: int = 2,
+                 alphabet: list = None,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   replace the per-token Norvig variation probing in 'spelling-corrector'
+        :param ontology_name:
+            the ontology to build the vocabulary from (built once per ontology and distance)
+        :param max_distance:
+            the maximum edit distance supported by the index (1 or 2)
+        :param alphabet:
+            the characters a correction can insert or replace (defaults to 'a' - 'z')
+        """
+        BaseObject.__init__(self, __name__)
+        if max_distance not in [1, 2]:
+            raise NotImplementedError(f"Unsupported Edit Distance: "
+                                      f"{max_distance}")
+
+        self._is_debug = is_debug
+        self._max_distance = max_distance
+        self._ontology_name = ontology_name
+        self._alphabet = set(alphabet or string.ascii_lowercase)
+
+        key = (self._ontology_name, self._max_distance)
+        if key not in self._d_index:
+            self._d_index[key] = self._build()
+
+    def _vocabulary(self) -> Counter:
+        """
+        :return:
+            every known unigram with its frequency
+            a unigram is known if the lookups of the synonym, entity and stopword finders accept it:
+                an entity label in any case,
+                a synonym head form, an entity pattern or a stopword in lower case only
+                (these lookups lower-case the input, but not the dictionary keys)
+            frequency is the number of dictionary entries (including synonym variations) it occurs in
+        """
+        from datadict import the_stopwords_dict
+
+        registry = OntologyRegistry(is_debug=self._is_debug,
+                                    ontology_name=self._ontology_name)
+        entity_finder = registry.entity()
+        syn_finder = registry.synonyms()
+
+        known = [x for x in syn_finder.dict().keys() if x == x.lower()]
+        known += [x.lower() for x in entity_finder.all_labels()]
+        known += [x for x in entity_finder.all_patterns() if x == x.lower()]
+        known += [x for x in the_stopwords_dict if x == x.lower()]
+
+        entries = list(syn_finder.dict().keys())
+        entries += entity_finder.all_labels()
+        entries += entity_finder.all_patterns()
+        entries += list(the_stopwords_dict)
+        for values in syn_finder.dict().values():
+            entries += values
+
+        c_entries = Counter()
+        for entry in entries:
+            entry = entry.lower().strip()
+            c_entries.update(set(entry.replace('_', ' ').split()).union({entry}))
+
+        c_vocab = Counter()
+        for entry in known:
+            entry = entry.strip()
+            if entry and ' ' not in entry:
+                c_vocab[entry] = max(c_entries[entry], 1)
+
+        return c_vocab
+
+    def _deletes(self,
+                 word: str) -> set:
+        deletes = {word}
+        edges = {word}
+        for _ in range(self._max_distance):
+            edges = {x[:i] + x[i + 1:]
+                     for x in edges
+                     for i in range(len(x))}
+            deletes = deletes.union(edges)
+        return deletes
+
+    def _build(self) -> dict:
+        start = time.time()
+
+        c_vocab = self._vocabulary()
+
+        d_index = {}
+        for word in c_vocab:
+            for delete in self._deletes(word):
+                if delete not in d_index:
+                    d_index[delete] = []
+                d_index[delete].append(word)
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Symmetric Delete Index Built",
+                f"\tOntology Name: {self._ontology_name}",
+                f"\tMax Distance: {self._max_distance}",
+                f"\tTotal Words: {len(c_vocab)}",
+                f"\tTotal Deletes: {len(d_index)}",
+                f"\tTime: {round(time.time() - start, 2)}s"]))
+
+        return {
+            "vocab": c_vocab,
+            "index": d_index}
+
+    @staticmethod
+    def distance(a: str,
+                 b: str,
+                 alphabet: set = None) -> int or float:
+        """
+        Purpose:
+            Optimal String Alignment distance from 'a' to 'b'
+            (Levenshtein distance plus adjacent transpositions;
+            the same edits as the Norvig style checker)
+        :param alphabet:
+            (Optional) the characters an edit can insert or replace
+            an alignment that inserts or replaces any other character is not allowed
+        :return:
+            the distance
+            inf if 'b' cannot be reached with the alphabet
+        """
+
+        def _cost(c: str) -> int or float:
+            if alphabet is None or c in alphabet:
+                return 1
+            return float('inf')
+
+        prev_prev = None
+        prev = [0] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            prev[j] = prev[j - 1] + _cost(b[j - 1])
+        for i in range(1, len(a) + 1):
+            curr = [i] + [0] * len(b)
+            for j in range(1, len(b) + 1):
+                cost = 0 if a[i - 1] == b[j - 1] else _cost(b[j - 1])
+                curr[j] = min(prev[j] + 1,
+                              curr[j - 1] + _cost(b[j - 1]),
+                              prev[j - 1] + cost)
+                if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                    curr[j] = min(curr[j], prev_prev[j - 2] + 1)
+            prev_prev, prev = prev, curr
+        return prev[len(b)]
+
+    def exists(self,
+               word: str) -> bool:
+        """
+        Purpose:
+            True if the synonym, entity or stopword finder knows the word
+            the input is lower-cased (as these finders do) but the dictionary keys are not
+        """
+        return word.lower().strip() in self._d_index[(self._ontology_name, self._max_distance)]["vocab"]
+
+    def candidates(self,
+                   word: str,
+                   max_distance: int = None) -> list:
+        """
+        :param word:
+            a (misspelled) unigram
+        :param max_distance:
+            the maximum edit distance (defaults to the distance of the index)
+        :return:
+            a list of (candidate, distance, frequency) tuples
+            ranked by distance (ascending) and then frequency (descending)
+        """
+        if max_distance is None or max_distance > self._max_distance:
+            max_distance = self._max_distance
+
+        d_index = self._d_index[(self._ontology_name, self._max_distance)]
+        c_vocab = d_index["vocab"]
+
+        word = word.lower()
+
+        results = {}
+        for delete in self._deletes(word):
+            if delete not in d_index["index"]:
+                continue
+            for candidate in d_index["index"][delete]:
+                if candidate in results:
+                    continue
+                if abs(len(candidate) - len(word)) > max_distance:
+                    continue
+                distance = self.distance(word, candidate, self._alphabet)
+                if distance <= max_distance:
+                    results[candidate] = distance
+
+        return sorted([(k, v, c_vocab[k]) for k, v in results.items()],
+                      key=lambda x: (x[1], -x[2], x[0]))
+
+    def correct(self,
+                word: str,
+                max_distance: int = None) -> str or None:
+        """
+        :return:
+            the best ranked correction (excluding the word itself) or None
+        """
+        for candidate, distance, _ in self.candidates(word, max_distance):
+            if distance > 0:
+                return candidate
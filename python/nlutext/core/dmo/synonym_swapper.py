@@ -7,7 +7,7 @@ import time
 
 from base import BaseObject
 from base import MandatoryParamError
-from datadict import FindSynonym
+from datadict import OntologyRegistry
 
 REPORT_TO_CONSOLE = hasattr(sys.modules['__main__'], '__file__') and \
                     'parse_single_record' in sys.modules['__main__'].__file__
@@ -145,8 +145,8 @@ class SynonymSwapper(BaseObject):
         self.iterations = some_iterations
         self._slow_log_threshold = slow_log_threshold
 
-        self._synonyms_finder = FindSynonym(is_debug=is_debug,
-                                            ontology_name=ontology_name)
+        self._synonyms_finder = OntologyRegistry(is_debug=is_debug,
+                                                 ontology_name=ontology_name).synonyms()
 
     @report_changes
     def swap_by_regexp(self,
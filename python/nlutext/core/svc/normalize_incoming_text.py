@@ -5,12 +5,19 @@
 import pprint
 
 from base import BaseObject
+from base import MemoCache
+from base import RedisClient
 
 
 class NormalizeIncomingText(BaseObject):
 
+    _d_caches = {}
+
     def __init__(self,
                  ontology_name: str = 'base',
+                 synonym_engine: str = 'default',
+                 cache_size: int = 50000,
+                 use_redis_cache: bool = False,
                  is_debug: bool = False):
         """
         Updated:
@@ -63,11 +70,59 @@ class NormalizeIncomingText(BaseObject):
             craig.trim@ibm.com
             *   load dictionaries by ontology name
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1582
+        Updated:
+            18-Oct-2026
+            *   add 'synonym-engine' param
+            *   memoize normalization results in a bounded LRU cache
+        :param synonym_engine:
+            'default'       swap synonyms with the 'synonym-swapper'
+            'automaton'     swap synonyms with the 'automaton-synonym-swapper'
+                            swaps happen in the same order, but on whole words only;
+                            the output differs where the 'synonym-swapper' rewrites inside words
+                            or skips a repeated synonym (see 'automaton-synonym-swapper')
+        :param cache_size:
+            the maximum number of normalized strings held in memory
+            0       do not cache
+        :param use_redis_cache:
+            if True     back the cache with Redis so it is shared across workers
+                        entries expire, and are keyed by the ontology build version
         """
         BaseObject.__init__(self, __name__)
+        if synonym_engine not in ['default', 'automaton']:
+            raise NotImplementedError(f"Unrecognized Synonym Engine: "
+                                      f"{synonym_engine}")
 
         self._is_debug = is_debug
         self._ontology_name = ontology_name
+        self._synonym_engine = synonym_engine
+        self._cache = self._get_cache(cache_size, use_redis_cache)
+
+    def _get_cache(self,
+                   cache_size: int,
+                   use_redis_cache: bool) -> MemoCache or None:
+        from datadict.core.dmo import DictionaryLoader
+
+        if not cache_size:
+            return None
+
+        # a regenerated ontology has a new version (and so a new cache)
+        version = DictionaryLoader(ontology_name=self._ontology_name).version()
+
+        key = (self._ontology_name, version, cache_size, use_redis_cache)
+        if key not in self._d_caches:
+            redis_db = RedisClient.NLU_CACHE_DB if use_redis_cache else None
+            self._d_caches[key] = MemoCache(name="normalize-incoming-text",
+                                            max_size=cache_size,
+                                            redis_db=redis_db,
+                                            namespace=f"{self._ontology_name}_{version}",
+                                            is_debug=self._is_debug)
+
+        return self._d_caches[key]
+
+    def cache_stats(self) -> dict:
+        if not self._cache:
+            return {}
+        return self._cache.stats()
 
     @staticmethod
     def remove_spaces(normalized: str) -> str:
@@ -87,6 +142,7 @@ class NormalizeIncomingText(BaseObject):
     def _normalize(self,
                    value: str) -> dict:
         from nlutext.core.dmo import ApostropheExpansion
+        from nlutext.core.dmo import AutomatonSynonymSwapper
         from nlutext.core.dmo import EnclicticExpansion
         from nlutext.core.dmo import PunctuationRemover
         from nlutext.core.dmo import SynonymSwapper
@@ -114,10 +170,14 @@ class NormalizeIncomingText(BaseObject):
                                             is_debug=self._is_debug).process()
 
         if self._is_valid(normalized):
-            normalized = SynonymSwapper(some_iterations=3,
-                                        some_input=normalized,
-                                        ontology_name=self._ontology_name,  # GIT-1582-16611092
-                                        is_debug=self._is_debug).process()
+            swapper = SynonymSwapper
+            if self._synonym_engine == 'automaton':
+                swapper = AutomatonSynonymSwapper
+
+            normalized = swapper(some_iterations=3,
+                                 some_input=normalized,
+                                 ontology_name=self._ontology_name,  # GIT-1582-16611092
+                                 is_debug=self._is_debug).process()
             normalized = self.remove_spaces(normalized)
 
         # commented out in # GIT-1419-16190214
@@ -138,6 +198,16 @@ class NormalizeIncomingText(BaseObject):
     def process(self,
                 value: str) -> dict:
 
-        result = self._normalize(value)
+        if not self._cache:
+            return self._normalize(value)
+
+        key = (self._ontology_name, self._synonym_engine, value)
 
-        return result
+        normalized = self._cache.get(key)
+        if normalized is None:
+            normalized = self._normalize(value)["normalized"]
+            self._cache.put(key, normalized)
+
+        return {
+            "original": value,
+            "normalized": normalized}
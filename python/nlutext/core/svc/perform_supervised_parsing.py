@@ -56,6 +56,9 @@ class PerformSupervisedParsing(BaseObject):
             craig.trim@ibm.com
             *   pass in ontology name as a param
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/pull/1587
+        Updated:
+            18-Oct-2026
+            *   add 'docs' and 'process_doc' to support batched tokenization via 'nlp.pipe'
         """
         BaseObject.__init__(self, __name__)
         self._is_debug = is_debug
@@ -64,14 +67,43 @@ class PerformSupervisedParsing(BaseObject):
         if self._is_debug:
             self.logger.debug("Instantiate PerformSupervisedParsing")
 
+    def docs(self,
+             normalized_texts: list,
+             batch_size: int = 1000):
+        """
+        Purpose:
+            Tokenize many normalized strings in batches
+        :param normalized_texts:
+            a list of normalized strings
+        :param batch_size:
+            the number of strings spaCy buffers per batch
+        :return:
+            a generator of spaCy docs (in input order)
+        """
+        return self.__nlp.pipe(normalized_texts,
+                               batch_size=batch_size)
+
     def process(self,
                 original_ups: str,
                 normalized_ups: str) -> list:
-        from nlutext.core.svc import PerformDeepTokenization
 
         # tokenize the UPS
         doc = self.__nlp(normalized_ups)
 
+        return self.process_doc(doc=doc,
+                                original_ups=original_ups,
+                                normalized_ups=normalized_ups)
+
+    def process_doc(self,
+                    doc,
+                    original_ups: str,
+                    normalized_ups: str) -> list:
+        """
+        :param doc:
+            the spaCy doc of the normalized UPS (e.g., from 'docs')
+        """
+        from nlutext.core.svc import PerformDeepTokenization
+
         # perform deeper tokenization (includes spell correction)
         deep_tok = PerformDeepTokenization(doc=doc,
                                            is_debug=self._is_debug,
@@ -4,7 +4,6 @@
 
 from base import BaseObject
 from base import LabelFormatter
-from datadict import the_synonyms_dict
 
 
 class EntityTemplateGenerator(BaseObject):
@@ -32,9 +31,15 @@ class EntityTemplateGenerator(BaseObject):
         Created:
             21-Mar-2019
             craig.trim@ibm.com
+        Updated:
+            18-Oct-2026
+            *   load synonyms through 'dictionary-loader' on instantiation
+                rather than import the generated module with this one
         """
         BaseObject.__init__(self, __name__)
-        self.synonyms = the_synonyms_dict
+        from datadict.core.dmo import DictionaryLoader
+
+        self.synonyms = DictionaryLoader(ontology_name='base').synonyms().fwd()
         self.label_formatter = LabelFormatter()
 
     @staticmethod
@@ -6,7 +6,6 @@ import glob
 import os
 import platform
 import random
-import time
 
 import rq
 
@@ -15,6 +14,7 @@ from base import FileIO
 from base import RedisClient
 
 from .batch_reporter import BatchReporter
+from .batch_stage_tracker import BatchStageTracker
 
 from .batch_task_factories import IngestsTasks, \
                                   PreAssembleTasks, \
@@ -34,84 +34,95 @@ MAX_ATTEMPTS = 5
 # JOB_TIMEOUT_IN_MINUTES = int(os.environ['RQ_TIMEOUT_MINUTES_JOB'])
 
 
-def requeue_failed_jobs(watchdog_job, reset_failure_count):
-    result = 'nothing failed'
-    for failed_id in watchdog_job.failed_job_registry.get_job_ids():
-        failed = rq.job.Job.fetch(failed_id, connection=watchdog_job.connection)
-        if failed_id.startswith('close_stage_'):
-            watchdog_job.failed_job_registry.remove(failed)
-            continue
-        failed.meta.setdefault('failures', 0)
-        if reset_failure_count:
-            failed.meta['failures'] = 0
-        else:
-            failed.meta['failures'] += 1
-        if failed.meta['failures'] >= MAX_ATTEMPTS:
-            print(f'Giving up on job {failed.id}')
-            BatchReporter().post(f'Batch process cancelled after {MAX_ATTEMPTS} failures in job {failed.id}')
-            return 'give_up'
-        else:
-            print(f'Requeuing failed job {failed.id}. Has already run {failed.meta["failures"]} times')
-            failed.requeue()
-            result = 'requeued'
+def activity_key(manifest_name, activity_name):
+    return f'{manifest_name}__{activity_name}'
+
+
+def run_stage_task(queue_name, run_id, manifest_name, activity_name, task_function, task_params):
+    """ Run a task of a stage and count it as done
+
+        the job that finishes the last task of an activity hands the activity to a pipelined
+        downstream stage; the job that finishes the last task of the stage closes the stage """
+    job = rq.get_current_job()
+    result = task_function(*task_params)
+
+    tracker = BatchStageTracker(queue_name, run_id, job.connection if job else None)
+    activity_complete, stage_complete = tracker.job_done(activity_key(manifest_name, activity_name),
+                                                         job.id if job else None)
+    advance_stage(tracker, manifest_name, activity_name, activity_complete, stage_complete)
     return result
 
 
-def enqueue_close_stage(queue_name, connection, depends_on, notification_msg, reset_failure_count=False):
-    id = f'close_stage__{queue_name}__{platform.uname().node}__{os.getpid()}__{BatchStage.redis_friendly_timestamp()}'
-    job = rq.job.Job.create(close_stage,
-                            id=id,
-                            depends_on=depends_on,
-                            args=(notification_msg, reset_failure_count),
-                            timeout='72h',
-                            result_ttl=86400,       # result expires after 1 day
-                            connection=connection)
-    print(f'{job.id}')
-    queue = rq.Queue(queue_name, connection=connection)
-    queue.enqueue_job(job)
+def requeue_failed_job(job, exc_type, exc_value, traceback):
+    """ Worker exception handler: requeue a failed job until it has failed MAX_ATTEMPTS times
 
+        the failure count is kept in the job meta so that 'restart_failed_stage' can reset it """
+    job.meta.setdefault('failures', 0)
+    job.meta['failures'] += 1
+    job.save_meta()
+    if job.meta['failures'] >= MAX_ATTEMPTS:
+        print(f'Giving up on job {job.id}')
+        BatchReporter().post(f'Batch process cancelled after {MAX_ATTEMPTS} failures in job {job.id}')
+    else:
+        print(f'Requeuing failed job {job.id}. Has already run {job.meta["failures"]} times')
+        job.requeue()
+    return True
 
-def close_stage(notification_msg, reset_failure_count=False):
-    job = rq.get_current_job()
-    queue_name = job.origin
-    registry = rq.registry.StartedJobRegistry(name=queue_name)
-
-    while True:
-        failed_jobs_status = requeue_failed_jobs(job, reset_failure_count)
-        if failed_jobs_status == 'give_up':
-            break
-        elif failed_jobs_status == 'requeued':
-            print('requeueing close_stage so that the requeued failed jobs can access this node')
-            enqueue_close_stage(queue_name, job.connection, job.dependency, notification_msg)
-            break
-
-        if registry.count == 1:
-            if job.failed_job_registry.count == 0:
-                print(f'Done with queue {queue_name}')
-                if notification_msg:
-                    BatchReporter().post(notification_msg)
-
-                stop_after = os.environ.get('RQ_STOP_AFTER')
-                if stop_after and stop_after.lower() == queue_name:
-                    print(f'Stopping because RQ_STOP_AFTER == {queue_name}')
-                    next_stage = None
-                else:
-                    next_stage = BatchStage.next(queue_name)
-
-                if not next_stage:
-                    print('No more stages!')
-                    BatchReporter().post("No additional work scheduled")
-                else:
-                    print('Scheduling next stage')
-                    next_stage.process()
-                break
-
-        sleep = 30
-        print(f'Not done ({queue_name}). queue: {registry.count} failed: '
-              f'{job.failed_job_registry.count}. Waiting for {sleep} seconds...')
-        time.sleep(sleep)
-
-    print(f'leaving close_stage with failed_jobs_status={failed_jobs_status} ')
+
+def advance_stage(tracker, manifest_name, activity_name, activity_complete, stage_complete):
+    """ Close the stage and hand the activity over to a pipelined downstream stage
+
+        a flag is cleared again if its action fails, so that the retry of the job takes it """
+    def _once(flag, action):
+        if tracker.first(flag):
+            try:
+                action()
+            except Exception:
+                tracker.clear(flag)
+                raise
+
+    def _handoff():
+        next_run_id = tracker.next_run_id()
+        if next_run_id:
+            print(f'Handing {activity_name} over to the stage after {tracker.queue_name}')
+            BatchStage.next(tracker.queue_name).process(run_id=next_run_id,
+                                                        manifest_specs=[(manifest_name, activity_name)])
+
+    if stage_complete:
+        _once('closed', lambda: close_stage(tracker))
+
+    if activity_complete:
+        _once(f'handoff:{activity_key(manifest_name, activity_name)}', _handoff)
+
+
+def stops_after(queue_name):
+    stop_after = os.environ.get('RQ_STOP_AFTER')
+    return stop_after and stop_after.lower() == queue_name
+
+
+def close_stage(tracker):
+    queue_name = tracker.queue_name
+    print(f'Done with queue {queue_name}')
+    message = tracker.message()
+    if message:
+        BatchReporter().post(message)
+
+    if tracker.next_run_id():
+        # the next stage is pipelined with this one and was scheduled activity by activity
+        return
+
+    if stops_after(queue_name):
+        print(f'Stopping because RQ_STOP_AFTER == {queue_name}')
+        next_stage = None
+    else:
+        next_stage = BatchStage.next(queue_name)
+
+    if not next_stage:
+        print('No more stages!')
+        BatchReporter().post("No additional work scheduled")
+    else:
+        print('Scheduling next stage')
+        next_stage.process()
 
 
 def randomize_to_try_to_distribute_the_load(a_list):
@@ -128,6 +139,13 @@ class BatchStage(BaseObject):
         # It could be tempting to move this to a yaml file, but doing so
         # would hide some errors until runtime; no errors can be surfaced
         # at edit time by a Python linter.
+
+        # Consecutive stages that share a 'manifest_glob' are pipelined:
+        # the downstream stage starts on an activity as soon as the upstream
+        # stage is done with that activity. Use 'pipeline': False to wait
+        # for the whole upstream stage instead. Stages are only pipelined
+        # when they resolve to the same (manifest, activity) pairs
+        # (e.g., 'exclude_manifests' must match).
         {
             'name': 'ingest',
             'exclude_manifests': ['ingest-manifest-budapest.yml'],
@@ -257,18 +275,19 @@ class BatchStage(BaseObject):
     @classmethod
     def restart_failed_stage(cls):
         redis = RedisClient(decode_responses=False).redis
+        restarted = False
         for queue_name in cls.stages():
             queue = rq.Queue(queue_name, connection=redis)
-            registry = queue.failed_job_registry
-            if registry.count:
-                enqueue_close_stage(queue_name,
-                                    redis,
-                                    None,
-                                    f'{queue_name} stage completed after being re-started',
-                                    True)
+            failed_ids = queue.failed_job_registry.get_job_ids()
+            for failed_id in failed_ids:
+                failed = rq.job.Job.fetch(failed_id, connection=redis)
+                failed.meta['failures'] = 0
+                failed.save_meta()
+                failed.requeue()
+            if failed_ids:
                 BatchReporter().post(f'Re-starting failed tasks of stage {queue_name}')
-                break
-        else:
+                restarted = True
+        if not restarted:
             print('Nothing to re-start')
 
     @staticmethod
@@ -303,23 +322,68 @@ class BatchStage(BaseObject):
         if message:
             BatchReporter().post(message)
 
-    def process(self):
-        self._report_scheduling()
+    def _all_manifest_specs(self):
+        return self.spec.get('specs', self._get_manifest_specs())
+
+    def _pipelined_stage(self, all_manifest_specs):
+        next_stage = BatchStage.next(self.queue_name)
+        if not next_stage or not all_manifest_specs or stops_after(self.queue_name):
+            return None
+        for spec in [self.spec, next_stage.spec]:
+            if not spec.get('pipeline', True) or spec.get('serial', False) or 'specs' in spec:
+                return None
+        manifest_glob = self.spec.get('manifest_glob')
+        if not manifest_glob or manifest_glob != next_stage.spec.get('manifest_glob'):
+            return None
+        # every activity handed over must be an activity of the downstream stage (and vice versa)
+        if sorted(all_manifest_specs) != sorted(next_stage._all_manifest_specs()):
+            return None
+        return next_stage
+
+    def _open(self, all_manifest_specs):
+        run_id = self.redis_friendly_timestamp()
+        next_run_id = None
+        next_stage = self._pipelined_stage(all_manifest_specs)
+        if next_stage:
+            next_run_id = next_stage._open(next_stage._all_manifest_specs())
+            print(f'Pipelining *{next_stage.queue_name}* with *{self.queue_name}*')
+        BatchStageTracker(self.queue_name, run_id, self.redis).open(len(all_manifest_specs), next_run_id)
+        return run_id
+
+    def process(self, run_id=None, manifest_specs=None):
+        """
+        :param run_id:
+            None        schedule every activity of a new run of the stage
+            otherwise   the run of the stage (opened by a pipelined upstream stage)
+        :param manifest_specs:
+            the (manifest, activity) pairs to schedule (defaults to every pair)
+        """
+        all_manifest_specs = self._all_manifest_specs()
+        if not run_id:
+            run_id = self._open(all_manifest_specs)
+        if manifest_specs is None:
+            manifest_specs = all_manifest_specs
+
+        tracker = BatchStageTracker(self.queue_name, run_id, self.redis)
+        if tracker.first('opened'):
+            self._report_scheduling()
+
         serial = self.spec.get('serial', False)
         timeout = self.spec.get('timeout', int(os.environ["RQ_TIMEOUT_MINUTES_JOB"]))
         queue = rq.Queue(self.queue_name, connection=self.redis)
         depends_on = None
         to_enqueue = []
-        manifest_specs = self.spec.get('specs', self._get_manifest_specs())
         for manifest_name, activity_name in manifest_specs:
             tasks = self.factory.create_tasks(manifest_name, activity_name)
+            tracker.reserve(activity_key(manifest_name, activity_name), len(tasks))
             for task_name, task_function, task_params in tasks:
                 if task_name:
                     task_name = f'{task_name}__'
                 id = f'{task_name}{manifest_name}__{activity_name}' \
                      f'__{platform.uname().node}__{os.getpid()}__{self.redis_friendly_timestamp()}'
-                job = rq.job.Job.create(task_function,
-                                        args=task_params,
+                job = rq.job.Job.create(run_stage_task,
+                                        args=(self.queue_name, run_id, manifest_name, activity_name,
+                                              task_function, task_params),
                                         id=id,
                                         depends_on=depends_on,
                                         timeout=f'{timeout}m',
@@ -334,4 +398,12 @@ class BatchStage(BaseObject):
         for job in to_enqueue:
             print(f'{job.id}')
             queue.enqueue_job(job)
-        enqueue_close_stage(self.queue_name, self.redis, depends_on, self.factory.closing_message())
+
+        # a pipelined stage is scheduled activity by activity; the last message wins
+        tracker.set_message(self.factory.closing_message())
+
+        if not all_manifest_specs:
+            advance_stage(tracker, None, None, False, True)
+        for manifest_name, activity_name in manifest_specs:
+            activity_complete, stage_complete = tracker.scheduled(activity_key(manifest_name, activity_name))
+            advance_stage(tracker, manifest_name, activity_name, activity_complete, stage_complete)
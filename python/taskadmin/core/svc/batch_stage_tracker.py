@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from base import BaseObject
+from base import RedisClient
+
+KEY_TTL_IN_SECONDS = 7 * 24 * 60 * 60
+
+
+class BatchStageTracker(BaseObject):
+    """ Track the completion of a Batch Stage with Redis counters
+
+        every stage run has a Redis hash with
+            activities          the number of (manifest, activity) pairs not yet scheduled
+            jobs                the number of scheduled jobs not yet finished
+            jobs:<activity>     the number of scheduled jobs of an activity not yet finished
+            scheduled:<activity>    1 once every job of the activity is enqueued
+            done:<job id>       1 once the job is counted as finished
+            flag:<flag>         1 once a one-time action (e.g., closing the stage) is taken
+
+        counters are updated in MULTI/EXEC transactions so that exactly one caller
+        observes the completion of an activity (or of the stage)
+
+        a job is counted once, even when it is retried after it was counted
+        (e.g., because the hand-off to the next stage failed) """
+
+    def __init__(self,
+                 queue_name: str,
+                 run_id: str,
+                 redis=None):
+        """
+        Created:
+            18-Oct-2026
+            *   replace the polling barrier in 'close-stage'
+        :param queue_name:
+            the name of the stage (and its queue)
+        :param run_id:
+            identifies one run of the stage
+        """
+        BaseObject.__init__(self, self.__class__.__name__)
+        self.queue_name = queue_name
+        self.run_id = run_id
+        self.redis = redis or RedisClient(decode_responses=False).redis
+        self.key = f'batch_stage:{queue_name}:{run_id}'
+
+    @staticmethod
+    def _int(value) -> int:
+        return int(value) if value is not None else 0
+
+    def open(self,
+             total_activities: int,
+             next_run_id: str = None) -> None:
+        """
+        :param total_activities:
+            the number of (manifest, activity) pairs the stage will schedule
+        :param next_run_id:
+            the run id of the downstream stage if it is pipelined with this stage
+        """
+        mapping = {'activities': total_activities, 'jobs': 0}
+        if next_run_id:
+            mapping['next_run_id'] = next_run_id
+        with self.redis.pipeline() as pipe:
+            pipe.hmset(self.key, mapping)
+            pipe.expire(self.key, KEY_TTL_IN_SECONDS)
+            pipe.execute()
+
+    def is_open(self) -> bool:
+        return bool(self.redis.exists(self.key))
+
+    def next_run_id(self) -> str or None:
+        value = self.redis.hget(self.key, 'next_run_id')
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value
+
+    def set_message(self,
+                    message: str) -> None:
+        self.redis.hset(self.key, 'message', message or '')
+
+    def message(self) -> str:
+        value = self.redis.hget(self.key, 'message')
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value or ''
+
+    def first(self,
+              flag: str) -> bool:
+        """
+        :return:
+            True for the first caller only (e.g., to post a message exactly once)
+        """
+        return bool(self.redis.hsetnx(self.key, f'flag:{flag}', 1))
+
+    def clear(self,
+              flag: str) -> None:
+        """
+        Purpose:
+            Undo 'first' (e.g., when the one-time action failed and must be retried)
+        """
+        self.redis.hdel(self.key, f'flag:{flag}')
+
+    def reserve(self,
+                activity: str,
+                total_jobs: int) -> None:
+        """
+        Purpose:
+            Count the jobs of an activity before they are enqueued
+            (a fast job must not drive the counters to zero early)
+        """
+        if not total_jobs:
+            return
+        with self.redis.pipeline() as pipe:
+            pipe.hincrby(self.key, 'jobs', total_jobs)
+            pipe.hincrby(self.key, f'jobs:{activity}', total_jobs)
+            pipe.execute()
+
+    def scheduled(self,
+                  activity: str) -> tuple:
+        """
+        Purpose:
+            Mark every job of an activity as enqueued
+        :return:
+            (activity-complete, stage-complete)
+        """
+        with self.redis.pipeline() as pipe:
+            if self.redis.hsetnx(self.key, f'scheduled:{activity}', 1):
+                pipe.hincrby(self.key, 'activities', -1)
+            else:
+                pipe.hget(self.key, 'activities')
+            pipe.hget(self.key, 'jobs')
+            pipe.hget(self.key, f'jobs:{activity}')
+            activities, jobs, activity_jobs = pipe.execute()
+
+        return (self._int(activity_jobs) == 0,
+                self._int(activities) == 0 and self._int(jobs) == 0)
+
+    def job_done(self,
+                 activity: str,
+                 job_id: str = None) -> tuple:
+        """
+        Purpose:
+            Count a finished job
+        :param job_id:
+            (Optional) the id of the job; a job id is counted once only
+        :return:
+            (activity-complete, stage-complete)
+        """
+        with self.redis.pipeline() as pipe:
+            if not job_id or self.redis.hsetnx(self.key, f'done:{job_id}', 1):
+                pipe.hincrby(self.key, 'jobs', -1)
+                pipe.hincrby(self.key, f'jobs:{activity}', -1)
+            else:
+                pipe.hget(self.key, 'jobs')
+                pipe.hget(self.key, f'jobs:{activity}')
+            pipe.hget(self.key, 'activities')
+            pipe.hget(self.key, f'scheduled:{activity}')
+            jobs, activity_jobs, activities, scheduled = pipe.execute()
+
+        is_scheduled = scheduled is not None
+        return (is_scheduled and self._int(activity_jobs) == 0,
+                self._int(activities) == 0 and self._int(jobs) == 0)
+
+    def status(self) -> dict:
+        return {k.decode() if isinstance(k, bytes) else k: v
+                for k, v in self.redis.hgetall(self.key).items()}
@@ -35,6 +35,28 @@ class StageTasks(abc.ABC):
             first += chunk_size
         return chunks
 
+    @staticmethod
+    def partitioned_tasks(prefix, function, params, task_specs):
+        """
+        :param task_specs:
+            a list of (collection-name, [(lower, upper), ...]) '_id' ranges
+        :return:
+            one task per '_id' range
+            the range bounds take the place of the (first, last) offsets in the task params
+        """
+        tasks = []
+        for collection, partitions in task_specs:
+            if not partitions:
+                print(f'Skipping empty collection {collection}')
+                continue
+            for ordinal, (lower, upper) in enumerate(partitions):
+                tasks.append(
+                             (f'{prefix}_{collection}_part-{ordinal}',
+                              function,
+                              params(collection) + (lower, upper, True))
+                            )
+        return tasks
+
     @staticmethod
     def is_activity_under_focus(manifest_activity):
         if 'RQ_FOCUS_ONLY_ON' in os.environ and \
@@ -69,7 +91,9 @@ class IngestsTasks(StageTasks):
 class AssembleApiTasks(StageTasks):
     def __init__(self):
         from dataingest import call_assemble_api
+        from dataingest import partition_assemble_sources
         self.function = call_assemble_api
+        self.partitioner = partition_assemble_sources
         self.activity_names = set()
 
 
@@ -84,19 +108,12 @@ class PreAssembleTasks(AssembleApiTasks):
 
 class AssembleTasks(AssembleApiTasks):
     def create_tasks(self, manifest_name, manifest_activity):
-        tasks = []
-        task_specs = self.function(manifest_name, manifest_activity, 'get_sources', '', '', '')
-        for collection, count in task_specs:
-            if not count:
-                print(f'Skipping empty collection {collection}')
-                continue
-            for first, last in self.chunks(count, int(os.environ['RQ_CHUNK_SIZE_ASSEMBLE'])):
-                tasks.append(
-                             (f'assemble_{collection}_{first}-{last}',
-                              self.function,
-                              (manifest_name, manifest_activity, 'assemble', collection, first, last))
-                            )
-        return tasks
+        task_specs = self.partitioner(manifest_name, manifest_activity,
+                                      int(os.environ['RQ_CHUNK_SIZE_ASSEMBLE']))
+        return self.partitioned_tasks('assemble',
+                                      self.function,
+                                      lambda collection: (manifest_name, manifest_activity, 'assemble', collection),
+                                      task_specs)
 
 
 class PostAssembleTasks(AssembleApiTasks):
@@ -115,7 +132,9 @@ class PostAssembleTasks(AssembleApiTasks):
 class BadgeAnalysisApiTasks(StageTasks):
     def __init__(self):
         from cendalytics.badges.bp import call_badge_analysis_api
+        from cendalytics.badges.bp import partition_badge_analysis_sources
         self.function = call_badge_analysis_api
+        self.partitioner = partition_badge_analysis_sources
 
 
 class PreBadgeAnalysisTasks(BadgeAnalysisApiTasks):
@@ -129,19 +148,12 @@ class PreBadgeAnalysisTasks(BadgeAnalysisApiTasks):
 
 class BadgeTaggingTasks(BadgeAnalysisApiTasks):
     def create_tasks(self, manifest_name, manifest_activity):
-        tasks = []
-        task_specs = self.function(manifest_name, manifest_activity, 'get_sources', '', '')
-        for collection, count in task_specs:
-            if not count:
-                print(f'Skipping empty collection {collection}')
-                continue
-            for first, last in self.chunks(count, int(os.environ['RQ_CHUNK_SIZE_BADGE'])):
-                tasks.append(
-                             (f'badge_tagging_{collection}_{first}-{last}',
-                              self.function,
-                              (manifest_name, manifest_activity, 'analyze_per_badge', first, last))
-                            )
-        return tasks
+        task_specs = self.partitioner(manifest_name, manifest_activity,
+                                      int(os.environ['RQ_CHUNK_SIZE_BADGE']))
+        return self.partitioned_tasks('badge_tagging',
+                                      self.function,
+                                      lambda _: (manifest_name, manifest_activity, 'analyze_per_badge'),
+                                      task_specs)
 
 
 class BadgeDistributionTasks(BadgeAnalysisApiTasks):
@@ -8,6 +8,7 @@ import rq
 
 from base import RedisClient
 from taskadmin import BatchStage, BatchWorkerEnvironmentVars, BatchWorkerQueues
+from taskadmin.core.svc.batch_stage import requeue_failed_job
 
 
 def worker(processes: int):
@@ -21,7 +22,8 @@ def worker(processes: int):
     name = f'{platform.uname().node}__{main_pid}__{processes}__{BatchStage.redis_friendly_timestamp()}'
     redis_connection = RedisClient(decode_responses=False).redis
     with rq.Connection(connection=redis_connection):
-        w = rq.Worker(BatchWorkerQueues(redis_connection).stages_to_work_on(), name=name)
+        w = rq.Worker(BatchWorkerQueues(redis_connection).stages_to_work_on(), name=name,
+                      exception_handlers=[requeue_failed_job])
         try:
             w.work()
         finally:
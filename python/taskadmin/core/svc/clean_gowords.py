@@ -6,7 +6,6 @@ import codecs
 import os
 
 from base import BaseObject
-from datadict import the_parents_dict
 
 
 class CleanGoWords(BaseObject):
@@ -17,10 +16,17 @@ class CleanGoWords(BaseObject):
         Updated:
             2-Apr-2019
             craig.trim@ibm.com
+        Updated:
+            18-Oct-2026
+            *   load parents through 'dictionary-loader' on instantiation
+                rather than import the generated module with this one
         """
         BaseObject.__init__(self, __name__)
-        self.labels = [x for x in the_parents_dict
-                       if "DomainTerm" not in the_parents_dict[x]]
+        from datadict.core.dmo import DictionaryLoader
+
+        d_parents = DictionaryLoader(ontology_name='base').taxonomy().parents()
+        self.labels = [x for x in d_parents
+                       if "DomainTerm" not in d_parents[x]]
 
     @staticmethod
     def _lines() -> list:
@@ -31,6 +31,9 @@ class MdaOrchestrator(BaseObject):
             craig.trim@ibm.com
             *   add ontology-name as a param
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1583
+        Updated:
+            18-Oct-2026
+            *   add 'snapshot' action
         """
         BaseObject.__init__(self, __name__)
         self._is_debug = is_debug
@@ -48,6 +51,7 @@ class MdaOrchestrator(BaseObject):
         from taskmda import GenerateCertificationsHierarchy
         from taskmda import GenerateDimDictionaries
         from taskmda import GenerateOntologyDictionaries
+        from taskmda import GenerateOntologySnapshot
 
         start = time.time()
 
@@ -97,6 +101,12 @@ class MdaOrchestrator(BaseObject):
         elif action.startswith("wiki"):
             GenerateReferences(is_debug=self._is_debug).process()
 
+        elif action.startswith("snap"):
+            GenerateOntologySnapshot(ontology_name='biotech',
+                                     is_debug=self._is_debug).process()
+            GenerateOntologySnapshot(ontology_name='base',
+                                     is_debug=self._is_debug).process()
+
         print(f"Task Completion Time: "
               f"{round((time.time() - start) / 60, 2)}m")
 
@@ -9,6 +9,7 @@ from .generate_mapping_table import GenerateMappingTable
 from .generate_metrics import GenerateMetrics
 from .generate_modified_entities import GenerateModifiedEntities
 from .generate_ontology_dictionaries import GenerateOntologyDictionaries
+from .generate_ontology_snapshot import GenerateOntologySnapshot
 from .generate_parents import GenerateParents
 from .generate_patterns import GeneratePatterns
 from .generate_references import GenerateReferences
@@ -23,6 +23,9 @@ class GenerateOntologyDictionaries(BaseObject):
             craig.trim@ibm.com
             *   ensure synonym generation uses see-also dictionary
                 https://github.ibm.com/GTS-CDO/unstructured-analytics/issues/1734
+        Updated:
+            18-Oct-2026
+            *   compile the generated dictionaries into a binary snapshot
         :param ontology_name:
             the name of the Ontology (e.g., 'base' or 'biotech')
         :param syns_only:
@@ -107,6 +110,11 @@ class GenerateOntologyDictionaries(BaseObject):
         Purpose
             Generate Dictionaries from an Ontology
         """
+        from taskmda import GenerateOntologySnapshot
+
         d_patterns = self._generate_syn_dictionaries()
         if not self._syns_only:
             self._generate_dictionaries(d_patterns)
+
+        GenerateOntologySnapshot(is_debug=self._is_debug,
+                                 ontology_name=self._ontology_name).process()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+from base import BaseObject
+
+
+class GenerateOntologySnapshot(BaseObject):
+    """ Compile the generated dictionaries for an Ontology into a binary snapshot """
+
+    def __init__(self,
+                 ontology_name: str,
+                 is_debug: bool = False):
+        """
+        Created:
+            18-Oct-2026
+            *   the snapshot is memory-mapped by 'dictionary-loader'
+                in place of importing the generated dictionary modules
+        :param ontology_name:
+            the name of the Ontology (e.g., 'base' or 'biotech')
+        """
+        BaseObject.__init__(self, __name__)
+        self._is_debug = is_debug
+        self._ontology_name = ontology_name
+
+    def process(self) -> str:
+        from datadict.core.dmo import OntologySnapshot
+
+        path = OntologySnapshot(is_debug=self._is_debug,
+                                ontology_name=self._ontology_name).build()
+
+        if self._is_debug:
+            self.logger.debug('\n'.join([
+                "Generated Ontology Snapshot",
+                f"\tOntology Name: {self._ontology_name}",
+                f"\tPath: {path}"]))
+
+        return path
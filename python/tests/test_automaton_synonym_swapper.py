@@ -0,0 +1,156 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import random
+
+import pytest
+
+from datadict import OntologyRegistry
+from nlutext import AutomatonSynonymSwapper
+from nlutext import NormalizeIncomingText
+from nlutext import SynonymSwapper
+
+ONTOLOGY_NAME = 'biotech'
+
+
+def synonyms_finder():
+    return OntologyRegistry(ontology_name=ONTOLOGY_NAME).synonyms()
+
+
+def substring_swap(normalized: str,
+                   candidate: str,
+                   replacement: str) -> str:
+    """ a single swap of 'SynonymSwapper.swap_by_level' """
+    if candidate not in normalized:
+        return normalized
+    if normalized == candidate:
+        return replacement
+    if f" {candidate} " in normalized:
+        return normalized.replace(f" {candidate} ", f" {replacement} ")
+    if normalized.startswith(f"{candidate} "):
+        return normalized.replace(f"{candidate} ", f"{replacement} ")
+    if normalized.endswith(f" {candidate}"):
+        return normalized.replace(f" {candidate}", f" {replacement}")
+    return normalized
+
+
+def whole_word_swap(normalized: str,
+                    candidate: str,
+                    replacement: str) -> str:
+    """ swap every (non-overlapping) whole-word occurrence of the candidate """
+    tokens = normalized.split(' ')
+    words = candidate.split(' ')
+    results = []
+    i = 0
+    while i < len(tokens):
+        if tokens[i:i + len(words)] == words:
+            results.append(replacement)
+            i += len(words)
+        else:
+            results.append(tokens[i])
+            i += 1
+    return ' '.join(results)
+
+
+def reference_swap(input_text: str) -> tuple:
+    """
+    :return:
+        the output of 'SynonymSwapper' with whole-word swaps
+        and True if a substring swap would have differed at any step
+        (i.e., the differences documented in 'AutomatonSynonymSwapper')
+    """
+    finder = synonyms_finder()
+    swapper = SynonymSwapper(some_input=input_text, ontology_name=ONTOLOGY_NAME)
+
+    is_documented = False
+    normalized = input_text
+    for _ in range(swapper.iterations):
+        last_normalized = normalized
+        normalized = swapper.swap_by_regexp(normalized)
+        level = finder.max_ngram()
+        while level > 0:
+            for replacement in finder.keys_in_swap_level(level):
+                for candidate in finder.synonyms_in_swap_level(replacement, level):
+                    swapped = whole_word_swap(normalized, candidate, replacement)
+                    if swapped != substring_swap(normalized, candidate, replacement):
+                        is_documented = True
+                    normalized = swapped
+            level -= 1
+        normalized = normalized.strip()
+        if normalized == last_normalized:
+            break
+
+    return normalized, is_documented
+
+
+def swapper_test_cases(total: int = 500) -> list:
+    """ inputs built from the synonyms (and canonical forms) of the ontology """
+    d_synonyms = synonyms_finder().dict()
+    keys = sorted(d_synonyms.keys())
+    synonyms = sorted({x for key in keys for x in d_synonyms[key] if '[' not in x and x.strip()})
+    if not synonyms:
+        return []
+
+    fillers = ['the', 'with', 'and', 'experience', 'server', 'team']
+
+    rnd = random.Random(7)
+    test_cases = rnd.sample(synonyms, min(total // 2, len(synonyms)))
+    while len(test_cases) < total:
+        parts = rnd.sample(synonyms, 3) + rnd.sample(keys, 1) + rnd.sample(fillers, 2)
+        rnd.shuffle(parts)
+        test_cases.append(' '.join(parts))
+    return test_cases
+
+
+def substring_pairs() -> list:
+    """ (canonical form, synonym) pairs of single (alphabetic) words """
+    finder = synonyms_finder()
+    return [(key, synonym)
+            for key in finder.keys_in_swap_level(1)
+            for synonym in finder.synonyms_in_swap_level(key, 1)
+            if key.isalpha() and synonym.isalpha() and key != synonym][:5]
+
+
+def test_automaton_matches_default_swapper():
+    total_documented = 0
+    test_cases = swapper_test_cases()
+    for input_text in test_cases:
+        expected = SynonymSwapper(some_input=input_text, ontology_name=ONTOLOGY_NAME).process()
+        actual = AutomatonSynonymSwapper(some_input=input_text, ontology_name=ONTOLOGY_NAME).process()
+        reference, is_documented = reference_swap(input_text)
+
+        assert actual == reference, input_text
+        if is_documented:
+            total_documented += 1
+        else:
+            assert actual == expected, input_text
+
+    assert total_documented < len(test_cases) / 10
+
+
+@pytest.mark.parametrize("key, synonym", substring_pairs())
+def test_automaton_swaps_whole_words(key, synonym):
+    input_text = f"{synonym} x{synonym} end"
+
+    expected = SynonymSwapper(some_input=input_text, ontology_name=ONTOLOGY_NAME).process()
+    actual = AutomatonSynonymSwapper(some_input=input_text, ontology_name=ONTOLOGY_NAME).process()
+
+    assert f"x{synonym} end" in actual
+    assert f"x{synonym} end" not in expected
+
+
+def test_normalize_with_automaton():
+    for input_text in swapper_test_cases(100):
+        if reference_swap(input_text)[1]:
+            continue
+        expected = NormalizeIncomingText(ontology_name=ONTOLOGY_NAME,
+                                         cache_size=0).process(input_text)
+        actual = NormalizeIncomingText(ontology_name=ONTOLOGY_NAME,
+                                       synonym_engine='automaton',
+                                       cache_size=0).process(input_text)
+        assert actual == expected, input_text
+
+
+def test_unknown_engine():
+    with pytest.raises(NotImplementedError):
+        NormalizeIncomingText(synonym_engine='unknown')
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from unittest import mock
+
+import pytest
+
+from taskadmin.core.svc import batch_stage
+from taskadmin.core.svc.batch_stage_tracker import BatchStageTracker
+
+fakeredis = pytest.importorskip('fakeredis')
+
+
+@pytest.fixture
+def tracker():
+    tracker = BatchStageTracker('a_stage', 'a_run', fakeredis.FakeStrictRedis())
+    tracker.open(2, next_run_id='next_run')
+    return tracker
+
+
+def test_open(tracker):
+    assert tracker.is_open()
+    assert tracker.next_run_id() == 'next_run'
+
+
+def test_counters(tracker):
+    tracker.reserve('m__a1', 2)
+    tracker.reserve('m__a2', 1)
+    assert tracker.scheduled('m__a1') == (False, False)
+    assert tracker.job_done('m__a1', 'j1') == (False, False)
+    assert tracker.job_done('m__a2', 'j3') == (False, False)
+    assert tracker.job_done('m__a1', 'j2') == (True, False)
+    assert tracker.scheduled('m__a2') == (True, True)
+
+
+def test_job_done_is_counted_once(tracker):
+    tracker.reserve('m__a1', 2)
+    tracker.reserve('m__a2', 0)
+    tracker.scheduled('m__a1')
+    tracker.scheduled('m__a2')
+    assert tracker.job_done('m__a1', 'j1') == (False, False)
+    assert tracker.job_done('m__a1', 'j1') == (False, False)
+    assert tracker.job_done('m__a1', 'j2') == (True, True)
+    # a retried job observes the completion again (the flags keep the actions one-time)
+    assert tracker.job_done('m__a1', 'j2') == (True, True)
+
+
+def test_scheduled_is_counted_once(tracker):
+    tracker.scheduled('m__a1')
+    tracker.scheduled('m__a1')
+    assert tracker.status()['activities'] == b'1'
+
+
+def test_handoff_is_retried_after_a_failure(tracker):
+    next_stage = mock.Mock()
+    next_stage.process.side_effect = [RuntimeError('scheduling failed'), None]
+    with mock.patch.object(batch_stage.BatchStage, 'next', return_value=next_stage):
+        with pytest.raises(RuntimeError):
+            batch_stage.advance_stage(tracker, 'm', 'a1', True, False)
+        batch_stage.advance_stage(tracker, 'm', 'a1', True, False)
+        batch_stage.advance_stage(tracker, 'm', 'a1', True, False)
+
+    assert next_stage.process.call_args_list == [
+        mock.call(run_id='next_run', manifest_specs=[('m', 'a1')])] * 2
+
+
+def test_close_is_retried_after_a_failure(tracker):
+    with mock.patch.object(batch_stage, 'close_stage', side_effect=[RuntimeError('post failed'), None]) as close:
+        with pytest.raises(RuntimeError):
+            batch_stage.advance_stage(tracker, 'm', 'a1', False, True)
+        batch_stage.advance_stage(tracker, 'm', 'a1', False, True)
+        batch_stage.advance_stage(tracker, 'm', 'a1', False, True)
+
+    assert close.call_count == 2
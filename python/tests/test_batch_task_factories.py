@@ -13,3 +13,20 @@ from taskadmin.core.svc.batch_task_factories import StageTasks
 ])
 def test_chunks(count, chunk_size, expected):
     assert StageTasks.chunks(count, chunk_size) == expected
+
+
+def test_partitioned_tasks():
+    def a_func(*args):
+        return args
+
+    task_specs = [('empty', []),
+                  ('supply_badges', [(None, 'k2'), ('k2', None)])]
+    tasks = StageTasks.partitioned_tasks('badge_tagging',
+                                         a_func,
+                                         lambda _: ('manifest', 'activity', 'analyze_per_badge'),
+                                         task_specs)
+    assert tasks == [
+        ('badge_tagging_supply_badges_part-0', a_func,
+         ('manifest', 'activity', 'analyze_per_badge', None, 'k2', True)),
+        ('badge_tagging_supply_badges_part-1', a_func,
+         ('manifest', 'activity', 'analyze_per_badge', 'k2', None, True))]
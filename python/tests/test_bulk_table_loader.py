@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import text
+
+from dataingest.push.dmo import BoundedPipeline
+from dataingest.push.dmo import BulkTableLoader
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE TAGS("
+                                "CONFIDENCE DECIMAL(14,5), "
+                                "FIELDID VARCHAR(500), "
+                                "KEYFIELD VARCHAR(500), "
+                                "TAG VARCHAR(500))"))
+        yield connection
+
+
+def _rows(connection) -> list:
+    return connection.execute(text("SELECT * FROM TAGS ORDER BY FIELDID")).fetchall()
+
+
+def test_bulk_load(connection):
+    df = pd.DataFrame({"CONFIDENCE": [90.0, None, 75.5],
+                       "FIELDID": ["f-0", "f-1", "f-2"],
+                       "KEYFIELD": ["k-0", "k-0", None],
+                       "TAG": ["java", "python", "db2"]})
+
+    with BulkTableLoader(connection, "TAGS", batch_size=2, commit_size=2) as loader:
+        assert loader.write(df) == 3
+        assert loader.write(df.iloc[0:0]) == 0
+
+    assert loader.total_rows == 3
+    assert loader.total_commits == 2
+    assert _rows(connection) == [(90.0, "f-0", "k-0", "java"),
+                                 (None, "f-1", "k-0", "python"),
+                                 (75.5, "f-2", None, "db2")]
+
+
+def test_bulk_load_rollback(connection):
+    df = pd.DataFrame({"FIELDID": ["f-0", "f-1"], "TAG": ["java", "python"]})
+
+    with pytest.raises(ValueError):
+        with BulkTableLoader(connection, "TAGS", commit_size=10) as loader:
+            loader.write(df)
+            raise ValueError
+
+    assert _rows(connection) == []
+
+
+def test_pipeline():
+    pipeline = BoundedPipeline(source=range(100),
+                               transform=lambda x: x * 2,
+                               queue_size=2)
+    assert list(pipeline) == [x * 2 for x in range(100)]
+
+
+def test_pipeline_failure():
+    def transform(x: int) -> int:
+        if x == 5:
+            raise KeyError(x)
+        return x
+
+    with pytest.raises(KeyError):
+        list(BoundedPipeline(source=range(100),
+                             transform=transform,
+                             queue_size=2))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import unittest
+from unittest import mock
+
+from pandas.testing import assert_frame_equal
+
+from cendantdim.batch.svc import ComputeBatchDimensions
+from cendantdim.batch.svc import ProcessSingleRecord
+
+IS_DEBUG = False
+
+
+def _field(name: str,
+           value: str,
+           collection: str,
+           tags: list) -> dict:
+    return {"name": name,
+            "value": [value],
+            "collection": {"type": collection},
+            "tags": {"supervised": tags, "unsupervised": []}}
+
+
+RECORDS = [
+    {"key_field": "K001",
+     "fields": [
+         _field("badge_name", "Certified AWS Architect", "ingest_badges",
+                [("AWS", 95.0), ("Cloud computing", 85.5)]),
+         _field("skill", "Linux admin", "ingest_cv_skills_profile",
+                [("Linux", 100), ("Mainframe", 70.0)])]},
+    {"key_field": "K002",
+     "fields": [
+         _field("job_title", "Data Scientist Level 3", "ingest_cv_career_history",
+                [("Data Science", 95.0), ("Machine Learning", 85.5), ("Python", 70.0)]),
+         _field("skill", "Java developer", "ingest_cv_skills_profile",
+                [("Java", 100), ("Database", 85.5)])]},
+    {"key_field": "K003",
+     "fields": [
+         _field("skill", "project management", "ingest_cv_skills_profile",
+                [])]}]
+
+
+class TestComputeBatchDimensions(unittest.TestCase):
+
+    def test_matches_single_record(self):
+        """ the batch path computes the same dimensions as the per-record path """
+        single_record = ProcessSingleRecord(d_manifest=None,
+                                            xdm_schema='supply',
+                                            collection_name_tag='supply_tag_20191025',
+                                            collection_name_xdm='supply_xdm_20191025',
+                                            mongo_client=mock.MagicMock(),
+                                            is_debug=IS_DEBUG)
+
+        expected = {}
+        for record in RECORDS:
+            df_zscores, _ = single_record.compute(record)
+            if df_zscores is not None:
+                expected[record['key_field']] = df_zscores
+
+        actual = ComputeBatchDimensions(xdm_schema='supply',
+                                        is_debug=IS_DEBUG).process(RECORDS)
+
+        self.assertTrue(len(expected))
+        self.assertEqual(sorted(expected), sorted(actual))
+        for key_field in expected:
+            assert_frame_equal(expected[key_field].reset_index(drop=True),
+                               actual[key_field].reset_index(drop=True),
+                               check_dtype=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
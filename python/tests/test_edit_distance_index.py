@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import pytest
+
+from nlusvc.nltk.dmo import EditDistanceIndex
+from nlusvc.nltk.svc import FindEditDistance
+
+CANDIDATES = ['Conosa', 'Corallochytrea', 'Corbihelia', 'Crenarchaeota',
+              'Crista', 'Cristae', 'Cristidiscoidea', 'Cryptista', 'Cryptophyta',
+              'Ctenophora', 'Cutaneous amoebiasis', 'Cutosa', 'Cutosea', 'Cyanobacteria',
+              'Data Science', 'Database', 'Databases', 'Data Scientist', 'Docker', 'Db2']
+
+INPUTS = ['cristae', 'Crista ', 'cutose', 'cyanobacterium', 'datbase', 'data sciences', 'xyz', 'db']
+
+
+@pytest.fixture(scope='module')
+def index():
+    return EditDistanceIndex(candidate_matches=CANDIDATES)
+
+
+def _expected(input_text: str) -> list:
+    """ every (candidate, distance) from 'find-edit-distance.multiple' in (distance, candidate) order """
+    df = FindEditDistance().multiple(input_text=input_text,
+                                     candidate_matches=CANDIDATES)
+    df = df.rename_axis('Ordinal').sort_values(by=['Distance', 'Ordinal'])
+    return list(zip(df.Candidate, df.Distance))
+
+
+def _actual(matches: list) -> list:
+    return [(x["Candidate"], x["Distance"]) for x in matches]
+
+
+@pytest.mark.parametrize('input_text', INPUTS)
+@pytest.mark.parametrize('max_distance', [0, 1, 2, 3, 5, 10])
+def test_max_distance(index, input_text, max_distance):
+    expected = [x for x in _expected(input_text) if x[1] <= max_distance]
+    assert _actual(index.search(input_text, max_distance=max_distance)) == expected
+
+
+@pytest.mark.parametrize('input_text', INPUTS)
+@pytest.mark.parametrize('top_k', [1, 2, 3, 5, len(CANDIDATES)])
+def test_top_k(index, input_text, top_k):
+    expected = _expected(input_text)[:top_k]
+    assert _actual(index.search(input_text, top_k=top_k)) == expected
+
+
+@pytest.mark.parametrize('input_text', INPUTS)
+def test_top_k_within_max_distance(index, input_text):
+    expected = [x for x in _expected(input_text) if x[1] <= 3][:2]
+    assert _actual(index.search(input_text, top_k=2, max_distance=3)) == expected
+
+
+def test_nearest():
+    df = FindEditDistance().nearest(input_texts=INPUTS,
+                                    candidate_matches=CANDIDATES,
+                                    max_distance=2)
+
+    expected = [(input_text.lower().strip(), candidate, distance)
+                for input_text in INPUTS
+                for candidate, distance in _expected(input_text) if distance <= 2]
+    assert list(zip(df.Input, df.Candidate, df.Distance)) == expected
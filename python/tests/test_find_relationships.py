@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import pytest
+
+from datadict import FindRelationships
+
+ONTOLOGY_NAME = 'biotech'
+
+
+@pytest.fixture(scope='module')
+def finder():
+    return FindRelationships(ontology_name=ONTOLOGY_NAME)
+
+
+def test_rel_types_are_functions(finder):
+    for rel_type in FindRelationships.REL_TYPES:
+        assert callable(getattr(finder, rel_type))
+
+
+def test_lookup_many(finder):
+    tags = ['enzyme', 'transaminase', 'enzyme']
+    rel_types = ['parents', 'children', 'similar_to']
+
+    d_results = finder.lookup_many(tags=tags, rel_types=rel_types)
+
+    assert list(d_results) == ['enzyme', 'transaminase']
+    for tag in d_results:
+        for rel_type in rel_types:
+            assert d_results[tag][rel_type] == getattr(finder, rel_type)(tag)
+
+
+@pytest.mark.parametrize('rel_type', ['d_parents', 'entity_finder', 'lookup_many',
+                                      'has_parent', '_cleanse', 'unknown'])
+def test_lookup_many_unsupported(finder, rel_type):
+    with pytest.raises(NotImplementedError):
+        finder.lookup_many(tags=['enzyme'], rel_types=[rel_type])
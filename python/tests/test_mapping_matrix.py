@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import random
+
+import pytest
+
+from nluflows.mapping.dmo import MappingMatrix
+from nluflows.mapping.svc import AnalyzeMappingFromTags
+from nluflows.mapping.svc import ComputeConfidenceLevels
+from nluflows.mapping.svc import analyze_mapping_from_tags
+
+VOCAB = [f"tag{i}" for i in range(12)] + ["password", "reset", "vdi"]
+
+
+def _mapping(seed: int) -> tuple:
+    """ a random mapping table and its reverse map """
+    rnd = random.Random(seed)
+
+    d_fwd_map = {}
+    for i in range(25):
+        d_fwd_map[f"FLOW_{i}"] = {
+            "include_one_of": rnd.sample(VOCAB, rnd.choice([0, 0, 1, 2, 3])),
+            "include_all_of": rnd.sample(VOCAB, rnd.choice([0, 1, 2, 3])),
+            "exclude_one_of": rnd.sample(VOCAB, rnd.choice([0, 0, 1])),
+            "exclude_all_of": [],
+            "exclusive": rnd.random() < 0.3,
+            "deduction": rnd.choice([None, 0, 10, 150, -5])}
+
+    d_rev_map = {}
+    for flow, entry in d_fwd_map.items():
+        for tag in set(entry["include_one_of"] + entry["include_all_of"]):
+            d_rev_map.setdefault(tag, []).append(flow)
+
+    return d_fwd_map, d_rev_map
+
+
+def _expected(tags: set) -> dict:
+    """ the per-message result of svc:AnalyzeMappingFromTags and svc:ComputeConfidenceLevels """
+    analyses = AnalyzeMappingFromTags(list(tags)).analysis()
+    if not analyses:
+        return {}
+    return {x["process"]: (x["direct-match"], float(x["confidence"]))
+            for x in ComputeConfidenceLevels(list(tags), analyses).analysis()}
+
+
+def _actual(results: list) -> dict:
+    return {x["process"]: (x["direct-match"], x["confidence"]) for x in results}
+
+
+@pytest.fixture(params=[1, 2, 3])
+def mapping(request, monkeypatch):
+    d_fwd_map, d_rev_map = _mapping(request.param)
+    monkeypatch.setattr(analyze_mapping_from_tags, 'the_mapping_table_dict', d_fwd_map)
+    monkeypatch.setattr(analyze_mapping_from_tags, 'the_mapping_rev_dict', d_rev_map)
+    return MappingMatrix(some_mapping=d_fwd_map,
+                         some_rev_mapping=d_rev_map)
+
+
+def test_matches_per_message_analysis(mapping):
+    rnd = random.Random(7)
+    tag_sets = [set(rnd.sample(VOCAB + ["unmapped"], rnd.randint(1, 5)))
+                for _ in range(200)]
+
+    results = mapping.process(tag_sets)
+
+    assert len(results) == len(tag_sets)
+    for tags, result in zip(tag_sets, results):
+        assert _actual(result) == _expected(tags)
+
+
+def test_batch_without_candidates(mapping):
+    assert mapping.process([{"unmapped"}]) == [[]]
+    assert mapping.process([set(), {"unmapped"}]) == [[], []]
+    assert mapping.process([]) == []
+
+
+def test_batch_with_some_candidates(mapping):
+    results = mapping.process([{"unmapped"}, set(VOCAB), set()])
+
+    assert results[0] == [] and results[2] == []
+    assert _actual(results[1]) == _expected(set(VOCAB))
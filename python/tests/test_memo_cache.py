@@ -0,0 +1,56 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import pytest
+
+from base import MemoCache
+
+
+def test_memo_cache_hits_and_misses():
+    cache = MemoCache(name="test", max_size=10)
+    assert cache.get(("base", "java developer")) is None
+
+    cache.put(("base", "java developer"), "java_developer")
+    assert cache.get(("base", "java developer")) == "java_developer"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_memo_cache_evicts_least_recently_used():
+    cache = MemoCache(name="test", max_size=2)
+    cache.put(("base", "a"), "a")
+    cache.put(("base", "b"), "b")
+    cache.get(("base", "a"))
+    cache.put(("base", "c"), "c")
+
+    assert cache.get(("base", "b")) is None
+    assert cache.get(("base", "a")) == "a"
+    assert cache.get(("base", "c")) == "c"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memo_cache_invalid_size():
+    with pytest.raises(ValueError):
+        MemoCache(name="test", max_size=0)
+
+
+def test_memo_cache_redis_entries_expire_within_a_namespace(monkeypatch):
+    fakeredis = pytest.importorskip('fakeredis')
+    from base.core.dmo import redis_client
+
+    server = fakeredis.FakeStrictRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client.redis, 'from_url', lambda url, **options: server)
+
+    cache = MemoCache(name="test", redis_db=6, namespace="base_v1", ttl=60)
+    cache.put(("base", "java developer"), "java_developer")
+
+    [key] = server.keys()
+    assert key.startswith("test_base_v1_")
+    assert 0 < server.ttl(key) <= 60
+
+    # a new ontology version does not see the entries of the prior version
+    assert MemoCache(name="test", redis_db=6, namespace="base_v2").get(("base", "java developer")) is None
+    assert MemoCache(name="test", redis_db=6, namespace="base_v1").get(("base", "java developer")) == "java_developer"
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import os
+
+import pytest
+
+from datadict.core.dmo import ontology_snapshot
+from datadict.core.dmo.ontology_snapshot import OntologySnapshot
+from datadict.core.dmo.ontology_snapshot import SOURCES
+
+
+def _source(name: str,
+            total: int):
+    """ a generated dictionary of 'total' entries in the form of the named module """
+    if name == 'labels':
+        return [f"Label {i}" for i in range(total)]
+    if name == 'reverse_synonyms':
+        return {f"synonym {i}": f"label_{i}" for i in range(total)}
+    if name == 'references':
+        return {f"Label {i}": {f"Label {j}": {'f': j, 'z': j / 10}
+                               for j in range(i % 3)}
+                for i in range(total)}
+    return {f"Label {i}": [f"{name} {i} {j}" for j in range(i % 4)]
+            for i in range(total)}
+
+
+def _write_ontology(os_path: str,
+                    ontology_name: str,
+                    total: int) -> dict:
+    d_sources = {}
+    for name, (file_name, dict_name) in SOURCES.items():
+        path = os.path.normpath(os.path.join(os_path, ontology_name, file_name))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        d_sources[name] = _source(name, total)
+        with open(path, 'w') as handle:
+            handle.write(f"{dict_name} = {d_sources[name]!r}\n")
+    return d_sources
+
+
+@pytest.mark.parametrize('total', [0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144])
+def test_build_and_load(tmp_path, monkeypatch, total):
+    """ every section of a built snapshot reads back as its source dictionary """
+    os_path = str(tmp_path / 'os')
+    monkeypatch.setattr(ontology_snapshot, 'OS_PATH', os_path)
+    monkeypatch.setattr(OntologySnapshot, '_d_snapshots', {})
+    monkeypatch.delenv('ONTOLOGY_SNAPSHOT_PATH', raising=False)
+
+    d_sources = _write_ontology(os_path, 'synthetic', total)
+    OntologySnapshot('synthetic').build()
+
+    snapshot = OntologySnapshot.instance('synthetic')
+    assert snapshot is not None
+
+    for name, source in d_sources.items():
+        section = snapshot.section(name)
+        if isinstance(source, list):
+            assert list(section) == source
+        else:
+            assert {k: section[k] for k in section} == source
+
+
+def test_digest_changes_with_the_ontology(tmp_path, monkeypatch):
+    os_path = str(tmp_path / 'os')
+    monkeypatch.setattr(ontology_snapshot, 'OS_PATH', os_path)
+    monkeypatch.setattr(OntologySnapshot, '_d_digests', {})
+
+    _write_ontology(os_path, 'synthetic', 5)
+    digest = OntologySnapshot('synthetic').digest()
+    assert OntologySnapshot('synthetic').digest() == digest
+
+    _write_ontology(os_path, 'synthetic', 6)
+    assert OntologySnapshot('synthetic').digest() != digest
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import random
+
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from cendalytics.tfidf.core.dmo import DocIndexByTerm
+from cendalytics.tfidf.core.dmo import SparseVectorSpace
+from cendalytics.tfidf.core.dmo import TermCountByDocument
+from cendalytics.tfidf.core.dmo import TermCountInCorpus
+from cendalytics.tfidf.core.dmo import TermIndexByDocument
+from cendalytics.tfidf.core.dmo import TfIdfComputer
+
+TERMS = ['agile', 'ibm', 'design thinking', 'enterprise', 'role', 'cognitive skill', 'mentor', 'python']
+
+
+def _record(key_field: str,
+            *field_tags: list) -> dict:
+    return {"key_field": key_field,
+            "fields": [{"tags": {"supervised": tags}} for tags in field_tags]}
+
+
+RECORDS = [
+    _record("d0", [("agile", 90.0), ("ibm", 99.0)], [("agile", 80.0)]),  # a term counted per field
+    _record("d1", [("design thinking", 90.0), ("enterprise", 66.0), ("role", 65.0)]),  # at the threshold
+    _record("d2", [("ibm", 70.0), ("mentor", 95.0)], []),
+    _record("d3", [("cognitive skill", 10.0)]),  # a document without terms
+    _record("d4", [("ibm", 90.0)]),
+    {"key_field": "d5", "fields": [{"name": "no tags"}, {"tags": {"supervised": None}}]}]
+
+
+def _random_records(total: int) -> list:
+    random.seed(total)
+    return [_record(f"r{i}", *[[(random.choice(TERMS), random.randint(50, 100))
+                                for _ in range(random.randint(0, 5))]
+                               for _ in range(random.randint(1, 3))])
+            for i in range(total)]
+
+
+def _expected(records: list) -> DataFrame:
+    """ the data frame from 'tfidf-computer' """
+    d_terms_by_document = TermIndexByDocument(source_records=records).process()
+    return TfIdfComputer(d_terms_by_document=d_terms_by_document,
+                         d_documents_by_term=DocIndexByTerm(d_terms_by_document).process(),
+                         term_count_by_document=TermCountByDocument(d_terms_by_document).process(),
+                         term_count_in_corpus=TermCountInCorpus(d_terms_by_document).process()).process()
+
+
+def _sorted(df: DataFrame) -> DataFrame:
+    return df.sort_values(by=['Doc', 'Term']).reset_index(drop=True)
+
+
+@pytest.mark.parametrize('records', [RECORDS] + [_random_records(total) for total in [5, 13, 34, 89]])
+def test_to_dataframe(records):
+    expected = _expected(records)
+    actual = SparseVectorSpace.from_records(records).to_dataframe()
+
+    assert len(actual) == len(expected)
+    assert_frame_equal(_sorted(actual), _sorted(expected), check_dtype=False)
+
+
+def test_from_records():
+    vector_space = SparseVectorSpace.from_records(RECORDS)
+
+    assert vector_space.documents() == ['d0', 'd1', 'd2', 'd4']
+    assert vector_space.terms() == ['agile', 'ibm', 'design thinking', 'enterprise', 'mentor']
+    assert vector_space.counts().toarray().tolist() == [[2, 1, 0, 0, 0],
+                                                        [0, 0, 1, 1, 0],
+                                                        [0, 1, 0, 0, 1],
+                                                        [0, 1, 0, 0, 0]]
+
+
+@pytest.mark.parametrize('file_name', ['vectorspace', 'vectorspace.npz'])
+def test_save_and_load(tmp_path, file_name):
+    vector_space = SparseVectorSpace.from_records(RECORDS)
+
+    file_path = vector_space.save(str(tmp_path / file_name))
+    assert file_path == str(tmp_path / 'vectorspace.npz')
+
+    loaded = SparseVectorSpace.load(file_path)
+    assert loaded.documents() == vector_space.documents()
+    assert loaded.terms() == vector_space.terms()
+    assert (loaded.counts() != vector_space.counts()).nnz == 0
+    assert_frame_equal(loaded.to_dataframe(), vector_space.to_dataframe())
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import string
+
+import pytest
+
+from nlutext.core.dmo.symmetric_delete_index import SymmetricDeleteIndex
+
+ALPHABET = set(string.ascii_lowercase)
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ('protien', 'protein', 1),              # transpose
+    ('proteinn', 'protein', 1),             # delete
+    ('protin', 'protein', 1),               # insert
+    ('protain', 'protein', 1),              # replace
+    ('cellcarcinoma', 'cell_carcinoma', 1),
+])
+def test_distance(a, b, expected):
+    assert SymmetricDeleteIndex.distance(a, b) == expected
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ('protin', 'protein', 1),
+    ('cell_carcinoma', 'cellcarcinoma', 1),         # any character can be deleted
+    ('cellcarcinoma', 'cell_carcinoma', float('inf')),  # but only a letter can be inserted
+    ('cell-carcinoma', 'cell_carcinoma', float('inf')),  # or replace another character
+    ('covid', 'covid19', float('inf')),
+])
+def test_distance_within_alphabet(a, b, expected):
+    assert SymmetricDeleteIndex.distance(a, b, ALPHABET) == expected
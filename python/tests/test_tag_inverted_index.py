@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+import pytest
+
+from cendalytics.skills.core.dmo import TagInvertedIndex
+
+
+def _record(_id: str,
+            division: str or None,
+            *field_tags: list) -> dict:
+    record = {"_id": _id,
+              "key_field": _id.upper(),
+              "fields": [{"tags": {"supervised": [(tag, 90.0) for tag in tags]}}
+                         for tags in field_tags]}
+    if division is not None:
+        record["div_field"] = division
+    return record
+
+
+RECORDS = [
+    _record("r0", "gbs", ["Ansible", "Python"], ["python"]),
+    _record("r1", "gts", ["Help Desk "]),
+    _record("r2", "gts", ["ansible"], []),
+    _record("r3", None, ["Ansible"]),
+    _record("r4", "gb", ["Python"]),
+    {"_id": "r5", "div_field": "gbs", "fields": [{"name": "no tags"}, {"tags": {"supervised": None}}]}]
+
+
+@pytest.fixture(scope='module')
+def index():
+    return TagInvertedIndex(records=iter(RECORDS))
+
+
+def test_build(index):
+    assert len(index) == len(RECORDS)
+    assert sorted(index._d_postings) == ['ansible', 'help desk', 'python']
+    assert list(index._d_postings['python']) == [0, 4]  # a record is posted once per tag
+
+
+@pytest.mark.parametrize('tags, divisions, expected', [
+    (['ansible'], None, ['r0', 'r2', 'r3']),
+    (['ANSIBLE', 'python'], [], ['r0', 'r2', 'r3', 'r4']),
+    (['help desk'], None, ['r1']),
+    (['unknown'], None, []),
+    (['ansible'], ['gts'], ['r2']),
+    (['ansible'], ['GBS', 'gts'], ['r0', 'r2']),
+    (['ansible', 'python'], 'gbs', ['r0']),  # not a substring test ('gb' in 'gbs')
+    (['python'], 'gb', ['r4']),
+    (['ansible'], [None, 'gts'], ['r2']),  # records without a division never match
+    (['ansible'], [None], ['r0', 'r2', 'r3'])])
+def test_search(index, tags, divisions, expected):
+    assert index.search(tags=tags, divisions=divisions) == expected